@@ -14,29 +14,97 @@ LIGHT_GRAY = (200, 200, 200)
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 CENTER_POS = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-FPS = 60
+FPS = 60  # 渲染帧率（可在低配机器上调低，不影响游戏难度）
+SIM_TICK_RATE = 60  # 固定模拟频率（每秒步数），敌人/子弹速度按每步像素数标定
+MAX_SIM_SUBSTEPS = 5  # 单个渲染帧最多补跑的模拟步数，超出部分丢弃
+REPLAY_RECORD = False  # 开启后每次进入游戏页以新种子开局并录制逐步输入，按ESC离开时保存
+REPLAY_DIR = "replays"
+# 帧计时：F3 开关叠加层（同时开始/停止计时），F4 导出最近的计时为 Chrome trace JSON，F5 采样接下来几秒的调用栈
+PROFILER_ENABLED = False
+PROFILER_HISTORY_FRAMES = 300  # 统计 p50/p99 和阶段均值的最近帧数
+PROFILER_TRACE_EVENTS = 50000  # 导出 trace 时保留的最近计时事件数
+PROFILE_DIR = "profiles"
+PROFILER_SAMPLE_SECONDS = 5  # F5 采样时长（秒）
+PROFILER_SAMPLE_INTERVAL = 0.005  # 采样间隔（秒）
 MAX_ENEMIES = 8  # 增加最大敌人数量
 MIN_SPAWN_DISTANCE = 500
 MAX_SPAWN_DISTANCE = 1500
 BASE_SPAWN_INTERVAL = 2000
 MIN_SPAWN_INTERVAL = 800
 SPAWN_SPEEDUP_RATE = 50
+SPAWN_WAVES_FILE = None  # 脚本波次JSON文件（如 "data/waves_example.json"），None 时只按难度曲线随机生成
 BULLET_MAX_DISTANCE = 3000
 RELOAD_TIME = 1200  # 换弹时间（毫秒）
 AUTO_SAVE_INTERVAL = 30000  # 自动存档间隔（30秒）
 
-# 敌人配置
-ENEMY_BASE_HEALTH = 8
-ENEMY_ELITE_HEALTH = 15
-ENEMY_BASE_DAMAGE = 20
-ENEMY_ELITE_DAMAGE = 40
-ENEMY_BASE_SPEED = (1.8, 2.8)  # 速度范围
-ENEMY_ELITE_SPEED_MULTIPLIER = 1.4
-ENEMY_ELITE_CHANCE = 0.4  # 精英怪概率
-ENEMY_STRENGTH_INCREMENT = 0.3  # 每阶段强度提升比例
+# 混音器配置（缓冲区越小延迟越低，但过小会导致爆音/断流）
+MIXER_FREQUENCY = 44100
+MIXER_BUFFER = 512
+AUDIO_LATENCY_PROBE = False  # 开启后记录每次播放请求并估算输出延迟，离开游戏页时打印报告
+
+# 音效缓存配置（合成结果以原始PCM文件缓存，下次启动直接内存映射读取）
+SOUND_CACHE_DIR = "cache/sounds"
+SOUND_CACHE_MAX_BYTES = 4 * 1024 * 1024  # 缓存总大小上限，超出按LRU淘汰
+
+# 音频通道调度配置：{类别: (预留通道数, 优先级)}，优先级越高越不容易被抢占
+AUDIO_CHANNEL_CATEGORIES = {
+    "enemy": (8, 3),   # 敌人方位提示（最高优先级）
+    "player": (2, 2),  # 玩家受击、游戏结束
+    "weapon": (4, 1),  # 射击、换弹、切换武器/模式
+    "ui": (1, 1),      # 暂停、恢复
+    "impact": (3, 0)   # 命中、击杀
+}
+# 音效所属类别
+AUDIO_SOUND_CATEGORIES = {
+    "gun_shot": "weapon",
+    "reload": "weapon",
+    "switch_weapon": "weapon",
+    "switch_mode": "weapon",
+    "hit_enemy": "impact",
+    "enemy_death": "impact",
+    "player_hit": "player",
+    "game_over": "player",
+    "pause": "ui",
+    "resume": "ui"
+}
+
+# 敌人持续方位音效：距离中心 NEAR 以内满音量，FAR 处衰减到 MIN_GAIN；PAN_DEPTH 为远侧声道最大衰减比例
+POSITIONAL_NEAR_DISTANCE = 300
+POSITIONAL_FAR_DISTANCE = 2000
+POSITIONAL_MIN_GAIN = 0.15
+POSITIONAL_PAN_DEPTH = 0.8
+
+# 敌人音效混音模式："channels" 每个敌人占一个pygame通道；"software" 软件混音后在单个通道上流式播放
+AUDIO_MIXER_MODE = "channels"
+SOFT_MIXER_BLOCK_SIZE = 1024  # 软件混音每块帧数，越小延迟越低、CPU开销越高
+
+# 敌人配置（GamePage 开局时读取，tools.difficulty_sweep 可批量覆盖后评估难度）
+ENEMY_BASE_HEALTH = 150
+ENEMY_ELITE_HEALTH = 350
+ENEMY_BASE_DAMAGE = 12
+ENEMY_ELITE_DAMAGE = 20
+ENEMY_BASE_SPEED = (1, 1.5)  # 速度范围（60帧/秒下每帧像素数）
+ENEMY_ELITE_SPEED_MULTIPLIER = 1.2
+ENEMY_ELITE_CHANCE = 0.3  # 精英怪概率
+ENEMY_BURST_CHANCE = 0.1  # 一次生成两个敌人的概率
+ENEMY_STRENGTH_INCREMENT = 0.0  # 每阶段血量和伤害提升比例（0为不随时间增强）
 ENEMY_STRENGTH_INTERVAL = 60000  # 强度提升间隔（毫秒）
-ENEMY_CONTACT_RADIUS = 50  # 接触玩家造成伤害的半径
-ENEMY_ATTACK_INTERVAL = 1500  # 持续伤害间隔（毫秒）
+ENEMY_CONTACT_RADIUS = 40  # 接触玩家造成伤害的半径
+ENEMY_ATTACK_INTERVAL = 1500  # 持续伤害间隔（毫秒，暂未使用：敌人接触玩家造成一次伤害后即消失）
+
+# 启动耗时预算：冷启动到登录页首帧（毫秒），test_startup_budget.py 超出时失败
+STARTUP_BUDGET_MS = 1000
+
+# 中文字体：依次尝试程序目录下的字体文件，再按名称查找系统字体（查找结果缓存到 FONT_CACHE_FILE，删除后重新查找）
+FONT_FILES = ["simhei.ttf", "msyh.ttc"]
+FONT_SYSTEM_NAMES = ["SimHei"]
+FONT_CACHE_FILE = "cache/font_path.json"
+
+# 文字渲染缓存（所有页面共享）的最大条目数，超出按LRU淘汰
+TEXT_CACHE_MAX_ENTRIES = 512
+
+# 碰撞检测网格边长（像素），应不小于敌人半径+子弹半径，否则会自动扩大邻域范围
+COLLISION_CELL_SIZE = 64
 
 # MySQL数据库配置（对接用户数据持久化）
 DB_CONFIG = {
@@ -0,0 +1,112 @@
+import numpy
+
+_KEY_SHIFT = numpy.int64(1 << 32)
+
+
+class SpatialHash:
+    """均匀网格宽相检测：敌人按所在格子排序，子弹只与邻近格子中的敌人做精确检测
+
+    每帧用 build() 重建（排序几百个敌人的代价可以忽略），查询全程向量化。
+    """
+
+    def __init__(self, cell_size: float = 64):
+        self.cell_size = float(cell_size)
+        self._sorted_keys = numpy.zeros(0, dtype=numpy.int64)
+        self._order = numpy.zeros(0, dtype=numpy.int64)
+
+    def _cells(self, xs, ys):
+        cx = numpy.floor(numpy.asarray(xs, dtype=numpy.float64) / self.cell_size).astype(numpy.int64)
+        cy = numpy.floor(numpy.asarray(ys, dtype=numpy.float64) / self.cell_size).astype(numpy.int64)
+        return cx, cy
+
+    def build(self, xs, ys):
+        cx, cy = self._cells(xs, ys)
+        keys = cx * _KEY_SHIFT + cy
+        self._order = numpy.argsort(keys, kind="stable")
+        self._sorted_keys = keys[self._order]
+
+    def query(self, x0, y0, x1, y1, reach: float):
+        """返回所有候选 (线段索引, 敌人索引) 对
+
+        每条线段（子弹本帧的移动轨迹）取包围盒并向外扩展 reach，覆盖到的格子都参与查询；
+        静止点查询时传入相同的起止点即可。
+        """
+        empty = numpy.zeros(0, dtype=numpy.int64)
+        if self._sorted_keys.size == 0 or len(x0) == 0:
+            return empty, empty
+
+        x0 = numpy.asarray(x0, dtype=numpy.float64)
+        y0 = numpy.asarray(y0, dtype=numpy.float64)
+        x1 = numpy.asarray(x1, dtype=numpy.float64)
+        y1 = numpy.asarray(y1, dtype=numpy.float64)
+        cx_lo, cy_lo = self._cells(numpy.minimum(x0, x1) - reach, numpy.minimum(y0, y1) - reach)
+        cx_hi, cy_hi = self._cells(numpy.maximum(x0, x1) + reach, numpy.maximum(y0, y1) + reach)
+        widths = cx_hi - cx_lo + 1
+        heights = cy_hi - cy_lo + 1
+        cell_counts = widths * heights
+
+        # 第一次展开：每条线段 → 它覆盖的所有格子
+        num_cells = int(cell_counts.sum())
+        seg_of_cell = numpy.repeat(numpy.arange(len(x0), dtype=numpy.int64), cell_counts)
+        local = numpy.arange(num_cells, dtype=numpy.int64) - numpy.repeat(numpy.cumsum(cell_counts) - cell_counts, cell_counts)
+        heights_rep = heights[seg_of_cell]
+        cell_x = cx_lo[seg_of_cell] + local // heights_rep
+        cell_y = cy_lo[seg_of_cell] + local % heights_rep
+        query_keys = cell_x * _KEY_SHIFT + cell_y
+
+        lo = numpy.searchsorted(self._sorted_keys, query_keys, side="left")
+        hi = numpy.searchsorted(self._sorted_keys, query_keys, side="right")
+        counts = hi - lo
+        total = int(counts.sum())
+        if total == 0:
+            return empty, empty
+
+        # 第二次展开：每个格子的 [lo, hi) 区间 → 扁平的候选列表（敌人只属于一个格子，不会重复）
+        pair_segment = numpy.repeat(seg_of_cell, counts)
+        run_starts = numpy.repeat(lo, counts)
+        run_offsets = numpy.arange(total, dtype=numpy.int64) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+        pair_enemy = self._order[run_starts + run_offsets]
+        return pair_segment, pair_enemy
+
+
+def find_bullet_hits(grid: SpatialHash, bx0, by0, bx1, by1, bullet_radius,
+                     ex, ey, enemy_radius, enemy_dx=None, enemy_dy=None):
+    """连续（扫掠）碰撞检测：子弹本帧轨迹线段 vs 敌人圆，返回按 (子弹, 命中时刻) 排序的命中对
+
+    (bx0, by0) → (bx1, by1) 为子弹本帧起止位置，(ex, ey) 为敌人本帧结束位置，
+    enemy_dx/enemy_dy 为敌人本帧位移（换算到敌人参考系下的相对轨迹），
+    因此无论步长多大都不会穿透。同一子弹的候选按沿轨迹先后排列，调用方据此只结算一次。
+    """
+    bullet_radius = numpy.asarray(bullet_radius, dtype=numpy.float64)
+    enemy_radius = numpy.asarray(enemy_radius, dtype=numpy.float64)
+    empty = numpy.zeros(0, dtype=numpy.int64)
+    if len(bx0) == 0 or len(ex) == 0:
+        return empty, empty
+    if enemy_dx is None:
+        enemy_dx = numpy.zeros(len(ex))
+        enemy_dy = numpy.zeros(len(ex))
+
+    grid.build(ex, ey)
+    max_enemy_step = float(numpy.hypot(enemy_dx, enemy_dy).max())
+    reach = float(bullet_radius.max() + enemy_radius.max()) + max_enemy_step
+    b_idx, e_idx = grid.query(bx0, by0, bx1, by1, reach)
+    if b_idx.size == 0:
+        return empty, empty
+
+    # 相对轨迹（敌人本帧结束时的参考系）：b0 - e0 = (b0 + Δe) - e1，起点加上敌人位移，终点不变，
+    # 检测线段到敌人圆心的最近距离
+    start_x = bx0[b_idx] + enemy_dx[e_idx]
+    start_y = by0[b_idx] + enemy_dy[e_idx]
+    seg_x = bx1[b_idx] - start_x
+    seg_y = by1[b_idx] - start_y
+    to_x = ex[e_idx] - start_x
+    to_y = ey[e_idx] - start_y
+    seg_len2 = seg_x * seg_x + seg_y * seg_y
+    t = numpy.where(seg_len2 > 0, (to_x * seg_x + to_y * seg_y) / numpy.where(seg_len2 > 0, seg_len2, 1.0), 0.0)
+    t = numpy.clip(t, 0.0, 1.0)
+    dist = numpy.hypot(to_x - t * seg_x, to_y - t * seg_y)
+
+    hit = dist < enemy_radius[e_idx] + bullet_radius[b_idx]
+    b_idx, e_idx, t = b_idx[hit], e_idx[hit], t[hit]
+    order = numpy.lexsort((t, b_idx))
+    return b_idx[order], e_idx[order]
@@ -0,0 +1,247 @@
+import numpy
+
+SIDES = ("up", "down", "left", "right")
+
+
+class EntityStore:
+    """结构化数组（SoA）实体存储基类：每个字段一个连续NumPy数组，前 count 行为存活实体
+
+    删除采用交换删除（用末尾实体填补空位），不保持顺序，但无需移动整段数组；
+    clear() 只把 count 归零，数组容量跨子弹/敌人波次复用。每步计算用的临时数组也按容量预分配，
+    稳态下移动、计时、出界判断不再申请新内存。
+    """
+
+    __slots__ = ("count", "capacity", "_next_id", "ids", "_scratch")
+    # (字段名, dtype, 每行形状)
+    FIELDS = ()
+    FRAME_RATE = 60  # 速度按该帧率下的每帧像素数标定，step() 的 scale 为步长相对该帧长的倍数
+
+    def __init__(self, capacity: int = 64):
+        self.count = 0
+        self.capacity = 0
+        self._next_id = 0
+        for name, dtype, shape in self.FIELDS:
+            setattr(self, name, numpy.zeros((0,) + shape, dtype=dtype))
+        self.ids = numpy.zeros(0, dtype=numpy.int64)
+        self._scratch = {}
+        self._reserve(capacity)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _reserve(self, capacity: int):
+        if capacity <= self.capacity:
+            return
+        for name, dtype, shape in self.FIELDS + (("ids", numpy.int64, ()),):
+            old = getattr(self, name)
+            new = numpy.zeros((capacity,) + shape, dtype=dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = capacity
+        self._scratch.clear()
+
+    def _buffer(self, name: str, dtype=numpy.float64):
+        """取一块按容量预分配的临时数组（前 count 行），扩容后自动重新分配"""
+        buffer = self._scratch.get(name)
+        if buffer is None:
+            buffer = self._scratch[name] = numpy.empty(self.capacity, dtype=dtype)
+        return buffer[:self.count]
+
+    def _append(self, **values) -> int:
+        """追加一行并返回实体id（id单调递增，不随交换删除改变）"""
+        if self.count >= self.capacity:
+            self._reserve(max(16, self.capacity * 2))
+        row = self.count
+        for name, value in values.items():
+            getattr(self, name)[row] = value
+        self.ids[row] = self._next_id
+        self._next_id += 1
+        self.count += 1
+        return int(self.ids[row])
+
+    def remove_indices(self, indices):
+        """批量交换删除：用末尾存活行一次性填补被删除行"""
+        indices = numpy.unique(numpy.asarray(indices, dtype=numpy.int64))
+        if indices.size == 0:
+            return
+        keep = numpy.ones(self.count, dtype=bool)
+        keep[indices] = False
+        new_count = self.count - indices.size
+        holes = numpy.flatnonzero(~keep[:new_count])
+        movers = numpy.flatnonzero(keep[new_count:]) + new_count
+        if holes.size:
+            for name, _, _ in self.FIELDS + (("ids", None, ()),):
+                array = getattr(self, name)
+                array[holes] = array[movers]
+        self.count = new_count
+
+    def remove_mask(self, mask):
+        if mask.any():
+            self.remove_indices(numpy.flatnonzero(mask))
+
+    def clear(self):
+        self.count = 0
+
+
+class EnemyStore(EntityStore):
+    """敌人存储：位置、基础速度、血量、伤害、精英标记、击中闪烁计时等
+
+    玩家中心、屏幕范围和加速倍率在创建时传入一次，每步只需传步长倍数。
+    """
+
+    FIELDS = (
+        ("x", numpy.float64, ()),
+        ("y", numpy.float64, ()),
+        ("prev_x", numpy.float64, ()),
+        ("prev_y", numpy.float64, ()),
+        ("base_speed", numpy.float64, ()),
+        ("health", numpy.float64, ()),
+        ("max_health", numpy.float64, ()),
+        ("size", numpy.int32, ()),
+        ("damage", numpy.int32, ()),
+        ("is_elite", bool, ()),
+        ("side", numpy.int8, ()),
+        ("hit_flash", bool, ()),
+        ("flash_timer", numpy.float64, ()),  # 闪烁已持续的步数（按60帧/秒计）
+        ("sound_bound", bool, ()),
+    )
+    __slots__ = tuple(name for name, _, _ in FIELDS) + (
+        "center", "screen_width", "screen_height", "inside_multiplier", "elite_multiplier")
+    INSIDE_MARGIN = 50  # 进入屏幕（含该宽度的边缘）后加速
+    INSIDE_MULTIPLIER = 1.8
+    ELITE_MULTIPLIER = 1.2  # 精英在屏幕内的额外加速
+
+    def __init__(self, center, screen_width: int, screen_height: int,
+                 inside_multiplier: float = INSIDE_MULTIPLIER, elite_multiplier: float = ELITE_MULTIPLIER,
+                 capacity: int = 64):
+        super().__init__(capacity)
+        self.center = center
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.inside_multiplier = inside_multiplier
+        self.elite_multiplier = elite_multiplier
+
+    def spawn(self, x, y, side: str, is_elite: bool, max_health, base_speed, damage, size=35) -> int:
+        return self._append(x=x, y=y, prev_x=x, prev_y=y, base_speed=base_speed,
+                            health=max_health, max_health=max_health, size=size,
+                            damage=damage, is_elite=is_elite, side=SIDES.index(side),
+                            hit_flash=False, flash_timer=0, sound_bound=False)
+
+    def step(self, scale: float = 1.0):
+        """全部敌人一次向量化移动：朝中心追踪，进入屏幕（含 INSIDE_MARGIN 边缘）后加速
+
+        scale 为本步长相对 FRAME_RATE 单帧的倍数，速度和闪烁计时都按它换算。
+        """
+        n = self.count
+        if n == 0:
+            return
+        x = self.x[:n]
+        y = self.y[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        dx = numpy.subtract(self.center[0], x, out=self._buffer("dx"))
+        dy = numpy.subtract(self.center[1], y, out=self._buffer("dy"))
+        dist = numpy.hypot(dx, dy, out=self._buffer("dist"))
+        moving = numpy.greater(dist, 5, out=self._buffer("moving", bool))
+
+        margin = self.INSIDE_MARGIN
+        inside = numpy.greater(x, -margin, out=self._buffer("inside", bool))
+        mask = self._buffer("mask", bool)
+        inside &= numpy.less(x, self.screen_width + margin, out=mask)
+        inside &= numpy.greater(y, -margin, out=mask)
+        inside &= numpy.less(y, self.screen_height + margin, out=mask)
+
+        # 速度 = 基础速度 × (屏幕内加速 × 精英加速) × 步长倍数，再除以距离得到每步位移比例
+        # （只用 copyto 的 where，带 where 的算术 ufunc 每次调用都会申请掩码迭代缓冲区）
+        speed = self._buffer("speed")
+        speed.fill(1.0)
+        numpy.copyto(speed, self.inside_multiplier, where=inside)
+        numpy.copyto(speed, self.inside_multiplier * self.elite_multiplier,
+                     where=numpy.logical_and(inside, self.is_elite[:n], out=mask))
+        speed *= self.base_speed[:n]
+        speed *= scale
+        stopped = numpy.logical_not(moving, out=mask)
+        numpy.copyto(dist, 1.0, where=stopped)
+        speed /= dist
+        numpy.copyto(speed, 0.0, where=stopped)
+        dx *= speed
+        dy *= speed
+        x += dx
+        y += dy
+
+        # 击中闪烁：持续4帧后熄灭
+        flash = self.hit_flash[:n]
+        timer = self.flash_timer[:n]
+        timer += numpy.multiply(flash, scale, out=self._buffer("flash_step"))
+        expired = numpy.greater(timer, 3, out=mask)
+        numpy.copyto(flash, False, where=expired)
+        numpy.copyto(timer, 0.0, where=expired)
+
+    def reached_center(self, radius: float = 40):
+        n = self.count
+        dx = numpy.subtract(self.x[:n], self.center[0], out=self._buffer("dx"))
+        dy = numpy.subtract(self.y[:n], self.center[1], out=self._buffer("dy"))
+        dist = numpy.hypot(dx, dy, out=self._buffer("dist"))
+        return numpy.less(dist, radius, out=self._buffer("reached", bool))
+
+
+class BulletStore(EntityStore):
+    """子弹存储：位置、速度、颜色、尺寸、伤害和累计飞行距离
+
+    屏幕范围和最大射程在创建时传入一次。
+    """
+
+    FIELDS = (
+        ("x", numpy.float64, ()),
+        ("y", numpy.float64, ()),
+        ("prev_x", numpy.float64, ()),
+        ("prev_y", numpy.float64, ()),
+        ("vx", numpy.float64, ()),
+        ("vy", numpy.float64, ()),
+        ("speed", numpy.float64, ()),
+        ("flight_distance", numpy.float64, ()),
+        ("size", numpy.int32, ()),
+        ("damage", numpy.float64, ()),
+        ("color", numpy.uint8, (3,)),
+    )
+    __slots__ = tuple(name for name, _, _ in FIELDS) + ("screen_width", "screen_height", "max_distance")
+    EXPIRE_MARGIN = 100  # 飞出屏幕超过该距离即删除
+
+    def __init__(self, screen_width: int, screen_height: int, max_distance: float, capacity: int = 64):
+        super().__init__(capacity)
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.max_distance = max_distance
+
+    def spawn(self, x, y, angle: float, speed, color, size, damage) -> int:
+        return self._append(x=x, y=y, prev_x=x, prev_y=y,
+                            vx=numpy.cos(angle) * speed, vy=numpy.sin(angle) * speed, speed=abs(speed),
+                            flight_distance=0.0, size=size, damage=damage, color=color)
+
+    def step(self, scale: float = 1.0):
+        """全部子弹一次向量化移动，本步起点保存在 prev_x/prev_y 中供扫掠碰撞和渲染插值使用"""
+        n = self.count
+        if n == 0:
+            return
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+        delta = self._buffer("delta")
+        self.x[:n] += numpy.multiply(self.vx[:n], scale, out=delta)
+        self.y[:n] += numpy.multiply(self.vy[:n], scale, out=delta)
+        self.flight_distance[:n] += numpy.multiply(self.speed[:n], scale, out=delta)
+
+    def remove_expired(self):
+        """删除飞出屏幕（含 EXPIRE_MARGIN 边缘）或超出射程的子弹（在碰撞检测之后调用，避免漏判出界前的命中）"""
+        n = self.count
+        if n == 0:
+            return
+        x = self.x[:n]
+        y = self.y[:n]
+        margin = self.EXPIRE_MARGIN
+        expired = numpy.less(x, -margin, out=self._buffer("expired", bool))
+        mask = self._buffer("mask", bool)
+        expired |= numpy.greater(x, self.screen_width + margin, out=mask)
+        expired |= numpy.less(y, -margin, out=mask)
+        expired |= numpy.greater(y, self.screen_height + margin, out=mask)
+        expired |= numpy.greater(self.flight_distance[:n], self.max_distance, out=mask)
+        self.remove_mask(expired)
@@ -0,0 +1,165 @@
+import heapq
+import json
+
+from core.entities import SIDES
+
+
+class EnemySpawn:
+    """一个待生成敌人的全部随机属性（排入时间线时就已抽好）"""
+    __slots__ = ("side", "x", "y", "is_elite", "speed_roll")
+
+    def __init__(self, side: str, x: float, y: float, is_elite: bool, speed_roll: float):
+        self.side = side
+        self.x = x
+        self.y = y
+        self.is_elite = is_elite
+        self.speed_roll = speed_roll  # 基础速度随机值（精英加成由生成方乘上）
+
+
+class SpawnEvent:
+    """时间线上的一次生成：在 time（毫秒，严格大于时生效）生成 enemies 中的敌人"""
+    __slots__ = ("time", "enemies", "scripted")
+
+    def __init__(self, time: float, enemies: list, scripted: bool = False):
+        self.time = time
+        self.enemies = enemies
+        self.scripted = scripted
+
+
+class SpawnScheduler:
+    """敌人生成时间线：按难度曲线预先算出下一次生成的时间和敌人属性，放入小顶堆
+
+    每步只需比较堆顶时间，不再每帧重算生成间隔和掷骰；脚本波次（从JSON加载）一次性全部入堆。
+    随机生成的下一次事件在上一次实际触发时排入（场上敌人已满时事件会推迟，后续时间随之顺延）。
+    """
+
+    def __init__(self, rng, screen_width: int, screen_height: int,
+                 base_interval: float, min_interval: float, speedup_rate: float,
+                 min_distance: int, max_distance: int,
+                 burst_chance: float = 0.1, elite_chance: float = 0.3, speed_range: tuple = (1, 1.5),
+                 waves: list | None = None, procedural: bool = True):
+        self.rng = rng
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.speedup_rate = speedup_rate  # 每秒缩短的生成间隔（毫秒）
+        self.min_distance = min_distance
+        self.max_distance = max_distance
+        self.burst_chance = burst_chance
+        self.elite_chance = elite_chance
+        self.speed_range = speed_range
+        self.waves = waves or []
+        self.procedural = procedural
+        self.start_time = 0.0
+        self._heap = []
+        self._seq = 0
+
+    # -------------------------- 难度曲线 --------------------------
+    def interval_at(self, now: float) -> float:
+        """对局进行到 now 时的生成间隔：随时间线性缩短，不低于最小间隔"""
+        elapsed = (now - self.start_time) / 1000
+        return max(self.min_interval, self.base_interval - elapsed * self.speedup_rate)
+
+    def next_spawn_after(self, last: float) -> float:
+        """上一次生成在 last 时，求满足 now - last > interval_at(now) 的临界时间（解析解，无需逐帧判断）"""
+        # 间隔仍在线性缩短段：now - last > base - (now - start) * rate / 1000
+        k = self.speedup_rate / 1000
+        linear = (last + self.base_interval + self.start_time * k) / (1 + k)
+        return max(last + self.min_interval, linear)
+
+    # -------------------------- 时间线 --------------------------
+    def reset(self, rng=None, start_time: float = 0.0):
+        """开新局：清空时间线，排入全部脚本波次和第一次随机生成"""
+        if rng is not None:
+            self.rng = rng
+        self.start_time = start_time
+        self._heap.clear()
+        self._seq = 0
+        for wave in self.waves:
+            self._push(SpawnEvent(start_time + wave["time"], self._scripted_enemies(wave), scripted=True))
+        if self.procedural:
+            self._push_procedural(start_time)
+
+    def next_time(self) -> float | None:
+        return self._heap[0][0] if self._heap else None
+
+    def is_due(self, now: float) -> bool:
+        return bool(self._heap) and now > self._heap[0][0]
+
+    def pop(self, now: float) -> SpawnEvent:
+        """取出堆顶事件；随机事件触发时以 now 为起点排入下一次随机生成"""
+        event = heapq.heappop(self._heap)[2]
+        if not event.scripted:
+            self._push_procedural(now)
+        return event
+
+    def requeue(self, event: SpawnEvent, spawned: int, now: float):
+        """事件只生成了前 spawned 个敌人（场上已满）：剩余敌人以 now 为时间重新入堆，等有空位再生成
+
+        剩余部分按脚本事件入堆，弹出时不再排入新的随机生成（原事件触发时已经排过）。
+        """
+        if spawned < len(event.enemies):
+            self._push(SpawnEvent(now, event.enemies[spawned:], scripted=True))
+
+    def _push(self, event: SpawnEvent):
+        # 序号保证同一时间的事件按入堆顺序弹出，结果可复现
+        heapq.heappush(self._heap, (event.time, self._seq, event))
+        self._seq += 1
+
+    def _push_procedural(self, last: float):
+        count = 2 if self.rng.random() < self.burst_chance else 1
+        self._push(SpawnEvent(self.next_spawn_after(last), [self._random_enemy() for _ in range(count)]))
+
+    # -------------------------- 敌人属性 --------------------------
+    def _edge_position(self, side: str, distance: float, offset: float):
+        """屏幕某一侧外 distance 像素处；offset 为沿该边的坐标"""
+        if side == "up":
+            return offset, -distance
+        if side == "down":
+            return offset, self.screen_height + distance
+        if side == "left":
+            return -distance, offset
+        return self.screen_width + distance, offset
+
+    def _random_enemy(self, side: str | None = None, distance: float | None = None,
+                      offset: float | None = None, is_elite: bool | None = None) -> EnemySpawn:
+        """在屏幕外 min~max 距离处随机生成；脚本中指定的属性不再随机"""
+        rng = self.rng
+        if distance is None:
+            distance = rng.randint(self.min_distance, self.max_distance)
+        if side is None:
+            side = rng.choice(SIDES)
+        if offset is None:
+            offset = rng.randint(0, self.screen_width if side in ("up", "down") else self.screen_height)
+        if is_elite is None:
+            is_elite = rng.random() < self.elite_chance
+        x, y = self._edge_position(side, distance, offset)
+        return EnemySpawn(side, x, y, is_elite, rng.uniform(*self.speed_range))
+
+    def _scripted_enemies(self, wave: dict) -> list:
+        return [self._random_enemy(wave.get("side"), wave.get("distance"), wave.get("offset"), wave.get("elite"))
+                for _ in range(wave.get("count", 1))]
+
+
+def load_waves(path: str) -> tuple:
+    """读取脚本波次文件，返回 (波次列表, 是否同时保留随机生成)
+
+    文件格式：{"procedural": true, "waves": [{"time": 毫秒, "count": 数量, "side": "up", "distance": 像素,
+    "offset": 沿边坐标, "elite": true}, ...]}，除 time 外均可省略（省略的属性随机生成）。
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"❌ 波次文件读取失败：{e}")
+        return [], True
+    waves = []
+    for wave in data.get("waves", []):
+        if "time" not in wave or (wave.get("side") is not None and wave["side"] not in SIDES):
+            print(f"❌ 忽略无效波次：{wave}")
+            continue
+        waves.append(wave)
+    waves.sort(key=lambda wave: wave["time"])
+    return waves, bool(data.get("procedural", True))
+
@@ -1,86 +1,241 @@
+import time
+_LAUNCH_TIME = time.perf_counter()  # 进程启动（导入其他模块之前），用于统计首帧耗时
+
 import pygame
 from pages.base_page import BasePage
 from pages.home_page import HomePage
 from pages.login_page import LoginPage
 from pages.register_page import RegisterPage
 from pages.equipment_page import EquipmentPage
-from pages.game_page import GamePage
 from pages.lottery_page import LotteryPage  # 导入抽奖页面
+from utils.fixed_timestep import FixedTimestep
+from utils.frame_profiler import profiler
+from utils.sampling_profiler import SamplingProfiler
+from config import MIXER_FREQUENCY, MIXER_BUFFER, FPS
+
+_MISSING = object()
+# 窗口内容可能丢失、需要整屏刷新的窗口事件
+_REDRAW_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWSHOWN, pygame.WINDOWRESTORED,
+                  pygame.WINDOWSIZECHANGED)
 
 class PageManager:
-    def __init__(self, screen: pygame.Surface):
+    def __init__(self, screen: pygame.Surface, launch_time: float | None = None):
         self.screen = screen
-        self.pages = {}  # {页面名称: 页面实例}
+        self.pages = {}  # {页面名称: 页面实例}（只含已创建的页面）
+        self._factories = {}  # {页面名称: 创建函数(screen, page_manager)}，首次切换到该页面时创建
+        self._warm_up_queue = []  # 空闲时预先创建的页面名称
         self.current_page = None  # 当前激活页面
-
-    def register_page(self, page_name: str, page: BasePage):
-        """注册页面"""
-        self.pages[page_name] = page
+        self.current_user = None  # 当前登录用户（新创建的页面也会设置）
+        self._launch_time = launch_time  # 不为None时，第一次刷新屏幕时报告首帧耗时
+        self.first_frame_ms = None
+        self.timestep = FixedTimestep()  # 固定步长模拟的时间累加器
+        self.profiler = profiler  # 分阶段帧计时（F3叠加层 / F4导出trace）
+        self.sampler = SamplingProfiler()  # F5 按需采样调用栈（后台线程）
+        self._render_state = None  # 上次刷新到屏幕时页面的 render_state()；None 表示下次整屏刷新
+
+    def register_page(self, page_name: str, page):
+        """注册页面：页面实例，或创建函数（如页面类本身，参数为 screen, page_manager，首次切换时才创建）"""
+        if isinstance(page, BasePage):
+            self.pages[page_name] = page
+        else:
+            self._factories[page_name] = page
+
+    def get_page(self, page_name: str) -> BasePage | None:
+        """取页面实例，未创建的按注册的创建函数创建"""
+        page = self.pages.get(page_name)
+        if page is None and page_name in self._factories:
+            start = time.perf_counter()
+            page = self.pages[page_name] = self._factories.pop(page_name)(self.screen, self)
+            page.set_current_user(self.current_user)
+            print(f"创建页面：{page_name}（{(time.perf_counter() - start) * 1000:.0f}ms）")
+        return page
+
+    def warm_up(self, *page_names: str):
+        """排队预先创建页面：在菜单页空闲等待输入时逐个创建，之后切换过去不用再等"""
+        self._warm_up_queue.extend(name for name in page_names if name in self._factories)
+
+    def set_current_user(self, user):
+        """设置所有页面（包括之后创建的页面）的当前用户"""
+        self.current_user = user
+        for page in self.pages.values():
+            page.set_current_user(user)
 
     def switch_page(self, page_name: str):
         """切换页面"""
-        if page_name in self.pages:
-            self.current_page = self.pages[page_name]
+        page = self.get_page(page_name)
+        if page:
+            self.current_page = page
             self.current_page.is_active = True
+            self.timestep.reset()
+            self._render_state = None
             print(f"切换到页面：{page_name}")
 
     def update(self, dt: float):
-        """更新当前页面逻辑"""
-        if self.current_page:
-            self.current_page.update(dt)
-
-    def draw(self):
-        """渲染当前页面"""
+        """更新当前页面逻辑：固定步长页面先按累加时间跑完整数个模拟步，再执行每帧更新"""
+        page = self.current_page
+        if not page:
+            return
+        if page.fixed_timestep:
+            with self.profiler.section("update.step"):
+                for _ in range(self.timestep.advance(dt)):
+                    page.step(self.timestep.tick_ms)
+            page.render_alpha = self.timestep.alpha
+        page.update(dt)
+
+    def _event_driven(self) -> bool:
+        """当前页面是否只在界面状态变化时重绘（开启帧计时叠加层时所有页面都按帧重绘）"""
+        page = self.current_page
+        return page is not None and not page.continuous_render and not self.profiler.enabled
+
+    def wait_events(self) -> list | None:
+        """空闲的菜单页阻塞等待事件（有按时间的变化时最多等到那时）；需要按帧运行时返回None"""
+        if not self._event_driven() or self._render_state is None:
+            return None
+        delay = self.current_page.next_redraw_ms()
+        if delay is not None and delay <= 0:
+            return None
+        # 空闲且没有待处理的事件时，先预创建一个排队的页面
+        while self._warm_up_queue and not pygame.event.peek():
+            page_name = self._warm_up_queue.pop(0)
+            if page_name in self._factories:
+                self.get_page(page_name)
+                return []
+        event = pygame.event.wait(delay or 0)  # 0 表示一直等待
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(pygame.event.get())
+        return events
+
+    def _dirty_rects(self, page: BasePage) -> list:
+        state = page.render_state()
+        last, self._render_state = self._render_state, state
+        if last is None:
+            return [self.screen.get_rect()]
+        dirty = [pygame.Rect(region) for region, value in state.items() if last.get(region, _MISSING) != value]
+        dirty.extend(pygame.Rect(region) for region in last if region not in state)
+        return dirty
+
+    def draw(self) -> list | None:
+        """渲染当前页面，返回需要刷新到屏幕的区域（None 表示整屏翻页，空列表表示无需刷新）
+
+        按帧重绘的页面（游戏页）每帧整屏绘制；菜单页只在 render_state() 变化时重绘，只刷新变化的区域。
+        """
+        if self._event_driven():
+            dirty = self._dirty_rects(self.current_page)
+            if dirty:
+                self.current_page.draw()
+            return dirty
+        self._render_state = None  # 回到事件驱动时先整屏刷新一次（如关闭计时叠加层后）
         if self.current_page:
             self.current_page.draw()
+        if self.profiler.enabled:
+            stats = BasePage.text_cache.stats()
+            self.profiler.draw_overlay(self.screen, [
+                f"text cache {stats['entries']} entries  hit {stats['hit_rate']:.1%}  miss {stats['misses']}"
+            ])
+        return None
+
+    def present(self, dirty: list | None):
+        """把 draw() 的结果刷新到屏幕"""
+        if dirty is None:
+            pygame.display.flip()
+        elif dirty:
+            pygame.display.update(dirty)
+        else:
+            return
+        if self._launch_time is not None:
+            self.first_frame_ms = (time.perf_counter() - self._launch_time) * 1000
+            self._launch_time = None
+            print(f"✅ 首帧耗时：{self.first_frame_ms:.0f}ms（进程启动 → {self.current_page.__class__.__name__} 首帧刷新到屏幕）")
 
     def handle_event(self, event: pygame.event.Event):
-        """处理当前页面事件"""
+        """处理当前页面事件（调试热键在任何页面都先于页面处理）"""
+        if event.type == pygame.KEYDOWN and self._handle_debug_key(event.key):
+            return
+        if event.type in _REDRAW_EVENTS:
+            self._render_state = None  # 窗口被遮挡后重新显示，整屏刷新
         if self.current_page:
             self.current_page.handle_event(event)
 
-def main():
-    # 初始化Pygame
+    def _handle_debug_key(self, key: int) -> bool:
+        if key == pygame.K_F3:
+            self.profiler.set_enabled(not self.profiler.enabled)
+            return True
+        if key == pygame.K_F4:
+            self.profiler.export_chrome_trace()
+            return True
+        if key == pygame.K_F5:
+            # 事件在主线程分发，采样的就是主循环所在线程
+            self.sampler.start()
+            return True
+        return False
+
+def _create_game_page(screen: pygame.Surface, page_manager: PageManager):
+    # 游戏页依赖 numpy 和音效合成等模块，导入较慢，第一次创建时才导入
+    from pages.game_page import GamePage
+    return GamePage(screen, page_manager)
+
+def main(first_frame_only: bool = False) -> float | None:
+    """程序入口；first_frame_only 为True时登录页首帧刷新到屏幕后立即退出（启动耗时测量用），返回首帧耗时（毫秒）"""
+    # 初始化Pygame（混音器参数需在 pygame.init 之前设置才会生效）
+    pygame.mixer.pre_init(frequency=MIXER_FREQUENCY, size=-16, channels=2, buffer=MIXER_BUFFER)
     pygame.init()
     screen = pygame.display.set_mode((800, 600))
     pygame.display.set_caption("游戏项目整合示例")
-    clock = pygame.time.Clock()
-    running = True
 
     # 初始化页面管理器
-    page_manager = PageManager(screen)
+    page_manager = PageManager(screen, launch_time=_LAUNCH_TIME)
 
-    # 注册所有页面（包含抽奖页面，删除云端页面）
-    page_manager.register_page("home", HomePage(screen, page_manager))
-    page_manager.register_page("login", LoginPage(screen, page_manager))
-    page_manager.register_page("register", RegisterPage(screen, page_manager))
-    page_manager.register_page("equipment", EquipmentPage(screen, page_manager))
-    page_manager.register_page("game", GamePage(screen, page_manager))
-    page_manager.register_page("lottery", LotteryPage(screen, page_manager))  # 注册抽奖页面
+    # 注册所有页面（包含抽奖页面，删除云端页面）：只注册页面类，首次切换到页面时才创建
+    page_manager.register_page("home", HomePage)
+    page_manager.register_page("login", LoginPage)
+    page_manager.register_page("register", RegisterPage)
+    page_manager.register_page("equipment", EquipmentPage)
+    page_manager.register_page("game", _create_game_page)
+    page_manager.register_page("lottery", LotteryPage)  # 注册抽奖页面
 
-    # 默认进入登录页面
+    # 默认进入登录页面；显示登录页期间空闲时预创建登录后最可能进入的页面
     page_manager.switch_page("login")
+    page_manager.warm_up("home", "game")
 
-    # 主循环
-    while running:
-        dt = clock.tick(60) / 1000  # 帧率60FPS，时间增量（秒）
+    run_main_loop(page_manager, (lambda: page_manager.first_frame_ms is not None) if first_frame_only else None)
+    pygame.quit()
+    return page_manager.first_frame_ms
+
+def run_main_loop(page_manager: PageManager, should_stop=None):
+    """主循环：事件 → 逻辑（固定步长）→ 渲染；should_stop 返回True或关闭窗口时退出（录像回放复用）"""
+    clock = pygame.time.Clock()
+    profiler = page_manager.profiler
+    running = True
+    while running and not (should_stop and should_stop()):
+        # 菜单页空闲时阻塞等待事件，不占CPU；游戏页和动画按渲染帧率运行
+        events = page_manager.wait_events()
+        if events is None:
+            dt = clock.tick(FPS) / 1000  # 渲染帧率，时间增量（秒）；模拟按固定步长推进
+        else:
+            clock.tick()  # 阻塞等待的时间不计入时间增量
+            dt = 0.0
+        # 帧计时从 tick 返回后开始（不含等待下一帧的空闲时间）
+        profiler.begin_frame()
 
         # 事件处理
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            page_manager.handle_event(event)
+        with profiler.section("events"):
+            for event in pygame.event.get() if events is None else events:
+                if event.type == pygame.QUIT:
+                    running = False
+                page_manager.handle_event(event)
 
         # 逻辑更新
-        page_manager.update(dt)
+        with profiler.section("update"):
+            page_manager.update(dt)
 
         # 界面渲染w
-        page_manager.draw()
+        with profiler.section("draw"):
+            dirty = page_manager.draw()
 
         # 刷新屏幕
-        pygame.display.flip()
-
-    pygame.quit()
+        with profiler.section("flip"):
+            page_manager.present(dirty)
+        profiler.end_frame()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -2,12 +2,22 @@
 import pygame
 from typing import Optional
 from core.User import User
+from utils.text_cache import TextCache
+from utils.font_registry import fonts
 
 class BasePage:
+    # 为True时由 PageManager 按固定步长调用 step()，与渲染帧率解耦
+    fixed_timestep = False
+    # 为True时每帧重绘（游戏页）；为False时只在 render_state() 变化时重绘，空闲时主循环阻塞等待事件
+    continuous_render = False
+    # 所有页面共享的文字渲染缓存
+    text_cache = TextCache()
+
     def __init__(self, screen: pygame.Surface, page_manager):
         self.screen = screen
         self.page_manager = page_manager
         self.is_active = True
+        self.render_alpha = 1.0  # 距上一个模拟步的比例（0~1），渲染时用于插值
         self.current_user: Optional[User] = None
         
         # 中文支持：中文字体初始化（之前配置的代码保留）
@@ -16,24 +26,41 @@ class BasePage:
         self.small_font = self._get_chinese_font(24)
 
     def _get_chinese_font(self, font_size: int) -> pygame.font.Font:
-        """获取支持中文的字体（容错处理）"""
-        try:
-            return pygame.font.Font("simhei.ttf", font_size)
-        except FileNotFoundError:
-            try:
-                return pygame.font.Font("msyh.ttc", font_size)
-            except FileNotFoundError:
-                return pygame.font.SysFont("SimHei", font_size)
+        """获取支持中文的字体（全局字体表中按字号共享，字体文件只查找一次）"""
+        return fonts.get(font_size)
+
+    def render_text(self, font: pygame.font.Font, text: str, antialias: bool, color) -> pygame.Surface:
+        """同 font.render，但经共享缓存（相同字体/文本/颜色只光栅化一次）；返回的Surface只读"""
+        return self.text_cache.render(font, text, antialias, color)
 
     # 关键修复：给 update 方法添加 dt 参数（默认值 None，兼容无逻辑的子类）
     def update(self, dt: float | None = None):
         """更新页面逻辑（子类重写）"""
         pass
 
+    def step(self, tick_ms: float):
+        """推进一个固定步长的模拟（fixed_timestep 为True的子类重写）"""
+        pass
+
     def draw(self):
         """渲染页面（子类重写）"""
         pass
 
+    def render_state(self) -> dict:
+        """界面状态快照 {区域(x, y, w, h): 该区域显示的值}（子类重写）
+
+        PageManager 比较前后两次快照，有值变化时整页重绘，但只把变化的区域刷新到屏幕；
+        静态内容不用列出（切换页面或窗口重新显示时整屏刷新）。
+        """
+        return {}
+
+    def next_redraw_ms(self) -> int | None:
+        """距下一次按时间变化（动画、提示超时）的毫秒数，0 表示动画进行中需按帧运行，None 表示只等输入事件"""
+        return None
+
+    def _hovered(self, rect: pygame.Rect) -> bool:
+        return rect.collidepoint(pygame.mouse.get_pos())
+
     def handle_event(self, event: pygame.event.Event):
         """处理事件（子类重写）"""
         pass
@@ -54,7 +54,7 @@ class EquipmentPage(BasePage):
         self.screen.fill(DARK_BLUE)
         
         # 标题
-        title_surf = self.font.render("⚔️ 装备管理", True, YELLOW)
+        title_surf = self.render_text(self.font, "⚔️ 装备管理", True, YELLOW)
         self.screen.blit(title_surf, (self.screen_width//2 - 120, 40))
         
         # 区域边框
@@ -62,8 +62,8 @@ class EquipmentPage(BasePage):
         pygame.draw.rect(self.screen, GREEN, self.weapon_area_rect, 3)
         
         # 区域标题
-        slot_title = self.medium_font.render("装备槽（点击切换）", True, WHITE)
-        weapon_title = self.medium_font.render("已解锁武器（拖动装备）", True, WHITE)
+        slot_title = self.render_text(self.medium_font, "装备槽（点击切换）", True, WHITE)
+        weapon_title = self.render_text(self.medium_font, "已解锁武器（拖动装备）", True, WHITE)
         self.screen.blit(slot_title, (self.slot_area_rect.centerx - slot_title.get_width()//2, self.slot_area_rect.y - 30))
         self.screen.blit(weapon_title, (self.weapon_area_rect.centerx - weapon_title.get_width()//2, self.weapon_area_rect.y - 30))
         
@@ -77,7 +77,7 @@ class EquipmentPage(BasePage):
     def _draw_equipment_slots(self):
         """绘制装备槽及已装备武器"""
         if not self.current_user:
-            tip_surf = self.small_font.render("请先登录", True, RED)
+            tip_surf = self.render_text(self.small_font, "请先登录", True, RED)
             self.screen.blit(tip_surf, (self.slot_area_rect.centerx - 40, self.slot_area_rect.centery))
             return
         
@@ -89,14 +89,14 @@ class EquipmentPage(BasePage):
             pygame.draw.rect(self.screen, GRAY, slot_rect, 2, border_radius=5)
             
             # 槽位编号
-            slot_num = self.small_font.render(f"{i+1}", True, WHITE)
+            slot_num = self.render_text(self.small_font, f"{i+1}", True, WHITE)
             self.screen.blit(slot_num, (slot_rect.x + 5, slot_rect.y + 5))
             
             # 已装备武器
             if weapon:
-                weapon_name = self.small_font.render(weapon.name[:6], True, weapon.color)
+                weapon_name = self.render_text(self.small_font, weapon.name[:6], True, weapon.color)
                 ammo_text = f"{weapon.current_clip}/{weapon.current_ammo}"
-                ammo_surf = self.small_font.render(ammo_text, True, WHITE)
+                ammo_surf = self.render_text(self.small_font, ammo_text, True, WHITE)
                 
                 self.screen.blit(weapon_name, (slot_rect.x + 5, slot_rect.y + 30))
                 self.screen.blit(ammo_surf, (slot_rect.x + 5, slot_rect.y + 55))
@@ -104,7 +104,7 @@ class EquipmentPage(BasePage):
     def _draw_unlocked_weapons(self):
         """绘制已解锁武器列表"""
         if not self.current_user or not self.unlocked_weapons:
-            tip_surf = self.small_font.render("暂无解锁武器", True, RED)
+            tip_surf = self.render_text(self.small_font, "暂无解锁武器", True, RED)
             self.screen.blit(tip_surf, (self.weapon_area_rect.centerx - 60, self.weapon_area_rect.centery))
             return
         
@@ -130,8 +130,8 @@ class EquipmentPage(BasePage):
             pygame.draw.rect(self.screen, weapon.color, weapon_rect, border_radius=5)
             pygame.draw.rect(self.screen, WHITE, weapon_rect, 1, border_radius=5)
             
-            name_surf = self.small_font.render(weapon.name[:6], True, WHITE)
-            damage_surf = self.small_font.render(f"伤害：{weapon.damage}", True, WHITE)
+            name_surf = self.render_text(self.small_font, weapon.name[:6], True, WHITE)
+            damage_surf = self.render_text(self.small_font, f"伤害：{weapon.damage}", True, WHITE)
             
             self.screen.blit(name_surf, (weapon_rect.x + 3, weapon_rect.y + 3))
             self.screen.blit(damage_surf, (weapon_rect.x + 3, weapon_rect.y + 45))
@@ -146,7 +146,7 @@ class EquipmentPage(BasePage):
             text_color = (255, 255, 255)
         
         pygame.draw.rect(self.screen, btn_color, self.back_btn_rect, border_radius=5)
-        btn_surf = self.small_font.render("返回主菜单", True, text_color)
+        btn_surf = self.render_text(self.small_font, "返回主菜单", True, text_color)
         self.screen.blit(btn_surf, (
             self.back_btn_rect.centerx - btn_surf.get_width()//2,
             self.back_btn_rect.centery - btn_surf.get_height()//2
@@ -166,15 +166,36 @@ class EquipmentPage(BasePage):
             pygame.draw.rect(self.screen, self.dragging_weapon.color, weapon_rect, border_radius=5)
             pygame.draw.rect(self.screen, WHITE, weapon_rect, 1, border_radius=5)
             
-            name_surf = self.small_font.render(self.dragging_weapon.name[:6], True, WHITE)
+            name_surf = self.render_text(self.small_font, self.dragging_weapon.name[:6], True, WHITE)
             self.screen.blit(name_surf, (weapon_rect.x + 3, weapon_rect.y + 3))
 
     def _draw_tip_text(self):
         """绘制提示信息（重复装备/操作成功）"""
         if self.tip_text:
-            tip_surf = self.small_font.render(self.tip_text, True, RED if "不能" in self.tip_text else GREEN)
+            tip_surf = self.render_text(self.small_font, self.tip_text, True, RED if "不能" in self.tip_text else GREEN)
             self.screen.blit(tip_surf, (self.screen_width//2 - tip_surf.get_width()//2, 100))
 
+    def render_state(self) -> dict:
+        user = self.current_user
+        slots = tuple((w.name, tuple(w.color), w.current_clip, w.current_ammo) if w else None
+                      for w in user.player.weapons) if user else None
+        unlocked = tuple((w.name, tuple(w.color), w.damage) for w in self.unlocked_weapons.values()) if user else None
+        # 拖动中的武器跟随鼠标，可能经过任何位置，整屏刷新
+        dragging = (self.dragging_weapon.name, pygame.mouse.get_pos()) if self.dragging_weapon else None
+        return {
+            tuple(self.slot_area_rect): slots,
+            tuple(self.weapon_area_rect): unlocked,
+            tuple(self.back_btn_rect): self._hovered(self.back_btn_rect),
+            (0, 100, self.screen_width, self.small_font.get_linesize()): self.tip_text,
+            (0, 0, self.screen_width, self.screen_height): dragging
+        }
+
+    def next_redraw_ms(self) -> int | None:
+        # 提示信息3秒后隐藏
+        if self.tip_text:
+            return max(1, 3001 - (pygame.time.get_ticks() - self.tip_show_time))
+        return None
+
     def handle_event(self, event: pygame.event.Event):
         # 修复返回键：优先处理返回按钮点击（解决失效问题）
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -2,30 +2,73 @@ from pages.base_page import BasePage
 from core.Weapon import Weapon, DEFAULT_WEAPONS
 from utils.db_utils import DBUtils
 import pygame
-import random
 import math
-import numpy  # 确保导入numpy（音效合成需要）
+import numpy
+import os
 from datetime import datetime
+from utils.sound_synth import SAMPLE_RATE, synth_wave, synth_mixed_sines, concat_waves, to_sound
+from utils.sound_cache import SoundCache
+from utils.audio_scheduler import AudioScheduler
+from utils.positional_audio import PositionalAudio
+from utils.soft_mixer import SoftMixer
+from utils.audio_latency import AudioLatencyProbe
+from utils.rng_streams import RngStreams
+from utils.frame_profiler import profiler, profiled
+from utils.sprite_atlas import SpriteAtlas
+from utils.hud import RetainedHud
+from utils.input_replay import (LiveInput, ReplayInput, InputRecorder, HOLD_LEFT, HOLD_Q, HOLD_E, HOLD_R,
+                                EVENT_LEFT_DOWN, EVENT_LEFT_UP, EVENT_PAUSE, EVENT_RESTART)
+from config import (AUDIO_SOUND_CATEGORIES, AUDIO_MIXER_MODE, MIXER_FREQUENCY, MIXER_BUFFER,
+                    COLLISION_CELL_SIZE, SIM_TICK_RATE, REPLAY_RECORD, REPLAY_DIR, SPAWN_WAVES_FILE,
+                    MAX_ENEMIES, BASE_SPAWN_INTERVAL, MIN_SPAWN_INTERVAL, SPAWN_SPEEDUP_RATE,
+                    MIN_SPAWN_DISTANCE, MAX_SPAWN_DISTANCE, BULLET_MAX_DISTANCE, RELOAD_TIME,
+                    ENEMY_BASE_HEALTH, ENEMY_ELITE_HEALTH, ENEMY_BASE_DAMAGE, ENEMY_ELITE_DAMAGE,
+                    ENEMY_BASE_SPEED, ENEMY_ELITE_SPEED_MULTIPLIER, ENEMY_ELITE_CHANCE, ENEMY_BURST_CHANCE,
+                    ENEMY_STRENGTH_INCREMENT, ENEMY_STRENGTH_INTERVAL, ENEMY_CONTACT_RADIUS)
+from core.entities import EnemyStore, BulletStore, SIDES
+from core.spawn_scheduler import SpawnScheduler, load_waves
+from core.collision import SpatialHash, find_bullet_hits
 
 class GamePage(BasePage):
+    fixed_timestep = True
+    continuous_render = True
+    # 模拟逻辑版本：改变随机数消耗顺序或步内逻辑时加一，旧录像无法再精确回放
+    SIM_VERSION = 2
+    # 敌人血量条尺寸（像素，所有敌人统一长度）
+    HEALTH_BAR_WIDTH = 100
+    HEALTH_BAR_HEIGHT = 4
+
     def __init__(self, screen: pygame.Surface, page_manager):
         super().__init__(screen, page_manager)
         self.screen_width = screen.get_width()
         self.screen_height = screen.get_height()
         
         # 游戏基础配置
-        self.FPS = 60
+        self.FPS = EnemyStore.FRAME_RATE  # 敌人/子弹速度按该帧率下的每帧像素数标定
         self.CENTER_POS = (self.screen_width//2, self.screen_height//2)  # 玩家固定中心
-        self.MAX_ENEMIES = 8
-        self.BASE_SPAWN_INTERVAL = 2000
-        self.MIN_SPAWN_INTERVAL = 800
-        self.SPAWN_SPEEDUP_RATE = 50
-        self.BULLET_MAX_DISTANCE = 3000
-        self.RELOAD_TIME = 1200
+        self.MAX_ENEMIES = MAX_ENEMIES
+        self.BASE_SPAWN_INTERVAL = BASE_SPAWN_INTERVAL
+        self.MIN_SPAWN_INTERVAL = MIN_SPAWN_INTERVAL
+        self.SPAWN_SPEEDUP_RATE = SPAWN_SPEEDUP_RATE
+        self.BULLET_MAX_DISTANCE = BULLET_MAX_DISTANCE
+        self.RELOAD_TIME = RELOAD_TIME
         
         # 敌人生成距离（保持500-1500像素极远距）
-        self.MIN_SPAWN_DISTANCE = 500
-        self.MAX_SPAWN_DISTANCE = 1500
+        self.MIN_SPAWN_DISTANCE = MIN_SPAWN_DISTANCE
+        self.MAX_SPAWN_DISTANCE = MAX_SPAWN_DISTANCE
+        
+        # 敌人属性（默认取 config，难度扫描工具会逐项覆盖后调用 configure_spawns）
+        self.ENEMY_BASE_HEALTH = ENEMY_BASE_HEALTH
+        self.ENEMY_ELITE_HEALTH = ENEMY_ELITE_HEALTH
+        self.ENEMY_BASE_DAMAGE = ENEMY_BASE_DAMAGE
+        self.ENEMY_ELITE_DAMAGE = ENEMY_ELITE_DAMAGE
+        self.ENEMY_BASE_SPEED = ENEMY_BASE_SPEED
+        self.ENEMY_ELITE_SPEED_MULTIPLIER = ENEMY_ELITE_SPEED_MULTIPLIER
+        self.ENEMY_ELITE_CHANCE = ENEMY_ELITE_CHANCE
+        self.ENEMY_BURST_CHANCE = ENEMY_BURST_CHANCE
+        self.ENEMY_STRENGTH_INCREMENT = ENEMY_STRENGTH_INCREMENT
+        self.ENEMY_STRENGTH_INTERVAL = ENEMY_STRENGTH_INTERVAL
+        self.ENEMY_CONTACT_RADIUS = ENEMY_CONTACT_RADIUS
         
         # 颜色定义
         self.BLACK = (0, 0, 0)
@@ -41,7 +84,9 @@ class GamePage(BasePage):
         self.current_weapon_idx = 0  # 对应Player的current_weapon_index
         self.show_mode_tip = False
         self.tip_show_start_time = 0
-        self.game_start_time = pygame.time.get_ticks()
+        # 模拟时钟（毫秒）：只随固定步长推进，暂停时停止；游戏逻辑中的计时都以它为准
+        self.sim_time = 0.0
+        self.game_start_time = self.sim_time
         
         # 按键防抖：解决Q/E冲突（核心新增）
         self.last_q_time = 0
@@ -50,9 +95,24 @@ class GamePage(BasePage):
         self.debounce_time = 200  # 防抖时间（毫秒），避免长按连续触发
         
         # 初始化混音器
-        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+        pygame.mixer.init(frequency=MIXER_FREQUENCY, size=-16, channels=2, buffer=MIXER_BUFFER)
+        # 播放延迟探针（config.AUDIO_LATENCY_PROBE 开启时记录）
+        self.latency_probe = AudioLatencyProbe(frequency=pygame.mixer.get_init()[0])
+        # 按类别预留通道，避免高频射击挤掉敌人方位提示音
+        self.audio = AudioScheduler()
+        # 敌人持续方位音效（每帧刷新声像和距离衰减）
+        if AUDIO_MIXER_MODE == "software":
+            # 软件混音：所有敌人声源混成一个数据块，在单个通道上排队播放，不受通道数限制
+            self.soft_mixer = SoftMixer(self.audio.reserve_channel("enemy"))
+            enemy_voices = self.soft_mixer
+        else:
+            # 通道模式：每个敌人独占一个通道
+            self.soft_mixer = None
+            enemy_voices = self.audio
+        self.positional_audio = PositionalAudio(enemy_voices, self.CENTER_POS, self.screen_width)
         
-        # 音效合成（保留时长0.6秒+音量0.8）
+        # 音效合成（保留时长0.6秒+音量0.8），结果按参数缓存到磁盘，热启动跳过合成
+        self.sound_cache = SoundCache()
         self.sounds = self._generate_all_sounds()
         self.enemy_sounds = {
             "up": self._generate_enemy_sound("up"),
@@ -61,180 +121,48 @@ class GamePage(BasePage):
             "right": self._generate_enemy_sound("right")
         }
         
-        # -------------------------- 内部类 --------------------------
-        class Bullet:
-            def __init__(self, x, y, angle, speed, color, size, damage, parent):
-                self.x = x
-                self.y = y
-                self.speed_x = math.cos(angle) * speed
-                self.speed_y = math.sin(angle) * speed
-                self.color = color
-                self.size = size
-                self.damage = damage
-                self.flight_distance = 0
-                self.parent = parent
-            
-            def update(self):
-                self.x += self.speed_x
-                self.y += self.speed_y
-                self.flight_distance += math.hypot(self.speed_x, self.speed_y)
-                return (self.x < -100 or self.x > self.parent.screen_width + 100 or
-                        self.y < -100 or self.y > self.parent.screen_height + 100 or
-                        self.flight_distance > self.parent.BULLET_MAX_DISTANCE)
-            
-            def draw(self, screen):
-                pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.size)
-
-        class Enemy:
-            def __init__(self, parent):
-                self.parent = parent
-                self.spawn_distance = random.randint(parent.MIN_SPAWN_DISTANCE, parent.MAX_SPAWN_DISTANCE)
-                side = random.choice(["up", "down", "left", "right"])
-                self.side = side
-                
-                # 屏幕外极远处生成逻辑
-                if side == "up":
-                    self.x = random.randint(0, self.parent.screen_width)
-                    self.y = -self.spawn_distance  # 上方向外500-1500像素
-                elif side == "down":
-                    self.x = random.randint(0, self.parent.screen_width)
-                    self.y = self.parent.screen_height + self.spawn_distance  # 下方向外
-                elif side == "left":
-                    self.x = -self.spawn_distance  # 左方向外
-                    self.y = random.randint(0, self.parent.screen_height)
-                else:  # right
-                    self.x = self.parent.screen_width + self.spawn_distance  # 右方向外
-                    self.y = random.randint(0, self.parent.screen_height)
-                
-                # 敌人属性（屏幕外低速，屏幕内加速）
-                self.size = 35
-                self.is_elite = random.random() < 0.3
-                # 保存最大血量（用于计算百分比）
-                self.max_health = 350 if self.is_elite else 150
-                self.health = self.max_health  # 当前血量初始化为最大血量
-                self.base_speed = random.uniform(1, 1.5) * (1.2 if self.is_elite else 1.0)
-                self.speed = self.base_speed  # 初始速度=屏幕外低速
-                self.damage = 20 if self.is_elite else 12
-                self.hit_flash = False
-                self.flash_timer = 0
-                self.spawn_sound_played = False  # 控制仅播放一次
-                self.horizontal_offset = self.x - self.parent.CENTER_POS[0] if side in ["left", "right"] else self.y - self.parent.CENTER_POS[1]
-            
-            def update(self):
-                # 追踪玩家
-                dx = self.parent.CENTER_POS[0] - self.x
-                dy = self.parent.CENTER_POS[1] - self.y
-                dist = math.hypot(dx, dy)
-                
-                if dist > 5:
-                    # 屏幕外低速，屏幕内加速
-                    is_inside_screen = (self.x > -50 and self.x < self.parent.screen_width + 50 and
-                                       self.y > -50 and self.y < self.parent.screen_height + 50)
-                    
-                    if is_inside_screen:
-                        speed_multiplier = 1.8 * (1.2 if self.is_elite else 1.0)
-                    else:
-                        speed_multiplier = 1.0
-                    
-                    self.speed = self.base_speed * speed_multiplier
-                    self.x += (dx / dist) * self.speed
-                    self.y += (dy / dist) * self.speed
-                
-                # 击中闪烁
-                if self.hit_flash:
-                    self.flash_timer += 1
-                    if self.flash_timer > 3:
-                        self.hit_flash = False
-                        self.flash_timer = 0
-                
-                # 生成即播放音效（仅一次）
-                if not self.spawn_sound_played:
-                    self.parent._play_enemy_sound(self.side, self.horizontal_offset)
-                    self.spawn_sound_played = True
-            
-            def draw(self, screen):
-                color = self.parent.RED if self.is_elite else self.parent.ORANGE
-                if self.hit_flash:
-                    color = self.parent.WHITE
-                pygame.draw.circle(screen, color, (int(self.x), int(self.y)), self.size//2)
-                # 血量条：固定总长度100像素（所有敌人统一长度）
-                health_bar_total_width = 100  # 固定总长度
-                health_bar_height = 4
-                # 计算血量百分比（当前血量/最大血量）
-                health_ratio = self.health / self.max_health if self.max_health > 0 else 0
-                # 实际显示的血量条长度（按百分比计算）
-                health_bar_display_width = int(health_bar_total_width * health_ratio)
-                
-                # 绘制黑色背景条（总长度）
-                pygame.draw.rect(screen, self.parent.BLACK, 
-                                (int(self.x) - health_bar_total_width//2,  # 水平居中
-                                 int(self.y) + self.size//2 + 8, 
-                                 health_bar_total_width, health_bar_height))
-                # 绘制彩色血量条（实际长度）
-                health_color = self.parent.GREEN if health_ratio > 0.6 else self.parent.ORANGE if health_ratio > 0.3 else self.parent.RED
-                pygame.draw.rect(screen, health_color, 
-                                (int(self.x) - health_bar_total_width//2,  # 水平居中
-                                 int(self.y) + self.size//2 + 8, 
-                                 health_bar_display_width, health_bar_height))
-                # 精英怪标记
-                if self.is_elite:
-                    elite_surf = self.parent.small_font.render("精英", True, self.parent.WHITE)
-                    screen.blit(elite_surf, (int(self.x) - 15, int(self.y) - self.size//2 - 20))
-            
-            def is_reached_center(self):
-                return math.hypot(self.x - self.parent.CENTER_POS[0], self.y - self.parent.CENTER_POS[1]) < 40
-            
-            def take_damage(self, damage):
-                self.health -= damage
-                self.hit_flash = True
-                self.parent._play_sound("hit_enemy")
-                return self.health <= 0
-        
-        self.Bullet = Bullet
-        self.Enemy = Enemy
-        
         # -------------------------- 游戏状态 --------------------------
-        self.bullets = []
-        self.enemies = []
-        self.last_spawn_time = pygame.time.get_ticks()
-        self.last_fire_time = pygame.time.get_ticks()
+        # 敌人和子弹以结构化数组存储，每帧整体向量化更新
+        self.bullets = BulletStore(self.screen_width, self.screen_height, self.BULLET_MAX_DISTANCE)
+        self.enemies = EnemyStore(self.CENTER_POS, self.screen_width, self.screen_height)
+        # 预渲染的实体精灵，每帧收集到批次里一次绘制
+        self.sprites = SpriteAtlas(self.HEALTH_BAR_WIDTH, self.HEALTH_BAR_HEIGHT, self.BLACK)
+        self._sprite_batch = []  # 本帧待绘制的 (Surface, 位置)
+        self.hud = self._build_hud()
+        self.collision_grid = SpatialHash(COLLISION_CELL_SIZE)
+        self.last_fire_time = self.sim_time
+        # 敌人生成、掉落等随机数按子系统分流，相同种子可复现整局
+        self.rng = RngStreams()
+        # 敌人生成时间线（难度曲线 + 可选脚本波次），每局开始时重新排入
+        self.spawn_waves = load_waves(SPAWN_WAVES_FILE) if SPAWN_WAVES_FILE else ([], True)
+        self.configure_spawns()
         self.game_score = 0
+        self.kill_count = 0
+        self.shots_fired = 0
         self.game_over = False
         self.is_reloading = False
         self.reload_start_time = 0
         
-        # 按键状态（仅保留功能按键，新增实时检测相关）
-        self.mouse_left_held = False
+        # 输入源：每个模拟步取一次 TickInput（实时输入 / 录像回放 / 机器人），游戏逻辑只读它
+        self.input_source = LiveInput()
+        self.recorder = None  # 录制中的 InputRecorder
+        self.replay_finished = False
         
-        # 数据库实例
+        # 数据库实例（无界面批量模拟时关闭结算存档）
         self.db = DBUtils()
+        self.persist_results = True
 
     # -------------------------- 音效合成方法 --------------------------
+    def _synth_cached_wave(self, freq_start, freq_end, duration, volume=0.5, wave_type="square"):
+        params = {
+            "freq_start": freq_start, "freq_end": freq_end, "duration": duration,
+            "volume": volume, "wave_type": wave_type, "sample_rate": SAMPLE_RATE
+        }
+        return self.sound_cache.get_or_synth("wave", params, synth_wave)
+
     def _generate_sound(self, freq_start, freq_end, duration, volume=0.5, wave_type="square"):
-        sample_rate = 44100
-        num_samples = int(sample_rate * duration)
-        samples = []
-        
-        for i in range(num_samples):
-            t = i / sample_rate
-            freq = freq_start + (freq_end - freq_start) * (t / duration)
-            
-            if wave_type == "square":
-                value = 32767 if math.sin(2 * math.pi * freq * t) > 0 else -32768
-            elif wave_type == "sawtooth":
-                value = int(32767 * (2 * (t * freq - math.floor(t * freq + 0.5))))
-            elif wave_type == "sine":
-                value = int(32767 * math.sin(2 * math.pi * freq * t))
-            else:
-                value = 0
-            
-            decay = 1.0 - (t / duration)
-            value = int(value * volume * decay)
-            samples.append(value.to_bytes(2, byteorder='little', signed=True))
-        
-        sound_data = b''.join(samples)
-        sound = pygame.mixer.Sound(buffer=sound_data)
-        return sound
+        samples = self._synth_cached_wave(freq_start, freq_end, duration, volume=volume, wave_type=wave_type)
+        return to_sound(samples)
 
     def _generate_all_sounds(self):
         return {
@@ -251,30 +179,14 @@ class GamePage(BasePage):
         }
 
     def _generate_reload_sound(self):
-        sound1 = self._generate_sound(600, 400, 0.2, volume=0.5, wave_type="sawtooth")
-        sound2 = self._generate_sound(800, 1000, 0.1, volume=0.6, wave_type="sawtooth")
-        samples1 = pygame.sndarray.array(sound1)
-        samples2 = pygame.sndarray.array(sound2)
-        combined_samples = numpy.concatenate([samples1, samples2])
-        return pygame.mixer.Sound(combined_samples)
+        # 两段采样直接拼接，无需 sndarray 往返
+        samples1 = self._synth_cached_wave(600, 400, 0.2, volume=0.5, wave_type="sawtooth")
+        samples2 = self._synth_cached_wave(800, 1000, 0.1, volume=0.6, wave_type="sawtooth")
+        return to_sound(concat_waves(samples1, samples2))
 
     def _generate_player_hit_sound(self):
-        sample_rate = 44100
-        duration = 0.2
-        num_samples = int(sample_rate * duration)
-        samples = []
-        
-        for i in range(num_samples):
-            t = i / sample_rate
-            sine1 = math.sin(2 * math.pi * 440 * t)
-            sine2 = math.sin(2 * math.pi * 880 * t)
-            value = int(32767 * (sine1 + sine2) * 0.2)
-            decay = 1.0 - (t / duration)
-            value = int(value * decay)
-            samples.append(value.to_bytes(2, byteorder='little', signed=True))
-        
-        sound_data = b''.join(samples)
-        return pygame.mixer.Sound(buffer=sound_data)
+        params = {"freqs": [440, 880], "duration": 0.2, "gain": 0.2, "sample_rate": SAMPLE_RATE}
+        return to_sound(self.sound_cache.get_or_synth("mixed_sines", params, synth_mixed_sines))
 
     def _generate_enemy_sound(self, side):
         """敌人音效：时长0.6秒+音量0.8（保留之前优化）"""
@@ -291,28 +203,43 @@ class GamePage(BasePage):
     def _play_sound(self, sound_key):
         sound = self.sounds.get(sound_key)
         if sound:
-            sound.play(maxtime=0)
+            # 同一帧内相同音效只播放一次
+            category = AUDIO_SOUND_CATEGORIES.get(sound_key, "ui")
+            channel = self.audio.play(sound, category, key=sound_key)
+            # 记录请求时刻，通道播完后由 latency_probe.poll() 实测延迟
+            self.latency_probe.record(sound_key, channel is not None, channel=channel, sound=sound)
 
-    def _play_enemy_sound(self, side, horizontal_offset):
-        """敌人生成即播放音效（仅一次，立体声定位）"""
+    def _play_enemy_sound(self, index):
+        """敌人生成即循环播放方位音效（独占通道，音量由 _update_enemy_sounds 每帧刷新）"""
+        enemies = self.enemies
+        side = SIDES[enemies.side[index]]
         sound = self.enemy_sounds.get(side)
         if not sound:
             return
-        
-        if side in ["left", "right"]:
-            max_offset = self.screen_width // 2
-            pan = max(-1.0, min(1.0, horizontal_offset / max_offset))
-        else:  # up/down
-            max_offset = self.screen_height // 2
-            pan = max(-1.0, min(1.0, horizontal_offset / max_offset)) * 0.5
-        
-        # 音量保持0.6（边缘）-0.9（中间），确保清晰可闻
-        volume = 0.6 if abs(pan) > 0.8 else 0.9
-        sound.set_volume(volume)
-        channel = sound.play(maxtime=0)
-        if channel:
-            channel.set_volume(1.0 - abs(pan) if pan < 0 else 1.0,
-                               1.0 - abs(pan) if pan > 0 else 1.0)
+        voice = self.positional_audio.attach(int(enemies.ids[index]), sound, enemies.x[index], enemies.y[index])
+        # 软件混音时新声源要等前面已排队的数据块播完
+        queued_frames = self.soft_mixer.queued_blocks() * self.soft_mixer.block_size if self.soft_mixer else 0
+        self.latency_probe.record(f"enemy_{side}", voice is not None, queued_frames)
+
+    def _stop_enemy_sound(self, index):
+        self.positional_audio.detach(int(self.enemies.ids[index]))
+
+    @profiled("update.sounds")
+    def _update_enemy_sounds(self):
+        """新敌人绑定方位音效，所有敌人的声像和距离衰减一次批量计算"""
+        enemies = self.enemies
+        n = enemies.count
+        for index in numpy.flatnonzero(~enemies.sound_bound[:n]).tolist():
+            self._play_enemy_sound(index)
+        enemies.sound_bound[:n] = True
+        self.positional_audio.update(enemies.ids[:n].tolist(), enemies.x[:n], enemies.y[:n])
+        if self.soft_mixer:
+            self.soft_mixer.pump()
+
+    def _stop_all_enemy_sounds(self):
+        """停止全部方位音效；敌人仍存活时，回到游戏后重新绑定"""
+        self.positional_audio.clear()
+        self.enemies.sound_bound[:self.enemies.count] = False
 
     # -------------------------- 核心联动（完全适配你的 Player 类）--------------------------
     def get_equipped_weapons(self):
@@ -356,34 +283,130 @@ class GamePage(BasePage):
         if next_idx != current_idx:
             player.switch_weapon(next_idx)
             self._play_sound("switch_weapon")
-        self.last_fire_time = pygame.time.get_ticks()
+        self.last_fire_time = self.sim_time
 
     # -------------------------- 游戏核心逻辑 --------------------------
+    def configure_spawns(self):
+        """按当前的生成/敌人属性重建生成时间线（修改这些属性后调用，下一局生效）"""
+        waves, procedural = self.spawn_waves
+        self.spawn_scheduler = SpawnScheduler(
+            self.rng.stream("spawn"), self.screen_width, self.screen_height,
+            self.BASE_SPAWN_INTERVAL, self.MIN_SPAWN_INTERVAL, self.SPAWN_SPEEDUP_RATE,
+            self.MIN_SPAWN_DISTANCE, self.MAX_SPAWN_DISTANCE,
+            burst_chance=self.ENEMY_BURST_CHANCE, elite_chance=self.ENEMY_ELITE_CHANCE,
+            speed_range=self.ENEMY_BASE_SPEED, waves=waves, procedural=procedural
+        )
+        self.spawn_scheduler.reset(start_time=self.sim_time)
+
     def get_dynamic_spawn_interval(self):
-        game_duration = (pygame.time.get_ticks() - self.game_start_time) / 1000
-        speedup_amount = game_duration * self.SPAWN_SPEEDUP_RATE
-        spawn_interval = self.BASE_SPAWN_INTERVAL - speedup_amount
-        return max(self.MIN_SPAWN_INTERVAL, spawn_interval)
+        return self.spawn_scheduler.interval_at(self.sim_time)
+
+    def _loadout(self) -> dict:
+        """当前装备（写入录像，回放前恢复）"""
+        player = self.current_user.player
+        return {
+            "weapons": [weapon.to_dict() if weapon else None for weapon in player.weapons],
+            "weapon_index": player.current_weapon_index
+        }
+
+    def start_recording(self, seed: int | None = None, tick_rate: int = SIM_TICK_RATE):
+        """以新种子开局并开始逐步记录输入"""
+        self.set_seed(seed)
+        self.reset_game()
+        self.recorder = InputRecorder(self.rng.seed, tick_rate,
+                                      {"loadout": self._loadout(), "sim_version": self.SIM_VERSION})
+
+    def stop_recording(self, path: str | None = None) -> str | None:
+        """结束录制并保存录像（附带结算结果，供回放校验），返回文件路径"""
+        if not self.recorder:
+            return None
+        if path is None:
+            path = os.path.join(REPLAY_DIR, f"replay_{datetime.now().strftime('%Y%m%d_%H%M%S')}.sgr")
+        replay = self.recorder.to_replay(self.match_result())
+        self.recorder = None
+        try:
+            replay.save(path)
+        except OSError as e:
+            print(f"❌ 录像保存失败：{e}")
+            return None
+        print(f"✅ 录像已保存：{path}（{len(replay)} 步）")
+        return path
+
+    def start_replay(self, replay):
+        """恢复录像的种子和装备后开局，之后每步输入都来自录像"""
+        player = self.current_user.player
+        loadout = replay.meta.get("loadout", {})
+        for slot, weapon_data in enumerate(loadout.get("weapons", [])):
+            player.weapons[slot] = Weapon.from_dict(weapon_data) if weapon_data else None
+        player.current_weapon_index = loadout.get("weapon_index", 0)
+        self.recorder = None
+        self.set_seed(replay.seed)
+        self.reset_game()
+        self.input_source = ReplayInput(replay)
+        self.replay_finished = False
+
+    def match_result(self) -> dict:
+        return {
+            "sim_time": self.sim_time,
+            "score": self.game_score,
+            "kills": self.kill_count,
+            "shots": self.shots_fired,
+            "hp": self.current_user.player.current_hp if self.current_user else 0,
+            "game_over": self.game_over
+        }
+
+    def set_seed(self, seed: int | None = None):
+        """重新设定随机种子（下一局起生效，配合 reset_game 使用）"""
+        self.rng = RngStreams(seed)
 
+    @profiled("update.step.spawn")
     def spawn_enemy(self):
-        current_time = pygame.time.get_ticks()
-        spawn_interval = self.get_dynamic_spawn_interval()
-        burst_spawn = random.random() < 0.1
-        max_spawn = 2 if burst_spawn else 1
-        
-        if (current_time - self.last_spawn_time > spawn_interval and 
-            len(self.enemies) < self.MAX_ENEMIES and not self.game_over and not self.is_paused):
-            for _ in range(max_spawn):
-                if len(self.enemies) < self.MAX_ENEMIES:
-                    self.enemies.append(self.Enemy(self))  # 生成敌人时自动播放音效
-            self.last_spawn_time = current_time
+        """弹出时间线上已到期的生成事件；场上敌人已满时事件保留，等有空位再生成"""
+        if self.game_over or self.is_paused:
+            return
+        scheduler = self.spawn_scheduler
+        while scheduler.is_due(self.sim_time) and len(self.enemies) < self.MAX_ENEMIES:
+            event = scheduler.pop(self.sim_time)
+            spawned = min(len(event.enemies), self.MAX_ENEMIES - len(self.enemies))
+            for spawn in event.enemies[:spawned]:
+                self._spawn_single_enemy(spawn)  # 下一次更新时绑定方位音效
+            scheduler.requeue(event, spawned, self.sim_time)  # 放不下的敌人留在时间线上，不丢弃
+
+    def _spawn_single_enemy(self, spawn):
+        """按时间线中预先抽好的位置和属性生成一个敌人（屏幕外500-1500像素的极远处）"""
+        # 敌人属性（屏幕外低速，屏幕内加速），血量和伤害按对局时长分阶段增强
+        is_elite = spawn.is_elite
+        stage = int((self.sim_time - self.game_start_time) // self.ENEMY_STRENGTH_INTERVAL)
+        strength = 1 + self.ENEMY_STRENGTH_INCREMENT * stage
+        self.enemies.spawn(
+            x=spawn.x, y=spawn.y, side=spawn.side, is_elite=is_elite,
+            max_health=(self.ENEMY_ELITE_HEALTH if is_elite else self.ENEMY_BASE_HEALTH) * strength,
+            base_speed=spawn.speed_roll * (self.ENEMY_ELITE_SPEED_MULTIPLIER if is_elite else 1.0),
+            damage=round((self.ENEMY_ELITE_DAMAGE if is_elite else self.ENEMY_BASE_DAMAGE) * strength)
+        )
+
+    def fast_forward(self, tick_ms: float, max_ticks: int) -> int:
+        """无界面快进：场上没有敌人和子弹、也不在换弹时，直接跳到下一次生成事件到期的前一步
+
+        跳过的步里不会发生任何事（机器人没有目标时不按键），只推进模拟时钟（逐步累加，与逐步运行结果一致）。
+        返回跳过的步数（最多 max_ticks 步）；录制或实时输入时不要调用。
+        """
+        if (self.game_over or self.is_paused or self.is_reloading or
+                len(self.enemies) or len(self.bullets) or self.spawn_scheduler.next_time() is None):
+            return 0
+        scheduler = self.spawn_scheduler
+        skipped = 0
+        while skipped < max_ticks and not scheduler.is_due(self.sim_time + tick_ms):
+            self.sim_time += tick_ms
+            skipped += 1
+        return skipped
 
     def fire_bullet(self, mouse_pos):
         current_weapon = self.get_current_weapon()
         if not current_weapon or self.game_over or self.is_reloading or self.is_paused:
             return
         
-        current_time = pygame.time.get_ticks()
+        current_time = self.sim_time
         fire_interval = current_weapon.get_fire_interval()
         if current_time - self.last_fire_time < fire_interval:
             return
@@ -393,13 +416,14 @@ class GamePage(BasePage):
             return
         
         angle = math.atan2(mouse_pos[1] - self.CENTER_POS[1], mouse_pos[0] - self.CENTER_POS[0])
-        self.bullets.append(self.Bullet(
+        self.bullets.spawn(
             x=self.CENTER_POS[0], y=self.CENTER_POS[1],
             angle=angle, speed=current_weapon.bullet_speed,
             color=current_weapon.color, size=current_weapon.bullet_size,
-            damage=current_weapon.damage, parent=self
-        ))
+            damage=current_weapon.damage
+        )
         
+        self.shots_fired += 1
         self._play_sound("gun_shot")
         self.last_fire_time = current_time
 
@@ -408,14 +432,13 @@ class GamePage(BasePage):
         if not current_weapon or self.is_reloading or current_weapon.current_ammo <= 0 or self.is_paused:
             return
         self.is_reloading = True
-        self.reload_start_time = pygame.time.get_ticks()
+        self.reload_start_time = self.sim_time
         self._play_sound("reload")
 
     def update_reload(self):
         if not self.is_reloading or self.is_paused:
             return
-        current_time = pygame.time.get_ticks()
-        if current_time - self.reload_start_time >= self.RELOAD_TIME:
+        if self.sim_time - self.reload_start_time >= self.RELOAD_TIME:
             current_weapon = self.get_current_weapon()
             current_weapon.reload()
             self.is_reloading = False
@@ -426,53 +449,89 @@ class GamePage(BasePage):
         current_weapon = self.get_current_weapon()
         if current_weapon.switch_mode():
             self._play_sound("switch_mode")
-        self.last_fire_time = pygame.time.get_ticks()
+        self.last_fire_time = self.sim_time
 
+    @profiled("update.step.collisions")
     def check_collisions(self):
-        hit_bullets = []
-        hit_enemies = []
-        
-        for bullet_idx, bullet in enumerate(self.bullets):
-            for enemy_idx, enemy in enumerate(self.enemies):
-                if math.hypot(bullet.x - enemy.x, bullet.y - enemy.y) < (enemy.size//2) + bullet.size:
-                    hit_bullets.append(bullet_idx)
-                    if enemy.take_damage(bullet.damage):
-                        hit_enemies.append(enemy_idx)
-                        self.game_score += 200 if enemy.is_elite else 80
-                        self.random_reload_ammo(enemy.is_elite)
-                        self._play_sound("enemy_death")
-        
-        for idx in reversed(hit_bullets):
-            if idx < len(self.bullets):
-                del self.bullets[idx]
-        for idx in reversed(hit_enemies):
-            if idx < len(self.enemies):
-                del self.enemies[idx]
+        bullets = self.bullets
+        enemies = self.enemies
+        if bullets.count == 0 or enemies.count == 0:
+            return
+        nb, ne = bullets.count, enemies.count
+
+        # 网格宽相 + 扫掠检测：子弹本帧整条轨迹与敌人相对运动求交，高速子弹和大步长也不会穿透
+        hit_bullets, hit_enemies = find_bullet_hits(
+            self.collision_grid,
+            bullets.prev_x[:nb], bullets.prev_y[:nb], bullets.x[:nb], bullets.y[:nb], bullets.size[:nb],
+            enemies.x[:ne], enemies.y[:ne], enemies.size[:ne] // 2,
+            enemies.x[:ne] - enemies.prev_x[:ne], enemies.y[:ne] - enemies.prev_y[:ne]
+        )
+        if hit_bullets.size == 0:
+            return
+
+        dead = numpy.zeros(ne, dtype=bool)
+        spent_bullets = []
+        last_bullet = -1
+        for bullet_idx, enemy_idx in zip(hit_bullets.tolist(), hit_enemies.tolist()):
+            # 每颗子弹只结算一次；轨迹上最先碰到的敌人本帧已死亡时，顺延到下一个候选
+            if bullet_idx == last_bullet or dead[enemy_idx]:
+                continue
+            last_bullet = bullet_idx
+            spent_bullets.append(bullet_idx)
+            if self._damage_enemy(enemy_idx, bullets.damage[bullet_idx]):
+                dead[enemy_idx] = True
+                self.kill_count += 1
+                is_elite = bool(enemies.is_elite[enemy_idx])
+                self.game_score += 200 if is_elite else 80
+                self.random_reload_ammo(is_elite)
+                self._play_sound("enemy_death")
+
+        bullets.remove_indices(spent_bullets)
+        dead_indices = numpy.flatnonzero(dead)
+        for enemy_idx in dead_indices.tolist():
+            self._stop_enemy_sound(enemy_idx)
+        enemies.remove_indices(dead_indices)
+
+    def _damage_enemy(self, index, damage):
+        """敌人受击：扣血+闪烁+命中音效，返回是否死亡"""
+        enemies = self.enemies
+        enemies.health[index] -= damage
+        enemies.hit_flash[index] = True
+        self._play_sound("hit_enemy")
+        return enemies.health[index] <= 0
 
     def random_reload_ammo(self, is_elite):
         current_weapon = self.get_current_weapon()
         max_reload = math.ceil(current_weapon.clip_capacity * 0.5) if is_elite else math.ceil(current_weapon.clip_capacity * 0.2)
-        reload_amount = random.randint(1, max_reload)
+        reload_amount = self.rng.stream("loot").randint(1, max_reload)
         current_weapon.current_ammo += reload_amount
         current_weapon.current_ammo = min(current_weapon.current_ammo, current_weapon.total_ammo * 2)
 
+    @profiled("update.step.damage")
     def check_enemy_damage(self):
         """适配 Player 的 take_damage 和 current_hp 属性"""
         if self.game_over or self.is_paused or not self.current_user:
             return
         player = self.current_user.player
-        for enemy in self.enemies[:]:
-            if enemy.is_reached_center():
-                self.enemies.remove(enemy)
-                # 调用 Player 的 take_damage 方法
-                player.take_damage(enemy.damage)
-                self._play_sound("player_hit")
-                # 判断是否死亡（current_hp <= 0）
-                if player.current_hp <= 0:
-                    self.game_over = True
-                    self.current_user.add_score(self.game_score)
-                    self.current_user.save_to_db()
-                    self._play_sound("game_over")
+        enemies = self.enemies
+        reached = numpy.flatnonzero(enemies.reached_center(self.ENEMY_CONTACT_RADIUS))
+        if reached.size == 0:
+            return
+        for index in reached.tolist():
+            self._stop_enemy_sound(index)
+            # 调用 Player 的 take_damage 方法
+            player.take_damage(int(enemies.damage[index]))
+            self._play_sound("player_hit")
+            # 判断是否死亡（current_hp <= 0），只结算一次
+            if player.current_hp <= 0 and not self.game_over:
+                self.game_over = True
+                self._stop_all_enemy_sounds()
+                self.current_user.add_score(self.game_score)
+                if self.persist_results:
+                    with profiler.section("update.step.save_db"):
+                        self.current_user.save_to_db()
+                self._play_sound("game_over")
+        enemies.remove_indices(reached)
 
     def reset_game(self):
         """适配 Player 的 reset 方法"""
@@ -480,14 +539,19 @@ class GamePage(BasePage):
             player = self.current_user.player
             player.reset()  # Player 类的 reset 方法已重置 current_hp 和武器
         self.game_score = 0
+        self.kill_count = 0
+        self.shots_fired = 0
         self.game_over = False
         self.is_paused = False
         self.is_reloading = False
+        self.positional_audio.clear()
+        self.positional_audio.set_paused(False)
         self.bullets.clear()
         self.enemies.clear()
-        self.last_spawn_time = pygame.time.get_ticks()
-        self.last_fire_time = pygame.time.get_ticks()
-        self.game_start_time = pygame.time.get_ticks()
+        self.sim_time = 0.0
+        self.last_fire_time = self.sim_time
+        self.game_start_time = self.sim_time
+        self.spawn_scheduler.reset(self.rng.stream("spawn"), self.sim_time)
         self.show_mode_tip = False
         # 重置防抖时间
         self.last_q_time = 0
@@ -495,12 +559,10 @@ class GamePage(BasePage):
         self.last_r_time = 0
 
     # -------------------------- 实时按键检测（核心新增，解决冲突）--------------------------
-    def check_real_time_keys(self, current_time):
-        """实时检测Q/E/R按键，避免冲突"""
-        keys = pygame.key.get_pressed()
-        
+    def check_real_time_keys(self, current_time, held):
+        """实时检测Q/E/R按键，避免冲突（held 为本步 TickInput 的按住状态位）"""
         # 1. 换弹（R键，防抖）
-        if keys[pygame.K_r] and (current_time - self.last_r_time > self.debounce_time):
+        if held & HOLD_R and (current_time - self.last_r_time > self.debounce_time):
             self.start_reload()
             # 互斥保护：防止同时触发Q/E
             self.last_q_time = current_time
@@ -508,7 +570,7 @@ class GamePage(BasePage):
             self.last_r_time = current_time
         
         # 2. 武器切换（Q键，防抖）
-        if keys[pygame.K_q] and (current_time - self.last_q_time > self.debounce_time):
+        if held & HOLD_Q and (current_time - self.last_q_time > self.debounce_time):
             self.switch_weapon()
             # 互斥保护：防止同时触发E/R
             self.last_q_time = current_time
@@ -516,103 +578,237 @@ class GamePage(BasePage):
             self.last_r_time = current_time
         
         # 3. 模式切换（E键，防抖）
-        if keys[pygame.K_e] and (current_time - self.last_e_time > self.debounce_time):
+        if held & HOLD_E and (current_time - self.last_e_time > self.debounce_time):
             self.switch_fire_mode()
             # 互斥保护：防止同时触发Q/R
             self.last_e_time = current_time
             self.last_q_time = current_time
             self.last_r_time = current_time
 
+    # -------------------------- 实体绘制 --------------------------
+    def _interpolated_positions(self, store):
+        """在上一步与当前步的位置之间按 render_alpha 插值（暂停/结束时直接取当前位置）"""
+        n = store.count
+        if self.is_paused or self.game_over:
+            return store.x[:n].astype(int), store.y[:n].astype(int)
+        alpha = self.render_alpha
+        xs = store.prev_x[:n] + (store.x[:n] - store.prev_x[:n]) * alpha
+        ys = store.prev_y[:n] + (store.y[:n] - store.prev_y[:n]) * alpha
+        return xs.astype(int), ys.astype(int)
+
+    def _visible(self, xs, ys, reach):
+        """完全在屏幕外（留出 reach 像素的绘制范围）的实体不画，返回可见实体的下标"""
+        return numpy.flatnonzero((xs + reach > 0) & (xs - reach < self.screen_width) &
+                                 (ys + reach > 0) & (ys - reach < self.screen_height))
+
+    @profiled("draw.bullets")
+    def draw_bullets(self):
+        bullets = self.bullets
+        n = bullets.count
+        if n == 0:
+            return
+        xs, ys = self._interpolated_positions(bullets)
+        sizes = bullets.size[:n]
+        visible = self._visible(xs, ys, sizes)
+        disc = self.sprites.disc
+        batch = self._sprite_batch
+        for x, y, size, color in zip(xs[visible].tolist(), ys[visible].tolist(), sizes[visible].tolist(),
+                                     bullets.color[:n][visible].tolist()):
+            batch.append((disc(color, size), (x - size, y - size)))
+
+    @profiled("draw.enemies")
+    def draw_enemies(self):
+        enemies = self.enemies
+        n = enemies.count
+        if n == 0:
+            return
+        xs, ys = self._interpolated_positions(enemies)
+        sizes = enemies.size[:n]
+        # 绘制范围：本体半径 + 上方精英标记 / 下方血量条，且不小于血量条的半宽
+        visible = self._visible(xs, ys, numpy.maximum(sizes // 2 + 20, self.HEALTH_BAR_WIDTH // 2))
+        # 血量条：固定总长度（所有敌人统一长度），按血量百分比显示
+        health = enemies.health[:n][visible]
+        max_health = enemies.max_health[:n][visible]
+        health_ratio = numpy.where(max_health > 0, health / numpy.where(max_health > 0, max_health, 1), 0)
+        bar_widths = (self.HEALTH_BAR_WIDTH * health_ratio).astype(int).tolist()
+
+        disc = self.sprites.disc
+        health_bar = self.sprites.health_bar
+        batch = self._sprite_batch
+        rows = zip(xs[visible].tolist(), ys[visible].tolist(),
+                   sizes[visible].tolist(), enemies.is_elite[:n][visible].tolist(),
+                   enemies.hit_flash[:n][visible].tolist(), health_ratio.tolist(), bar_widths)
+        for x, y, size, is_elite, hit_flash, ratio, bar_width in rows:
+            color = self.WHITE if hit_flash else self.RED if is_elite else self.ORANGE
+            radius = size//2
+            batch.append((disc(color, radius), (x - radius, y - radius)))
+            # 黑色背景条（总长度）+ 彩色血量条（实际长度），水平居中
+            health_color = self.GREEN if ratio > 0.6 else self.ORANGE if ratio > 0.3 else self.RED
+            batch.append((health_bar(bar_width, health_color), (x - self.HEALTH_BAR_WIDTH//2, y + radius + 8)))
+            # 精英怪标记
+            if is_elite:
+                batch.append((self.render_text(self.small_font, "精英", True, self.WHITE), (x - 15, y - radius - 20)))
+
+    @profiled("draw.blits")
+    def _blit_sprites(self):
+        """子弹和敌人的精灵一次性批量绘制"""
+        self.screen.blits(self._sprite_batch, doreturn=False)
+        self._sprite_batch.clear()
+
     # -------------------------- UI绘制（完全适配 Player 类）--------------------------
-    def draw_ui(self):
+    def _build_hud(self) -> RetainedHud:
+        """注册HUD控件：每个控件绑定它显示的值，值变化时才重新渲染"""
         font_small = self.small_font
         font_medium = self.medium_font
-        
-        score_surf = font_medium.render(f"得分: {self.game_score}", True, self.YELLOW)
-        self.screen.blit(score_surf, (20, 20))
-        if self.current_user:
-            total_surf = font_medium.render(f"总得分: {self.current_user.total_score}", True, self.GREEN)
-            self.screen.blit(total_surf, (20, 50))
-        
-        if self.current_user and hasattr(self.current_user, "player"):
-            player = self.current_user.player
-            # 适配 Player 的 current_hp 属性
-            health = player.current_hp
-            health_color = self.GREEN if health > 60 else self.ORANGE if health > 30 else self.RED
-            health_surf = font_medium.render(f"血量: {health}/{player.max_hp}", True, health_color)
-            self.screen.blit(health_surf, (self.screen_width - 180, 20))
-            health_bar_width = 200
-            health_bar_height = 10
-            pygame.draw.rect(self.screen, self.BLACK, (self.screen_width - 200, 55, health_bar_width, health_bar_height))
-            # 计算血量条长度（按比例）
-            health_bar_length = int(health_bar_width * (health / player.max_hp))
-            pygame.draw.rect(self.screen, health_color, (self.screen_width - 200, 55, health_bar_length, health_bar_height))
-        
-        current_weapon = self.get_current_weapon()
-        weapon_surf = font_medium.render(
-            f"{current_weapon.name} | {current_weapon.active_mode.upper()} | 弹夹: {current_weapon.current_clip}/{current_weapon.clip_capacity} | 备用: {current_weapon.current_ammo}",
-            True, current_weapon.color
-        )
-        self.screen.blit(weapon_surf, (self.screen_width//2 - 450, 20))
-        
-        if self.is_reloading:
-            reload_progress = min(1.0, (pygame.time.get_ticks() - self.reload_start_time) / self.RELOAD_TIME)
-            reload_surf = font_medium.render(f"换弹中... {int(reload_progress*100)}%", True, self.ORANGE)
-            self.screen.blit(reload_surf, (self.screen_width//2 - 100, self.screen_height - 60))
-        
-        game_duration = int((pygame.time.get_ticks() - self.game_start_time) / 1000)
-        difficulty_text = f"游戏时长: {game_duration}秒 | 敌人强度: {'高' if game_duration > 60 else '中等'}"
-        difficulty_surf = font_small.render(difficulty_text, True, self.ORANGE)
-        self.screen.blit(difficulty_surf, (20, self.screen_height - 30))
-        
-        if self.is_paused:
-            pause_surf = font_medium.render("游戏暂停（P键继续）", True, self.RED)
-            self.screen.blit(pause_surf, (self.screen_width//2 - 120, self.screen_height//2))
-        elif self.game_over:
-            over_surf = font_medium.render(f"游戏结束！得分: {self.game_score}", True, self.RED)
-            restart_surf = font_small.render("SPACE重启 | ESC返回", True, self.WHITE)
-            self.screen.blit(over_surf, (self.screen_width//2 - 120, self.screen_height//2 - 30))
-            self.screen.blit(restart_surf, (self.screen_width//2 - 100, self.screen_height//2 + 20))
-        
+        hud = RetainedHud()
+        hud.add("score", lambda: self.game_score,
+                lambda score: [(self.render_text(font_medium, f"得分: {score}", True, self.YELLOW), (20, 20))])
+        hud.add("total_score", lambda: self.current_user.total_score if self.current_user else None,
+                lambda total: [(self.render_text(font_medium, f"总得分: {total}", True, self.GREEN), (20, 50))])
+        hud.add("health", self._hud_health, self._render_hud_health)
+        hud.add("weapon", self._hud_weapon,
+                lambda weapon: [(self.render_text(font_medium,
+                    f"{weapon[0]} | {weapon[1].upper()} | 弹夹: {weapon[2]}/{weapon[3]} | 备用: {weapon[4]}",
+                    True, weapon[5]
+                ), (self.screen_width//2 - 450, 20))])
+        hud.add("reload", self._hud_reload,
+                lambda percent: [(self.render_text(font_medium, f"换弹中... {percent}%", True, self.ORANGE),
+                                  (self.screen_width//2 - 100, self.screen_height - 60))])
+        hud.add("duration", lambda: int((self.sim_time - self.game_start_time) / 1000),
+                lambda duration: [(self.render_text(font_small,
+                    f"游戏时长: {duration}秒 | 敌人强度: {'高' if duration > 60 else '中等'}", True, self.ORANGE
+                ), (20, self.screen_height - 30))])
+        hud.add("status", self._hud_status, self._render_hud_status)
         # 控制提示（移除移动相关按键）
-        control_surf = font_small.render("Q切换武器 | E切换模式 | R换弹 | P暂停 | 鼠标射击", True, self.WHITE)
-        self.screen.blit(control_surf, (self.screen_width//2 - 250, self.screen_height - 30))
+        hud.add("controls", lambda: True,
+                lambda _: [(self.render_text(font_small, "Q切换武器 | E切换模式 | R换弹 | P暂停 | 鼠标射击", True, self.WHITE),
+                            (self.screen_width//2 - 250, self.screen_height - 30))])
+        return hud
+
+    def _hud_health(self):
+        if not self.current_user or not hasattr(self.current_user, "player"):
+            return None
+        # 适配 Player 的 current_hp 属性
+        player = self.current_user.player
+        return player.current_hp, player.max_hp
+
+    def _render_hud_health(self, value) -> list:
+        health, max_hp = value
+        health_color = self.GREEN if health > 60 else self.ORANGE if health > 30 else self.RED
+        health_surf = self.render_text(self.medium_font, f"血量: {health}/{max_hp}", True, health_color)
+        health_bar_width = 200
+        health_bar_height = 10
+        bar_surf = pygame.Surface((health_bar_width, health_bar_height))
+        bar_surf.fill(self.BLACK)
+        # 计算血量条长度（按比例）
+        health_bar_length = int(health_bar_width * (health / max_hp))
+        if health_bar_length > 0:
+            bar_surf.fill(health_color, (0, 0, health_bar_length, health_bar_height))
+        return [(health_surf, (self.screen_width - 180, 20)), (bar_surf, (self.screen_width - 200, 55))]
+
+    def _hud_weapon(self):
+        weapon = self.get_current_weapon()
+        if not weapon:
+            return None
+        return (weapon.name, weapon.active_mode, weapon.current_clip, weapon.clip_capacity,
+                weapon.current_ammo, tuple(weapon.color))
+
+    def _hud_reload(self):
+        if not self.is_reloading:
+            return None
+        return int(min(1.0, (self.sim_time - self.reload_start_time) / self.RELOAD_TIME) * 100)
+
+    def _hud_status(self):
+        if self.is_paused:
+            return "paused"
+        return ("over", self.game_score) if self.game_over else None
+
+    def _render_hud_status(self, status) -> list:
+        if status == "paused":
+            pause_surf = self.render_text(self.medium_font, "游戏暂停（P键继续）", True, self.RED)
+            return [(pause_surf, (self.screen_width//2 - 120, self.screen_height//2))]
+        over_surf = self.render_text(self.medium_font, f"游戏结束！得分: {status[1]}", True, self.RED)
+        restart_surf = self.render_text(self.small_font, "SPACE重启 | ESC返回", True, self.WHITE)
+        return [(over_surf, (self.screen_width//2 - 120, self.screen_height//2 - 30)),
+                (restart_surf, (self.screen_width//2 - 100, self.screen_height//2 + 20))]
+
+    @profiled("draw.ui")
+    def draw_ui(self):
+        self.hud.draw(self.screen)
 
     # -------------------------- 父类方法重写 --------------------------
-    def update(self, dt: float):
-        if self.show_mode_tip:
-            if pygame.time.get_ticks() - self.tip_show_start_time > 1000:
-                self.show_mode_tip = False
+    def step(self, tick_ms: float):
+        """推进一个固定步长：计时、生成、移动、碰撞都在这里，与渲染帧率无关"""
+        if not self.current_user:
+            return
+        if REPLAY_RECORD and self.recorder is None and isinstance(self.input_source, LiveInput):
+            self.start_recording()
         
-        if self.is_paused or self.game_over or not self.current_user:
+        # 本步输入：暂停/重启等事件也在这里结算，录像回放走同一路径
+        tick_input = self.input_source.poll(self)
+        if tick_input is None:
+            self.replay_finished = True
             return
+        if self.recorder:
+            self.recorder.record(tick_input)
+        self._apply_tick_events(tick_input)
         
-        current_time = pygame.time.get_ticks()
+        if self.is_paused or self.game_over:
+            return
+        
+        self.sim_time += tick_ms
+        # 敌人/子弹速度按原60帧/秒时的每帧像素数标定，换算到当前步长
+        scale = tick_ms * self.FPS / 1000
+        self.audio.begin_frame()
         # 实时检测按键（核心冲突解决）
-        self.check_real_time_keys(current_time)
+        self.check_real_time_keys(self.sim_time, tick_input.held)
         
         self.spawn_enemy()
         self.update_reload()
         
-        for enemy in self.enemies:
-            enemy.update()
-        
-        self.bullets[:] = [bullet for bullet in self.bullets if not bullet.update()]
+        with profiler.section("update.step.move"):
+            self.enemies.step(scale)
+            self.bullets.step(scale)
         
         self.check_collisions()
+        self.bullets.remove_expired()
         self.check_enemy_damage()
         
         # 自动射击（按住鼠标左键，自动模式）
-        if self.mouse_left_held:
+        if tick_input.held & HOLD_LEFT:
             current_weapon = self.get_current_weapon()
             if current_weapon and current_weapon.active_mode == "auto":
-                self.fire_bullet(pygame.mouse.get_pos())
+                self.fire_bullet(tick_input.mouse_pos)
+
+    def _apply_tick_events(self, tick_input):
+        """结算两步之间发生的按键/鼠标事件（SPACE重启、P暂停、鼠标点击射击）"""
+        events = tick_input.events
+        if events & EVENT_RESTART and self.game_over:
+            self.reset_game()
+        if events & EVENT_PAUSE:
+            self.is_paused = not self.is_paused
+            self.positional_audio.set_paused(self.is_paused)
+            self._play_sound("pause" if self.is_paused else "resume")
+        if events & EVENT_LEFT_DOWN and not self.game_over and not self.is_paused:
+            self.fire_bullet(tick_input.mouse_pos)
+
+    def update(self, dt: float):
+        """每个渲染帧一次：提示计时、敌人方位音效刷新（模拟推进见 step）"""
+        if self.show_mode_tip:
+            if pygame.time.get_ticks() - self.tip_show_start_time > 1000:
+                self.show_mode_tip = False
+        
+        if self.is_paused or self.game_over or not self.current_user:
+            return
+        
+        self._update_enemy_sounds()
+        self.latency_probe.poll()
 
     def draw(self):
         self.screen.fill(self.BLACK)
         
         if not self.current_user:
-            tip_surf = self.medium_font.render("请先登录并装备武器", True, self.WHITE)
+            tip_surf = self.render_text(self.medium_font, "请先登录并装备武器", True, self.WHITE)
             self.screen.blit(tip_surf, (self.screen_width//2 - 150, self.screen_height//2))
             return
         
@@ -623,11 +819,10 @@ class GamePage(BasePage):
         pygame.draw.line(self.screen, self.WHITE, (self.CENTER_POS[0]-15, self.CENTER_POS[1]), (self.CENTER_POS[0]+15, self.CENTER_POS[1]), 3)
         pygame.draw.line(self.screen, self.WHITE, (self.CENTER_POS[0], self.CENTER_POS[1]-15), (self.CENTER_POS[0], self.CENTER_POS[1]+15), 3)
         
-        # 绘制子弹和敌人
-        for bullet in self.bullets:
-            bullet.draw(self.screen)
-        for enemy in self.enemies:
-            enemy.draw(self.screen)
+        # 绘制子弹和敌人（先收集精灵，再一次批量绘制）
+        self.draw_bullets()
+        self.draw_enemies()
+        self._blit_sprites()
         
         # 绘制UI
         self.draw_ui()
@@ -636,28 +831,15 @@ class GamePage(BasePage):
         if not self.current_user:
             return
         
-        # 仅处理非实时按键（ESC、SPACE、P、鼠标点击）
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_SPACE and self.game_over:
-                self.reset_game()
-            elif event.key == pygame.K_p:
-                self.is_paused = not self.is_paused
-                self._play_sound("pause" if self.is_paused else "resume")
-            elif event.key == pygame.K_ESCAPE:
-                if self.current_user:
+        # ESC 立即返回主页；SPACE、P、鼠标点击交给输入源，在下一个模拟步结算（录像可原样回放）
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.stop_recording()
+            if self.current_user and self.persist_results:
+                with profiler.section("events.save_db"):
                     self.current_user.save_to_db()
-                self.page_manager.switch_page("home")
-        
-        # 鼠标射击（点击/按住）
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            self.mouse_left_held = True
-            if not self.game_over and not self.is_paused:
-                self.fire_bullet(pygame.mouse.get_pos())
-        if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-            self.mouse_left_held = False
-
-# 确保numpy已安装（音效合成必需）
-try:
-    import numpy
-except ImportError:
-    raise ImportError("请安装numpy库以支持音效合成：pip install numpy")
\ No newline at end of file
+            self._stop_all_enemy_sounds()
+            self.latency_probe.report()
+            self.latency_probe.clear()
+            self.page_manager.switch_page("home")
+            return
+        self.input_source.push_event(event)
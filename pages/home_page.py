@@ -50,7 +50,7 @@ class HomePage(BasePage):
         self.screen.fill((245, 247, 250))  # 淡蓝色背景
         
         # 1. 绘制标题
-        title_surf = self.font.render("🎮 游戏主菜单", True, BLACK)
+        title_surf = self.render_text(self.font, "🎮 游戏主菜单", True, BLACK)
         title_rect = title_surf.get_rect(center=(self.screen_width//2, 100))
         self.screen.blit(title_surf, title_rect)
         
@@ -61,8 +61,8 @@ class HomePage(BasePage):
             pygame.draw.rect(self.screen, GRAY, self.user_info_rect, 1)
             
             # 用户名和得分
-            user_text = self.small_font.render(f"用户：{self.current_user.username}", True, BLACK)
-            score_text = self.small_font.render(f"总积分：{self.current_user.total_score}", True, BLUE)
+            user_text = self.render_text(self.small_font, f"用户：{self.current_user.username}", True, BLACK)
+            score_text = self.render_text(self.small_font, f"总积分：{self.current_user.total_score}", True, BLUE)
             
             self.screen.blit(user_text, (self.user_info_rect.x + 15, self.user_info_rect.y + 10))
             self.screen.blit(score_text, (self.user_info_rect.x + 15, self.user_info_rect.y + 35))
@@ -85,10 +85,16 @@ class HomePage(BasePage):
             pygame.draw.rect(self.screen, btn_color, rect, border_radius=8)
             
             # 绘制按钮文字（居中）
-            text_surf = self.medium_font.render(text, True, text_color)
+            text_surf = self.render_text(self.medium_font, text, True, text_color)
             text_rect = text_surf.get_rect(center=rect.center)
             self.screen.blit(text_surf, text_rect)
 
+    def render_state(self) -> dict:
+        state = {tuple(config["rect"]): self._hovered(config["rect"]) for config in self.btn_configs}
+        user = self.current_user
+        state[tuple(self.user_info_rect)] = (user.username, user.total_score) if user else None
+        return state
+
     def handle_event(self, event: pygame.event.Event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             # 点击功能按钮
@@ -102,8 +108,7 @@ class HomePage(BasePage):
                     
                     # 退出登录：清空所有页面的当前用户
                     if target_page == "login":
-                        for page in self.page_manager.pages.values():
-                            page.set_current_user(None)
+                        self.page_manager.set_current_user(None)
                     
                     # 跳转到目标页面
                     self.page_manager.switch_page(target_page)
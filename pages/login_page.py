@@ -30,12 +30,12 @@ class LoginPage(BasePage):
         self.screen.fill((245, 247, 250))  # 淡蓝色背景
         
         # 标题
-        title_surf = self.font.render("用户登录", True, BLUE)
+        title_surf = self.render_text(self.font, "用户登录", True, BLUE)
         self.screen.blit(title_surf, (self.screen_width//2 - 100, 150))
         
         # 输入框标签
-        username_label = self.medium_font.render("用户名", True, BLACK)
-        password_label = self.medium_font.render("密码", True, BLACK)
+        username_label = self.render_text(self.medium_font, "用户名", True, BLACK)
+        password_label = self.render_text(self.medium_font, "密码", True, BLACK)
         self.screen.blit(username_label, (self.screen_width//2 - 200, 255))
         self.screen.blit(password_label, (self.screen_width//2 - 200, 335))
         
@@ -58,7 +58,7 @@ class LoginPage(BasePage):
             else:
                 display_text = self.input_texts[name]
             
-            text_surf = self.medium_font.render(display_text, True, BLACK)
+            text_surf = self.render_text(self.medium_font, display_text, True, BLACK)
             self.screen.blit(text_surf, (rect.x + 15, rect.y + 8))
         
         # 绘制按钮
@@ -68,7 +68,7 @@ class LoginPage(BasePage):
         else:
             login_btn_color = BLUE
         pygame.draw.rect(self.screen, login_btn_color, self.login_btn_rect, border_radius=8)
-        login_text = self.medium_font.render("登录", True, WHITE)
+        login_text = self.render_text(self.medium_font, "登录", True, WHITE)
         self.screen.blit(login_text, (self.login_btn_rect.centerx - 25, self.login_btn_rect.centery - 15))
         
         # 注册按钮
@@ -77,14 +77,23 @@ class LoginPage(BasePage):
         else:
             register_btn_color = GREEN
         pygame.draw.rect(self.screen, register_btn_color, self.register_btn_rect, border_radius=8)
-        register_text = self.medium_font.render("注册账号", True, WHITE)
+        register_text = self.render_text(self.medium_font, "注册账号", True, WHITE)
         self.screen.blit(register_text, (self.register_btn_rect.centerx - 45, self.register_btn_rect.centery - 15))
         
         # 提示信息
         if self.tip_text:
-            tip_surf = self.small_font.render(self.tip_text, True, self.tip_color)
+            tip_surf = self.render_text(self.small_font, self.tip_text, True, self.tip_color)
             self.screen.blit(tip_surf, (self.screen_width//2 - tip_surf.get_width()//2, 390))
 
+    def render_state(self) -> dict:
+        # 输入框区域延伸到屏幕右边，容纳超出框宽的输入文字
+        state = {(rect.x, rect.y, self.screen_width - rect.x, rect.height): (self.active_input == name, self.input_texts[name])
+                 for name, rect in self.input_rects.items()}
+        state[tuple(self.login_btn_rect)] = self._hovered(self.login_btn_rect)
+        state[tuple(self.register_btn_rect)] = self._hovered(self.register_btn_rect)
+        state[(0, 390, self.screen_width, self.small_font.get_linesize())] = (self.tip_text, self.tip_color)
+        return state
+
     def handle_event(self, event: pygame.event.Event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             # 点击输入框激活
@@ -140,8 +149,7 @@ class LoginPage(BasePage):
             return
         
         # 登录成功：设置全局用户，切换到主菜单
-        for page in self.page_manager.pages.values():
-            page.set_current_user(user)
+        self.page_manager.set_current_user(user)
         
         self.page_manager.switch_page("home")
         # 重置输入框
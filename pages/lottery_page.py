@@ -17,6 +17,12 @@ class LotteryPage(BasePage):
             self.screen_height - 150,
             240, 60
         )
+        self.lottery_area_rect = pygame.Rect(
+            self.screen_width//2 - 350,
+            180,
+            700,
+            300
+        )
         
         # 抽奖配置
         self.lottery_cost = 3000  # 3000积分一次
@@ -35,18 +41,21 @@ class LotteryPage(BasePage):
             if self.draw_progress >= 100:
                 self.is_drawing = False
                 self.result_show_time = pygame.time.get_ticks()
+        elif self.result_weapon and pygame.time.get_ticks() - self.result_show_time >= 3000:
+            # 结果显示3秒后隐藏
+            self.result_weapon = None
 
     def draw(self):
         self.screen.fill(DARK_BLUE)
         
         # 标题
-        title_surf = self.font.render("🎁 装备抽奖", True, YELLOW)
+        title_surf = self.render_text(self.font, "🎁 装备抽奖", True, YELLOW)
         self.screen.blit(title_surf, (self.screen_width//2 - 130, 50))
         
         # 积分信息
         current_score = self.current_user.total_score if self.current_user else 0
-        score_surf = self.medium_font.render(f"当前积分：{current_score}", True, WHITE)
-        cost_surf = self.medium_font.render(f"抽奖消耗：{self.lottery_cost} 积分", True, RED)
+        score_surf = self.render_text(self.medium_font, f"当前积分：{current_score}", True, WHITE)
+        cost_surf = self.render_text(self.medium_font, f"抽奖消耗：{self.lottery_cost} 积分", True, RED)
         self.screen.blit(score_surf, (50, 120))
         self.screen.blit(cost_surf, (self.screen_width - 300, 120))
         
@@ -59,33 +68,28 @@ class LotteryPage(BasePage):
 
     def _draw_lottery_area(self):
         """绘制抽奖区域"""
-        area_rect = pygame.Rect(
-            self.screen_width//2 - 350,
-            180,
-            700,
-            300
-        )
+        area_rect = self.lottery_area_rect
         
         # 区域背景
         pygame.draw.rect(self.screen, (50, 50, 100), area_rect, border_radius=10)
         pygame.draw.rect(self.screen, BLUE, area_rect, 3, border_radius=10)
         
         if not self.current_user:
-            tip_surf = self.medium_font.render("请先登录后进行抽奖", True, RED)
+            tip_surf = self.render_text(self.medium_font, "请先登录后进行抽奖", True, RED)
             self.screen.blit(tip_surf, (area_rect.centerx - tip_surf.get_width()//2, area_rect.centery))
         
         elif self.is_drawing:
             # 抽奖动画
             weapon_index = int(self.draw_progress) % len(self.lottery_pool)
             anim_text = self.lottery_pool[weapon_index].name
-            anim_surf = self.font.render(anim_text, True, WHITE)
+            anim_surf = self.render_text(self.font, anim_text, True, WHITE)
             self.screen.blit(anim_surf, (area_rect.centerx - anim_surf.get_width()//2, area_rect.centery))
         
         elif self.result_weapon:
             # 显示结果（3秒）
             if pygame.time.get_ticks() - self.result_show_time < 3000:
-                name_surf = self.font.render(f"恭喜获得：{self.result_weapon.name}", True, YELLOW)
-                attr_surf = self.small_font.render(
+                name_surf = self.render_text(self.font, f"恭喜获得：{self.result_weapon.name}", True, YELLOW)
+                attr_surf = self.render_text(self.small_font, 
                     f"伤害：{self.result_weapon.damage} | 弹夹：{self.result_weapon.clip_capacity}",
                     True, WHITE
                 )
@@ -96,13 +100,13 @@ class LotteryPage(BasePage):
         
         else:
             # 未抽奖提示
-            tip_surf1 = self.medium_font.render("奖池：M249、M416、M16A4、AUG、AKM、98K、P92", True, WHITE)
-            tip_surf2 = self.small_font.render("未解锁→解锁武器 | 已解锁→补充弹药", True, LIGHT_GRAY)
+            tip_surf1 = self.render_text(self.medium_font, "奖池：M249、M416、M16A4、AUG、AKM、98K、P92", True, WHITE)
+            tip_surf2 = self.render_text(self.small_font, "未解锁→解锁武器 | 已解锁→补充弹药", True, LIGHT_GRAY)
             self.screen.blit(tip_surf1, (area_rect.centerx - tip_surf1.get_width()//2, area_rect.centery - 30))
             self.screen.blit(tip_surf2, (area_rect.centerx - tip_surf2.get_width()//2, area_rect.centery + 20))
 
-    def _draw_lottery_button(self):
-        """绘制抽奖按钮"""
+    def _lottery_button_style(self):
+        """抽奖按钮当前的 (颜色, 文字)"""
         if not self.current_user:
             btn_color = GRAY
             btn_text = "请先登录"
@@ -115,11 +119,15 @@ class LotteryPage(BasePage):
         else:
             btn_color = (100, 200, 100) if self.lottery_btn_rect.collidepoint(pygame.mouse.get_pos()) else GREEN
             btn_text = f"消耗{self.lottery_cost}积分 开始抽奖"
-        
+        return btn_color, btn_text
+
+    def _draw_lottery_button(self):
+        """绘制抽奖按钮"""
+        btn_color, btn_text = self._lottery_button_style()
         pygame.draw.rect(self.screen, btn_color, self.lottery_btn_rect, border_radius=8)
         pygame.draw.rect(self.screen, WHITE, self.lottery_btn_rect, 2, border_radius=8)
         
-        btn_surf = self.small_font.render(btn_text, True, WHITE)
+        btn_surf = self.render_text(self.small_font, btn_text, True, WHITE)
         self.screen.blit(btn_surf, (
             self.lottery_btn_rect.centerx - btn_surf.get_width()//2,
             self.lottery_btn_rect.centery - btn_surf.get_height()//2
@@ -130,9 +138,33 @@ class LotteryPage(BasePage):
         btn_color = (180, 50, 50) if self.back_btn_rect.collidepoint(pygame.mouse.get_pos()) else RED
         pygame.draw.rect(self.screen, btn_color, self.back_btn_rect, border_radius=5)
         
-        btn_surf = self.small_font.render("返回主菜单", True, WHITE)
+        btn_surf = self.render_text(self.small_font, "返回主菜单", True, WHITE)
         self.screen.blit(btn_surf, (self.back_btn_rect.x + 10, self.back_btn_rect.y + 5))
 
+    def render_state(self) -> dict:
+        if not self.current_user:
+            area = None
+        elif self.is_drawing:
+            area = ("drawing", int(self.draw_progress) % len(self.lottery_pool))
+        elif self.result_weapon:
+            area = ("result", self.result_weapon.name)
+        else:
+            area = "idle"
+        return {
+            (0, 120, self.screen_width, self.medium_font.get_linesize()):
+                self.current_user.total_score if self.current_user else 0,
+            tuple(self.lottery_area_rect): area,
+            tuple(self.lottery_btn_rect): self._lottery_button_style(),
+            tuple(self.back_btn_rect): self._hovered(self.back_btn_rect)
+        }
+
+    def next_redraw_ms(self) -> int | None:
+        if self.is_drawing:
+            return 0
+        if self.result_weapon:
+            return max(1, 3000 - (pygame.time.get_ticks() - self.result_show_time))
+        return None
+
     def handle_event(self, event: pygame.event.Event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             # 返回主菜单
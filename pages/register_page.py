@@ -32,7 +32,7 @@ class RegisterPage(BasePage):
         self.screen.fill((245, 247, 250))
         
         # 标题
-        title_surf = self.font.render("用户注册", True, BLUE)
+        title_surf = self.render_text(self.font, "用户注册", True, BLUE)
         self.screen.blit(title_surf, (self.screen_width//2 - 100, 150))
         
         # 输入框标签
@@ -42,7 +42,7 @@ class RegisterPage(BasePage):
             "confirm_password": "确认密码"
         }
         for name, label in labels.items():
-            label_surf = self.medium_font.render(label, True, BLACK)
+            label_surf = self.render_text(self.medium_font, label, True, BLACK)
             self.screen.blit(label_surf, (self.screen_width//2 - 200, self.input_rects[name].y + 5))
         
         # 绘制输入框
@@ -63,7 +63,7 @@ class RegisterPage(BasePage):
             else:
                 display_text = self.input_texts[name]
             
-            text_surf = self.medium_font.render(display_text, True, BLACK)
+            text_surf = self.render_text(self.medium_font, display_text, True, BLACK)
             self.screen.blit(text_surf, (rect.x + 15, rect.y + 8))
         
         # 绘制按钮
@@ -73,7 +73,7 @@ class RegisterPage(BasePage):
         else:
             btn_color = GREEN
         pygame.draw.rect(self.screen, btn_color, self.register_btn_rect, border_radius=8)
-        register_text = self.medium_font.render("注册", True, WHITE)
+        register_text = self.render_text(self.medium_font, "注册", True, WHITE)
         self.screen.blit(register_text, (self.register_btn_rect.centerx - 25, self.register_btn_rect.centery - 15))
         
         # 返回按钮
@@ -82,12 +82,12 @@ class RegisterPage(BasePage):
         else:
             back_color = LIGHT_GRAY
         pygame.draw.rect(self.screen, back_color, self.back_btn_rect, border_radius=5)
-        back_text = self.small_font.render("返回登录", True, BLACK)
+        back_text = self.render_text(self.small_font, "返回登录", True, BLACK)
         self.screen.blit(back_text, (self.back_btn_rect.x + 10, self.back_btn_rect.y + 5))
         
         # 提示信息
         if self.tip_text:
-            tip_surf = self.small_font.render(self.tip_text, True, self.tip_color)
+            tip_surf = self.render_text(self.small_font, self.tip_text, True, self.tip_color)
             self.screen.blit(tip_surf, (self.screen_width//2 - tip_surf.get_width()//2, 440))
 
     def handle_event(self, event: pygame.event.Event):
@@ -167,6 +167,15 @@ class RegisterPage(BasePage):
         pygame.time.set_timer(pygame.USEREVENT, 1000)
         self.register_success = True
 
+    def render_state(self) -> dict:
+        # 输入框区域延伸到屏幕右边，容纳超出框宽的输入文字
+        state = {(rect.x, rect.y, self.screen_width - rect.x, rect.height): (self.active_input == name, self.input_texts[name])
+                 for name, rect in self.input_rects.items()}
+        state[tuple(self.register_btn_rect)] = self._hovered(self.register_btn_rect)
+        state[tuple(self.back_btn_rect)] = self._hovered(self.back_btn_rect)
+        state[(0, 440, self.screen_width, self.small_font.get_linesize())] = (self.tip_text, self.tip_color)
+        return state
+
     def handle_event(self, event: pygame.event.Event):
         # 处理注册成功后的跳转事件
         if hasattr(self, "register_success") and self.register_success and event.type == pygame.USEREVENT:
@@ -0,0 +1,55 @@
+"""音频延迟探针测试（utils/audio_latency.py）
+
+运行（在项目根目录执行）：
+    python -m pytest -q test_audio_latency.py
+"""
+from utils.audio_latency import AudioLatencyProbe
+
+
+class _Sound:
+    def get_length(self):
+        return 0.1
+
+
+class _Channel:
+    def __init__(self, sound):
+        self.sound = sound
+        self.busy = True
+
+    def get_busy(self):
+        return self.busy
+
+    def get_sound(self):
+        return self.sound if self.busy else None
+
+
+def test_latency_measured_from_request_timestamp():
+    probe = AudioLatencyProbe(frequency=44100, buffer_size=441, enabled=True)
+    sound = _Sound()
+    channel = _Channel(sound)
+    probe.record("shoot", True, channel=channel, sound=sound)
+    requested = probe.records[0][1]
+    assert probe.poll(requested + 0.5) == [] and probe.pending() == 1
+    channel.busy = False
+    (latency,) = probe.poll(requested + 0.125)  # 播完时刻 - 请求时刻 - 100ms 时长
+    assert abs(latency - 25) < 1e-6
+    row = probe.summary()["shoot"]
+    assert row["measured"] == 1 and abs(row["estimated_ms"] - 10) < 1e-6
+
+
+def test_interrupted_and_dropped_requests_not_measured():
+    probe = AudioLatencyProbe(frequency=44100, buffer_size=441, enabled=True)
+    sound = _Sound()
+    channel = _Channel(sound)
+    probe.record("shoot", True, channel=channel, sound=sound)
+    probe.record("shoot", False)
+    channel.sound = _Sound()  # 通道被别的音效抢占
+    assert probe.poll() == [] and probe.pending() == 0
+    row = probe.summary()["shoot"]
+    assert (row["count"], row["dropped"], row["measured"]) == (2, 1, 0)
+
+
+def test_disabled_probe_records_nothing():
+    probe = AudioLatencyProbe(enabled=False)
+    probe.record("shoot", True, channel=_Channel(_Sound()), sound=_Sound())
+    assert probe.records == [] and probe.poll() == []
@@ -0,0 +1,48 @@
+"""扫掠碰撞检测测试（core/collision.py）
+
+运行（在项目根目录执行）：
+    python -m pytest -q test_collision.py
+"""
+import numpy
+
+from core.collision import SpatialHash, find_bullet_hits
+
+
+def _hits(bullets, enemies, bullet_radius=1, enemy_radius=2):
+    """bullets: [(x0, y0, x1, y1)]，enemies: [(本帧结束x, y, 位移dx, dy)]，返回 [(子弹, 敌人)]"""
+    b = numpy.array(bullets, dtype=numpy.float64).reshape(-1, 4)
+    e = numpy.array(enemies, dtype=numpy.float64).reshape(-1, 4)
+    b_idx, e_idx = find_bullet_hits(
+        SpatialHash(64), b[:, 0], b[:, 1], b[:, 2], b[:, 3], numpy.full(len(b), bullet_radius),
+        e[:, 0], e[:, 1], numpy.full(len(e), enemy_radius), e[:, 2], e[:, 3]
+    )
+    return list(zip(b_idx.tolist(), e_idx.tolist()))
+
+
+def test_fast_bullet_through_stationary_enemy():
+    # 一步跨过敌人，只检测终点会穿透
+    assert _hits([(0, -50, 0, 50)], [(0, 0, 0, 0)]) == [(0, 0)]
+
+
+def test_miss_stationary_enemy():
+    assert _hits([(10, -50, 10, 50)], [(0, 0, 0, 0)]) == []
+
+
+def test_bullet_crosses_moving_enemy_mid_step():
+    # 敌人 (-6,0)→(6,0)，子弹 (0,-20)→(0,20)，两者在本帧中间时刻同时经过原点
+    assert _hits([(0, -20, 0, 20)], [(6, 0, 12, 0)]) == [(0, 0)]
+
+
+def test_moving_enemy_sweeps_through_stationary_bullet():
+    # 敌人 (0,0)→(10,0)，途中扫过静止在 (5,0) 的子弹
+    assert _hits([(5, 0, 5, 0)], [(10, 0, 10, 0)]) == [(0, 0)]
+
+
+def test_moving_enemy_and_bullet_paths_cross_at_different_times():
+    # 轨迹在原点相交，但子弹经过原点时敌人还在 (-6,0)：不命中
+    assert _hits([(0, -20, 0, 20)], [(0, 0, 12, 0)]) == []
+
+
+def test_hits_ordered_along_bullet_path():
+    # 同一子弹依次穿过两个敌人：按沿轨迹先后排列，调用方取第一个
+    assert _hits([(0, 0, 100, 0)], [(80, 0, 0, 0), (20, 0, 0, 0)]) == [(0, 1), (0, 0)]
@@ -0,0 +1,50 @@
+"""录像回放测试（tools/replay.py）
+
+运行（在项目根目录执行）：
+    python -m pytest -q test_replay.py
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from config import CENTER_POS, SIM_TICK_RATE
+from core.Weapon import DEFAULT_WEAPONS
+from tools.replay import replay_windowed
+from utils.headless import HeadlessRunner
+from utils.input_replay import InputRecorder, Replay, TickInput
+
+
+def _idle_replay(seconds: float):
+    """不开火、鼠标停在中心的录像"""
+    recorder = InputRecorder(1, SIM_TICK_RATE, {"loadout": {"weapons": [DEFAULT_WEAPONS["P92"].to_dict()],
+                                                            "weapon_index": 0}})
+    for _ in range(int(seconds * SIM_TICK_RATE)):
+        recorder.record(TickInput(*CENTER_POS, 0, 0))
+    return recorder.to_replay()
+
+
+def test_escape_ends_windowed_replay():
+    pygame.init()
+    pygame.time.set_timer(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE, mod=0, unicode="\x1b"),
+                          500, loops=1)
+    result = replay_windowed(_idle_replay(30))
+    # 没有结束回放时会按原速放完整段30秒录像
+    assert result["sim_time"] < 10_000
+
+
+def test_recorded_match_replays_identically(tmp_path):
+    path = str(tmp_path / "match.sgr")
+    runner = HeadlessRunner("M416", audio=False)
+    try:
+        recorded = runner.run_match(3, max_seconds=20, record_path=path)
+        replay = Replay.load(path)
+        replayed = runner.run_replay(replay)
+    finally:
+        runner.close()
+    assert len(replay) > 0
+    keys = ("sim_time", "score", "kills", "shots", "hp", "game_over")
+    assert {key: replayed[key] for key in keys} == {key: recorded[key] for key in keys}
+    assert {key: replay.meta["result"][key] for key in keys} == {key: recorded[key] for key in keys}
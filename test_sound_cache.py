@@ -0,0 +1,52 @@
+"""音效磁盘缓存测试（utils/sound_cache.py）
+
+运行（在项目根目录执行）：
+    python -m pytest -q test_sound_cache.py
+"""
+import os
+
+import numpy
+
+from utils.sound_cache import SoundCache
+
+
+def _synth(calls):
+    def synth(frequency, duration):
+        calls.append((frequency, duration))
+        return numpy.full(duration, frequency, dtype=numpy.int16)
+    return synth
+
+
+def test_hit_returns_cached_samples_without_synthesizing(tmp_path):
+    cache = SoundCache(str(tmp_path))
+    calls = []
+    first = cache.get_or_synth("tone", {"frequency": 440, "duration": 100}, _synth(calls))
+    second = cache.get_or_synth("tone", {"frequency": 440, "duration": 100}, _synth(calls))
+    assert calls == [(440, 100)]
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert numpy.array_equal(first, second)
+
+
+def test_parameter_change_misses(tmp_path):
+    cache = SoundCache(str(tmp_path))
+    calls = []
+    cache.get_or_synth("tone", {"frequency": 440, "duration": 100}, _synth(calls))
+    cache.get_or_synth("tone", {"frequency": 880, "duration": 100}, _synth(calls))
+    cache.get_or_synth("noise", {"frequency": 440, "duration": 100}, _synth(calls))
+    assert len(calls) == 3
+    assert cache.hits == 0
+
+
+def test_evicts_least_recently_used_over_size_limit(tmp_path):
+    # 每条 100 个int16采样 = 200字节，上限只容纳两条
+    cache = SoundCache(str(tmp_path), max_bytes=400)
+    keys = [cache.make_key("tone", {"frequency": f}) for f in (1, 2, 3)]
+    for age, key in zip((300, 200), keys):
+        cache.store(key, numpy.zeros(100, dtype=numpy.int16))
+        path = os.path.join(str(tmp_path), key + ".pcm")
+        os.utime(path, (os.path.getmtime(path) - age,) * 2)
+    cache.load(keys[0])  # 读取刷新使用时间，第一条变为最近使用
+    cache.store(keys[2], numpy.zeros(100, dtype=numpy.int16))
+    assert cache.load(keys[0]) is not None
+    assert cache.load(keys[1]) is None
+    assert cache.load(keys[2]) is not None
@@ -0,0 +1,83 @@
+"""敌人生成时间线测试（core/spawn_scheduler.py）
+
+运行（在项目根目录执行）：
+    python -m pytest -q test_spawn_scheduler.py
+"""
+import json
+import random
+
+from core.spawn_scheduler import SpawnScheduler, load_waves
+
+
+def _scheduler(seed: int = 1, **kwargs) -> SpawnScheduler:
+    scheduler = SpawnScheduler(random.Random(seed), 800, 600, base_interval=2000, min_interval=800,
+                               speedup_rate=50, min_distance=500, max_distance=1500, **kwargs)
+    scheduler.reset()
+    return scheduler
+
+
+def _timeline(scheduler: SpawnScheduler, until: float) -> list:
+    """按事件到期时间依次触发，返回 [(时间, 敌人数, 是否脚本), ...]"""
+    events = []
+    while scheduler.next_time() is not None and scheduler.next_time() < until:
+        now = scheduler.next_time() + 1
+        event = scheduler.pop(now)
+        events.append((event.time, len(event.enemies), event.scripted))
+    return events
+
+
+def test_interval_shrinks_linearly_to_minimum():
+    scheduler = _scheduler()
+    assert scheduler.interval_at(0) == 2000
+    assert scheduler.interval_at(10_000) == 1500
+    assert scheduler.interval_at(1_000_000) == 800
+
+
+def test_next_spawn_matches_per_frame_check():
+    # 解析解与逐毫秒判断 now - last > interval_at(now) 的结果一致
+    scheduler = _scheduler()
+    for last in (0, 5_000, 20_000, 40_000):
+        now = last
+        while not now - last > scheduler.interval_at(now):
+            now += 1
+        assert abs(scheduler.next_spawn_after(last) - now) <= 1
+
+
+def test_same_seed_same_timeline():
+    a = _scheduler(seed=7)
+    b = _scheduler(seed=7)
+    assert _timeline(a, 60_000) == _timeline(b, 60_000)
+    assert _timeline(_scheduler(seed=7), 60_000) != _timeline(_scheduler(seed=8), 60_000)
+
+
+def test_scripted_waves_interleave_by_time():
+    waves = [{"time": 500, "count": 3, "side": "left"}, {"time": 3000, "elite": True}]
+    scheduler = _scheduler(waves=waves)
+    events = _timeline(scheduler, 5000)
+    times = [time for time, _, _ in events]
+    assert times == sorted(times)
+    scripted = [(time, count) for time, count, is_scripted in events if is_scripted]
+    assert scripted == [(500, 3), (3000, 1)]
+
+
+def test_load_waves_skips_invalid_and_sorts(tmp_path):
+    path = tmp_path / "waves.json"
+    path.write_text(json.dumps({"procedural": False, "waves": [
+        {"time": 2000}, {"count": 2}, {"time": 1000, "side": "middle"}, {"time": 500, "side": "up"}
+    ]}), encoding="utf-8")
+    waves, procedural = load_waves(str(path))
+    assert [wave["time"] for wave in waves] == [500, 2000]
+    assert procedural is False
+
+
+def test_requeue_keeps_unspawned_enemies():
+    # 场上只剩一个空位：3 个敌人的脚本波次生成 1 个，其余 2 个留在时间线上，且不额外排入随机生成
+    scheduler = _scheduler(waves=[{"time": 500, "count": 3}], procedural=False)
+    event = scheduler.pop(501)
+    scheduler.requeue(event, 1, 501)
+    assert not scheduler.is_due(501) and scheduler.is_due(502)
+    rest = scheduler.pop(600)
+    assert rest.enemies == event.enemies[1:]
+    assert scheduler.next_time() is None
+    scheduler.requeue(rest, len(rest.enemies), 600)  # 全部生成时不再入堆
+    assert scheduler.next_time() is None
@@ -0,0 +1,23 @@
+"""启动耗时回归测试
+
+冷启动（新子进程，SDL dummy驱动）到登录页首帧刷新到屏幕不得超过 config.STARTUP_BUDGET_MS，
+且 numpy、pymysql、游戏页在首帧之前不得被项目代码导入（首帧之后登录页空闲时预创建游戏页，这些模块随之加载）。
+
+运行（在项目根目录执行）：
+    python -m pytest -q test_startup_budget.py
+"""
+from config import STARTUP_BUDGET_MS
+from tools.startup_profile import run_startup, lazy_violations
+
+RUNS = 3  # 取多次冷启动中最快的一次，避免机器瞬时负载造成误报
+
+
+def test_first_login_frame_within_budget():
+    first_frame_ms = min(run_startup()["first_frame_ms"] for _ in range(RUNS))
+    assert first_frame_ms <= STARTUP_BUDGET_MS, \
+        f"冷启动到登录页首帧 {first_frame_ms:.0f}ms，超出预算 {STARTUP_BUDGET_MS}ms（用 python -m tools.startup_profile 分析）"
+
+
+def test_heavy_modules_imported_lazily():
+    violations = lazy_violations(run_startup(importtime=True)["imports"])
+    assert not violations, "首帧之前被导入：" + "；".join(" <- ".join(chain) for chain in violations.values())
@@ -0,0 +1,46 @@
+"""文字渲染缓存测试（utils/text_cache.py）
+
+运行（在项目根目录执行）：
+    python -m pytest -q test_text_cache.py
+"""
+import pygame
+import pytest
+
+from utils.text_cache import TextCache
+
+
+@pytest.fixture
+def font():
+    pygame.font.init()
+    return pygame.font.Font(None, 24)
+
+
+def test_same_arguments_share_one_surface(font):
+    cache = TextCache()
+    first = cache.render(font, "得分: 10", True, (255, 255, 255))
+    second = cache.render(font, "得分: 10", True, [255, 255, 255])  # 颜色用列表也命中
+    assert first is second
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_any_argument_change_renders_again(font):
+    cache = TextCache()
+    cache.render(font, "10", True, (255, 255, 255))
+    cache.render(font, "11", True, (255, 255, 255))
+    cache.render(font, "10", True, (255, 0, 0))
+    cache.render(font, "10", False, (255, 255, 255))
+    cache.render(pygame.font.Font(None, 30), "10", True, (255, 255, 255))
+    assert cache.misses == 5 and cache.hits == 0
+
+
+def test_evicts_least_recently_used(font):
+    cache = TextCache(max_entries=2)
+    a = cache.render(font, "a", True, (0, 0, 0))
+    cache.render(font, "b", True, (0, 0, 0))
+    assert cache.render(font, "a", True, (0, 0, 0)) is a  # a 变为最近使用
+    cache.render(font, "c", True, (0, 0, 0))  # 淘汰 b
+    assert len(cache) == 2
+    assert cache.render(font, "a", True, (0, 0, 0)) is a
+    misses = cache.misses
+    cache.render(font, "b", True, (0, 0, 0))
+    assert cache.misses == misses + 1
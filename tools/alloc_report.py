@@ -0,0 +1,108 @@
+"""模拟步内存分配报告（tracemalloc）
+
+无界面运行一局（玩家无敌，保证稳态），预热后开启 tracemalloc：
+1. 统计每个模拟步的临时分配峰值（申请后很快释放的内存，反映分配压力）；
+2. 再跑同样步数，给步内各阶段套上计量包装，分别统计各阶段的临时分配；
+3. 列出整段运行后仍存活的分配增长（按代码行排序，定位泄漏/池增长）。
+
+用法（在项目根目录执行）：
+    python -m tools.alloc_report --ticks 3000 --max-enemies 64
+"""
+import argparse
+import tracemalloc
+
+import numpy
+
+from core.entities import EnemyStore, BulletStore
+from utils.headless import HeadlessRunner, AimBot
+
+# 分阶段统计的方法：(名称, 所属对象/类, 方法名)
+_PHASES = (
+    ("敌人生成", "page", "spawn_enemy"),
+    ("敌人移动", EnemyStore, "step"),
+    ("子弹移动", BulletStore, "step"),
+    ("碰撞检测", "page", "check_collisions"),
+    ("子弹出界", BulletStore, "remove_expired"),
+    ("接触伤害", "page", "check_enemy_damage"),
+    ("方位音效", "page", "_update_enemy_sounds"),
+)
+
+
+def _instrument(page, totals: dict):
+    """给各阶段方法套上计量包装：调用前重置峰值，调用后累加本阶段的峰值增量"""
+    for label, owner, name in _PHASES:
+        target = page if owner == "page" else owner
+        original = getattr(target, name)
+        totals[label] = 0
+
+        def wrapped(*args, _original=original, _label=label, **kwargs):
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            result = _original(*args, **kwargs)
+            totals[_label] += tracemalloc.get_traced_memory()[1] - current
+            return result
+        setattr(target, name, wrapped)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="模拟步内存分配报告")
+    parser.add_argument("--weapon", default="M416", help="使用的武器名称")
+    parser.add_argument("--seed", type=int, default=1, help="随机种子")
+    parser.add_argument("--warmup", type=int, default=600, help="开始统计前的预热步数")
+    parser.add_argument("--ticks", type=int, default=3000, help="统计的步数")
+    parser.add_argument("--max-enemies", type=int, default=8, help="同屏敌人上限")
+    parser.add_argument("--top", type=int, default=10, help="列出存活分配最多的代码行数")
+    parser.add_argument("--no-audio", action="store_true", help="不统计方位音效刷新")
+    args = parser.parse_args()
+
+    runner = HeadlessRunner(args.weapon, audio=not args.no_audio)
+    page = runner.page
+    page.MAX_ENEMIES = args.max_enemies
+    page.input_source = AimBot()
+    page.set_seed(args.seed)
+    page.reset_game()
+    runner.user.player.is_invincible = True
+
+    def tick():
+        page.step(runner.tick_ms)
+        if runner.audio:
+            page.update(runner.tick_ms / 1000)
+
+    for _ in range(args.warmup):
+        tick()
+
+    transient = numpy.zeros(args.ticks, dtype=numpy.int64)
+    phase_totals = {}
+    tracemalloc.start(8)
+    before = tracemalloc.take_snapshot()
+    for i in range(args.ticks):
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        tick()
+        transient[i] = tracemalloc.get_traced_memory()[1] - current
+    _instrument(page, phase_totals)
+    for _ in range(args.ticks):
+        tick()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    print(f"统计 {args.ticks} 步，同屏敌人上限 {args.max_enemies}，结束时敌人 {len(page.enemies)}、子弹 {len(page.bullets)}")
+    print(f"每步临时分配峰值：均值 {transient.mean() / 1024:.2f}KB，p95 {numpy.percentile(transient, 95) / 1024:.2f}KB，"
+          f"最大 {transient.max() / 1024:.2f}KB")
+    print("各阶段每步平均临时分配：")
+    for label, total in phase_totals.items():
+        print(f"  {label:<8}{total / args.ticks:>10.0f}B")
+
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    stats = after.filter_traces(filters).compare_to(before.filter_traces(filters), "lineno")
+    grown = [stat for stat in stats if stat.size_diff > 0]
+    print(f"存活分配增长：{sum(stat.size_diff for stat in grown) / 1024:.1f}KB，"
+          f"{sum(stat.count_diff for stat in grown)} 个内存块")
+    for stat in grown[:args.top]:
+        frame = stat.traceback[0]
+        print(f"  {stat.size_diff / 1024:>8.1f}KB {stat.count_diff:>6} 块  {frame.filename}:{frame.lineno}")
+    runner.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""音频设备缓冲区 / 软件混音数据块大小报告
+
+一、设备缓冲区扫描（--buffers）：对每个候选 MIXER_BUFFER 重新 pygame.mixer.init，在模拟的游戏逻辑负载下
+逐个播放已知时长的提示音，用 AudioLatencyProbe 记录请求时间戳并轮询 Channel.get_busy()，
+实测 请求 → 通道播完 的时间减去提示音时长。声卡断流时混音线程来不及供数，播完时刻被整体推后，
+实测延迟超过一个设备缓冲周期 + 容差（--tolerance-ms）即记为一次断流；推荐本机不断流的最小 MIXER_BUFFER。
+
+二、软件混音数据块扫描（--blocks）：软件混音模式（AUDIO_MIXER_MODE = "software"）下 SoftMixer 每帧推流一次，
+通道上保持一个播放中的块和一个排队块，数据块太短时排队的数据在下一次推流前就已播完，出现断档。
+在 --device-buffer 设备缓冲区下对每个候选数据块按目标帧率持续推流，统计断档次数，推荐不断档的最小 SOFT_MIXER_BLOCK_SIZE。
+
+实测值是 请求 → 数据交给声卡 的时间，听到声音还要再加声卡自身的输出缓冲；
+SDL 的 dummy 音频驱动只按缓冲周期模拟消耗数据，在无声卡环境下得到的数字不代表真实设备。
+
+用法（在项目根目录执行）：
+    python -m tools.audio_latency_report --buffers 256,512,1024,2048 --blocks 256,512,1024,2048 --seconds 3 --load-ms 8
+"""
+import argparse
+import random
+import time
+
+import pygame
+
+from config import MIXER_FREQUENCY, MIXER_BUFFER
+from utils.audio_latency import AudioLatencyProbe
+from utils.soft_mixer import SoftMixer
+from utils.sound_synth import synth_wave, to_sound
+
+
+def _busy_wait(ms: float, poll=None):
+    """忙等 ms 毫秒模拟逻辑/渲染负载；给出 poll 时忙等期间持续轮询"""
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        if poll is not None:
+            poll()
+
+
+def _idle_wait(seconds: float, poll=None):
+    """帧剩余时间：不轮询时直接 sleep，轮询时每 0.5 毫秒检查一次"""
+    if seconds <= 0:
+        return
+    if poll is None:
+        time.sleep(seconds)
+        return
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        poll()
+        time.sleep(0.0005)
+
+
+def _frame_load(rng: random.Random, load_ms: float) -> float:
+    """带抖动的逻辑/渲染负载，偶发长帧"""
+    work = load_ms * rng.uniform(0.5, 1.5)
+    if rng.random() < 0.02:
+        work *= 4
+    return work
+
+
+def _init_mixer(buffer_size: int) -> int:
+    pygame.mixer.quit()
+    pygame.mixer.init(frequency=MIXER_FREQUENCY, size=-16, channels=2, buffer=buffer_size)
+    return pygame.mixer.get_init()[0]
+
+
+def measure_buffer(buffer_size: int, seconds: float, fps: int, load_ms: float,
+                   cue_ms: int = 100, tolerance_ms: float = 5.0) -> dict:
+    """以 buffer_size 重新初始化混音器，在模拟负载下逐个播放 cue_ms 毫秒的提示音，实测延迟并统计断流"""
+    frequency = _init_mixer(buffer_size)
+    channel = pygame.mixer.Channel(0)
+    cue = to_sound(synth_wave(600, 600, cue_ms / 1000, volume=0.5))
+    probe = AudioLatencyProbe(frequency=frequency, buffer_size=buffer_size, enabled=True)
+    buffer_ms = buffer_size * 1000.0 / frequency
+    threshold_ms = buffer_ms + tolerance_ms
+
+    rng = random.Random(0)
+    frame_time = 1.0 / fps
+    latencies = []
+
+    def poll():
+        latencies.extend(probe.poll())
+
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        frame_start = time.perf_counter()
+        if not probe.pending():
+            channel.play(cue)
+            probe.record("cue", True, channel=channel, sound=cue)
+        _busy_wait(_frame_load(rng, load_ms), poll)
+        _idle_wait(frame_time - (time.perf_counter() - frame_start), poll)
+    # 等最后一个提示音播完
+    deadline = time.perf_counter() + cue_ms / 1000 + 4 * buffer_ms / 1000 + 0.5
+    while probe.pending() and time.perf_counter() < deadline:
+        _idle_wait(0.001, poll)
+    channel.stop()
+
+    row = probe.summary().get("cue", {})
+    return {
+        "buffer": buffer_size,
+        "buffer_ms": buffer_ms,
+        "cues": row.get("measured", 0),
+        "mean_ms": row.get("mean_ms", 0.0),
+        "p95_ms": row.get("p95_ms", 0.0),
+        "max_ms": row.get("max_ms", 0.0),
+        "underruns": sum(1 for latency in latencies if latency > threshold_ms)
+    }
+
+
+def measure_block(block_size: int, seconds: float, fps: int, load_ms: float, voices: int,
+                  device_buffer: int = MIXER_BUFFER) -> dict:
+    """以 block_size 为软件混音数据块大小，模拟游戏循环每帧推流一次并统计断档（混音器须已按 device_buffer 初始化）"""
+    frequency = pygame.mixer.get_init()[0]
+    mixer = SoftMixer(pygame.mixer.Channel(0), block_size=block_size)
+    cue = to_sound(synth_wave(300, 250, 0.6, volume=0.8, wave_type="sawtooth"))
+    for _ in range(voices):
+        mixer.play(cue, loops=-1).set_volume(0.1, 0.1)
+
+    probe = AudioLatencyProbe(frequency=frequency, buffer_size=device_buffer, enabled=True)
+    rng = random.Random(0)
+    frame_time = 1.0 / fps
+    underruns = 0
+    frames = 0
+    started = False
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        frame_start = time.perf_counter()
+        # 推流前通道已空闲说明上一帧排队的数据已播完 → 出现断档
+        if started and not mixer.channel.get_busy():
+            underruns += 1
+        mixer.pump()
+        started = True
+        probe.record("stream", True, mixer.queued_blocks() * mixer.block_size)
+
+        _busy_wait(_frame_load(rng, load_ms))
+        frames += 1
+        _idle_wait(frame_time - (time.perf_counter() - frame_start))
+
+    mixer.stop_all()
+    stream = probe.summary().get("stream", {})
+    return {
+        "block": block_size,
+        "block_ms": block_size * 1000.0 / frequency,
+        "stream_latency_ms": stream.get("estimated_ms", 0.0),
+        "frames": frames,
+        "underruns": underruns
+    }
+
+
+def _sizes(text: str) -> list:
+    return [int(size) for size in text.split(",") if size.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="音频设备缓冲区 / 软件混音数据块大小报告")
+    parser.add_argument("--buffers", default="256,512,1024,2048", help="候选设备缓冲区 MIXER_BUFFER（逗号分隔，留空跳过）")
+    parser.add_argument("--blocks", default="256,512,1024,2048", help="候选软件混音数据块大小（逗号分隔，留空跳过）")
+    parser.add_argument("--device-buffer", type=int, default=MIXER_BUFFER, help="数据块扫描时使用的设备缓冲区（帧）")
+    parser.add_argument("--seconds", type=float, default=3.0, help="每个候选值的测试时长（秒）")
+    parser.add_argument("--fps", type=int, default=60, help="模拟的游戏帧率")
+    parser.add_argument("--load-ms", type=float, default=8.0, help="每帧模拟的平均负载（毫秒）")
+    parser.add_argument("--voices", type=int, default=8, help="软件混音同时混音的敌人声源数")
+    parser.add_argument("--cue-ms", type=int, default=100, help="设备缓冲区扫描中提示音时长（毫秒）")
+    parser.add_argument("--tolerance-ms", type=float, default=5.0, help="实测延迟超过一个缓冲周期多少毫秒算断流")
+    args = parser.parse_args()
+
+    pygame.init()
+    buffers = _sizes(args.buffers)
+    if buffers:
+        rows = [measure_buffer(size, args.seconds, args.fps, args.load_ms, args.cue_ms, args.tolerance_ms)
+                for size in buffers]
+        print(f"设备缓冲区扫描：采样率 {pygame.mixer.get_init()[0]}Hz，{args.fps} 帧/秒，每帧负载约 {args.load_ms}ms，"
+              f"提示音 {args.cue_ms}ms")
+        print(f"{'缓冲区':>8}{'周期ms':>10}{'提示音数':>10}{'实测均值ms':>12}{'p95ms':>10}{'最大ms':>10}{'断流':>8}")
+        for row in rows:
+            print(f"{row['buffer']:>8}{row['buffer_ms']:>10.1f}{row['cues']:>10}{row['mean_ms']:>12.1f}"
+                  f"{row['p95_ms']:>10.1f}{row['max_ms']:>10.1f}{row['underruns']:>8}")
+        stable = [row["buffer"] for row in rows if row["cues"] and row["underruns"] == 0]
+        if stable:
+            print(f"✅ 推荐 MIXER_BUFFER = {min(stable)}（本机不断流的最小设备缓冲区）")
+        else:
+            print("❌ 所有候选设备缓冲区均出现断流，请尝试更大的缓冲区")
+
+    blocks = _sizes(args.blocks)
+    if blocks:
+        frequency = _init_mixer(args.device_buffer)
+        rows = [measure_block(size, args.seconds, args.fps, args.load_ms, args.voices, args.device_buffer)
+                for size in blocks]
+        print(f"软件混音数据块扫描：设备缓冲区 {args.device_buffer} 帧，采样率 {frequency}Hz，{args.fps} 帧/秒推流")
+        print(f"{'数据块':>8}{'块时长ms':>12}{'软件混音估算延迟ms':>20}{'帧数':>8}{'断档':>8}")
+        for row in rows:
+            print(f"{row['block']:>8}{row['block_ms']:>12.1f}{row['stream_latency_ms']:>20.1f}"
+                  f"{row['frames']:>8}{row['underruns']:>8}")
+        stable = [row["block"] for row in rows if row["underruns"] == 0]
+        if stable:
+            print(f"✅ 推荐 SOFT_MIXER_BLOCK_SIZE = {min(stable)}（软件混音模式下本机不断档的最小数据块）")
+        else:
+            print("❌ 所有候选数据块均出现断档，请尝试更大的数据块")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""子弹-敌人碰撞检测基准测试：逐对双重循环 / 全矩阵向量化 / 网格宽相
+
+按实体数量扫描，敌人分布在屏幕及屏幕外生成区，子弹分布在屏幕内；
+最后检查高速子弹在大步长下是否会穿透敌人。
+
+用法（在项目根目录执行）：python -m tools.bench_collisions
+"""
+import math
+import time
+
+import numpy
+
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, COLLISION_CELL_SIZE
+from core.collision import SpatialHash, find_bullet_hits
+
+# (子弹数, 敌人数)
+SWEEP = [(50, 8), (200, 32), (500, 64), (1000, 128), (2000, 256), (5000, 512)]
+# 逐对循环太慢，超过该组合数后跳过
+NESTED_LOOP_LIMIT = 200_000
+
+
+def _make_scene(num_bullets: int, num_enemies: int, seed: int = 0):
+    rng = numpy.random.default_rng(seed)
+    bx = rng.uniform(0, SCREEN_WIDTH, num_bullets)
+    by = rng.uniform(0, SCREEN_HEIGHT, num_bullets)
+    bsize = rng.integers(4, 9, num_bullets)
+    ex = rng.uniform(-500, SCREEN_WIDTH + 500, num_enemies)
+    ey = rng.uniform(-500, SCREEN_HEIGHT + 500, num_enemies)
+    esize = numpy.full(num_enemies, 35) // 2
+    return bx, by, bsize, ex, ey, esize
+
+
+def nested_loop(bx, by, bsize, ex, ey, esize):
+    """原 check_collisions 的 O(子弹×敌人) 逐对 math.hypot"""
+    hits = 0
+    for i in range(len(bx)):
+        for j in range(len(ex)):
+            if math.hypot(bx[i] - ex[j], by[i] - ey[j]) < esize[j] + bsize[i]:
+                hits += 1
+                break
+    return hits
+
+
+def full_matrix(bx, by, bsize, ex, ey, esize):
+    """一次构建完整距离矩阵的向量化暴力检测"""
+    dist = numpy.hypot(bx[:, None] - ex[None, :], by[:, None] - ey[None, :])
+    return int(numpy.any(dist < esize[None, :] + bsize[:, None], axis=1).sum())
+
+
+def spatial_hash(bx, by, bsize, ex, ey, esize, grid=SpatialHash(COLLISION_CELL_SIZE)):
+    hit_bullets, _ = find_bullet_hits(grid, bx, by, bx, by, bsize, ex, ey, esize)
+    return int(numpy.unique(hit_bullets).size)
+
+
+def _time(func, scene, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*scene)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def main(repeat: int = 5):
+    print(f"{'子弹':>6}{'敌人':>6}{'逐对循环ms':>12}{'全矩阵ms':>12}{'网格宽相ms':>12}{'命中子弹数':>10}")
+    for num_bullets, num_enemies in SWEEP:
+        scene = _make_scene(num_bullets, num_enemies)
+        if num_bullets * num_enemies <= NESTED_LOOP_LIMIT:
+            loop_ms, loop_hits = _time(nested_loop, scene, 1)
+            loop_text = f"{loop_ms:.2f}"
+        else:
+            loop_hits = None
+            loop_text = "-"
+        matrix_ms, matrix_hits = _time(full_matrix, scene, repeat)
+        grid_ms, grid_hits = _time(spatial_hash, scene, repeat)
+        # 三种实现命中的子弹数必须一致
+        assert grid_hits == matrix_hits and loop_hits in (None, matrix_hits)
+        print(f"{num_bullets:>6}{num_enemies:>6}{loop_text:>12}{matrix_ms:>12.2f}{grid_ms:>12.2f}{grid_hits:>10}")
+
+
+def tunneling_check(step_scales=(1, 2, 4, 8), num_bullets: int = 2000, seed: int = 1):
+    """高速子弹穿透检查：子弹从中心以 98K 弹速 × 步长倍数射向敌人，对比仅检测终点与扫掠检测的命中率"""
+    rng = numpy.random.default_rng(seed)
+    angles = rng.uniform(0, 2 * numpy.pi, num_bullets)
+    ex = SCREEN_WIDTH / 2 + numpy.cos(angles) * 200
+    ey = SCREEN_HEIGHT / 2 + numpy.sin(angles) * 200
+    esize = numpy.full(num_bullets, 35) // 2
+    bsize = numpy.full(num_bullets, 4)
+    grid = SpatialHash(COLLISION_CELL_SIZE)
+    print(f"{'步长倍数':>8}{'终点检测命中率':>16}{'扫掠检测命中率':>16}")
+    for scale in step_scales:
+        speed = 15 * scale
+        # 每颗子弹单独对准自己的敌人，逐步推进直到越过敌人
+        hit_point = numpy.zeros(num_bullets, dtype=bool)
+        hit_swept = numpy.zeros(num_bullets, dtype=bool)
+        x = numpy.full(num_bullets, SCREEN_WIDTH / 2)
+        y = numpy.full(num_bullets, SCREEN_HEIGHT / 2)
+        for _ in range(int(300 / speed) + 2):
+            nx = x + numpy.cos(angles) * speed
+            ny = y + numpy.sin(angles) * speed
+            hit_point |= numpy.hypot(nx - ex, ny - ey) < esize + bsize
+            b_idx, e_idx = find_bullet_hits(grid, x, y, nx, ny, bsize, ex, ey, esize)
+            hit_swept[b_idx[b_idx == e_idx]] = True
+            x, y = nx, ny
+        print(f"{scale:>8}{hit_point.mean():>16.1%}{hit_swept.mean():>16.1%}")
+
+
+if __name__ == "__main__":
+    main()
+    tunneling_check()
@@ -0,0 +1,116 @@
+"""音效合成基准测试：逐采样循环 vs NumPy 整段合成
+
+用法（在项目根目录执行）：python -m tools.bench_sound_synth
+"""
+import math
+import time
+
+import numpy
+
+from utils.sound_synth import SAMPLE_RATE, synth_wave, synth_mixed_sines
+
+# GamePage 构造时合成的全部音效参数（10个音效 + 4个敌人方位音效）
+SOUND_PARAMS = [
+    (800, 400, 0.1, 0.4, "square"),
+    (600, 400, 0.2, 0.5, "sawtooth"),
+    (800, 1000, 0.1, 0.6, "sawtooth"),
+    (1000, 800, 0.08, 0.5, "sawtooth"),
+    (1200, 1500, 0.05, 0.3, "sine"),
+    (2000, 1800, 0.03, 0.3, "square"),
+    (500, 200, 0.2, 0.5, "sawtooth"),
+    (200, 50, 1.0, 0.7, "sawtooth"),
+    (800, 800, 0.05, 0.4, "sine"),
+    (1000, 1000, 0.05, 0.4, "sine"),
+    (300, 250, 0.6, 0.8, "sawtooth"),
+    (350, 300, 0.6, 0.8, "sawtooth"),
+    (400, 350, 0.6, 0.8, "sawtooth"),
+    (450, 400, 0.6, 0.8, "sawtooth"),
+]
+
+
+def legacy_generate_sound(freq_start, freq_end, duration, volume=0.5, wave_type="square"):
+    """原 GamePage._generate_sound 的逐采样实现（仅用于对比）"""
+    sample_rate = SAMPLE_RATE
+    num_samples = int(sample_rate * duration)
+    samples = []
+    for i in range(num_samples):
+        t = i / sample_rate
+        freq = freq_start + (freq_end - freq_start) * (t / duration)
+        if wave_type == "square":
+            value = 32767 if math.sin(2 * math.pi * freq * t) > 0 else -32768
+        elif wave_type == "sawtooth":
+            value = int(32767 * (2 * (t * freq - math.floor(t * freq + 0.5))))
+        elif wave_type == "sine":
+            value = int(32767 * math.sin(2 * math.pi * freq * t))
+        else:
+            value = 0
+        decay = 1.0 - (t / duration)
+        value = int(value * volume * decay)
+        samples.append(value.to_bytes(2, byteorder='little', signed=True))
+    return b''.join(samples)
+
+
+def legacy_player_hit_sound():
+    """原 GamePage._generate_player_hit_sound 的逐采样实现（仅用于对比）"""
+    sample_rate = SAMPLE_RATE
+    duration = 0.2
+    num_samples = int(sample_rate * duration)
+    samples = []
+    for i in range(num_samples):
+        t = i / sample_rate
+        sine1 = math.sin(2 * math.pi * 440 * t)
+        sine2 = math.sin(2 * math.pi * 880 * t)
+        value = int(32767 * (sine1 + sine2) * 0.2)
+        decay = 1.0 - (t / duration)
+        value = int(value * decay)
+        samples.append(value.to_bytes(2, byteorder='little', signed=True))
+    return b''.join(samples)
+
+
+def _run_legacy():
+    buffers = [legacy_generate_sound(*params) for params in SOUND_PARAMS]
+    buffers.append(legacy_player_hit_sound())
+    return buffers
+
+
+def _run_numpy():
+    buffers = [synth_wave(*params).tobytes() for params in SOUND_PARAMS]
+    buffers.append(synth_mixed_sines((440, 880), 0.2, gain=0.2).tobytes())
+    return buffers
+
+
+def _best_of(func, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _mismatched_samples(a: bytes, b: bytes) -> int:
+    arr_a = numpy.frombuffer(a, dtype="<i2")
+    arr_b = numpy.frombuffer(b, dtype="<i2")
+    if arr_a.shape != arr_b.shape:
+        return max(arr_a.size, arr_b.size)
+    return int(numpy.count_nonzero(arr_a != arr_b))
+
+
+def main(repeat: int = 3):
+    legacy_time, legacy_buffers = _best_of(_run_legacy, repeat)
+    numpy_time, numpy_buffers = _best_of(_run_numpy, repeat)
+
+    total_samples = sum(len(buf) // 2 for buf in legacy_buffers)
+    mismatched = sum(_mismatched_samples(a, b) for a, b in zip(legacy_buffers, numpy_buffers))
+
+    print(f"音效数量：{len(legacy_buffers)}，总采样数：{total_samples}")
+    print(f"逐采样循环：{legacy_time * 1000:.1f} ms")
+    print(f"NumPy合成：{numpy_time * 1000:.1f} ms")
+    print(f"加速比：{legacy_time / numpy_time:.1f}x")
+    # math.sin 与 numpy.sin 末位精度不同，方波过零点处可能有个别采样符号相反
+    print(f"不一致采样数：{mismatched}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""难度参数扫描
+
+对 config 中的生成/敌人参数做网格搜索或随机搜索：每组参数用瞄准机器人跑多个种子的无界面对局，
+对局分批交给进程池（每个进程只创建一次 HeadlessRunner，音效只合成一次），
+最后按参数组汇总存活时长、得分、击杀的分布并写入CSV。
+
+用法（在项目根目录执行）：
+    python -m tools.difficulty_sweep --grid ENEMY_ELITE_CHANCE=0.2,0.3,0.4 --grid SPAWN_SPEEDUP_RATE=30,50,70 --seeds 1-20
+    python -m tools.difficulty_sweep --random 30 --range ENEMY_BASE_HEALTH=100:250 --range MAX_ENEMIES=4:12 --out sweep.csv
+"""
+import argparse
+import csv
+import itertools
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy
+
+import config
+from tools.headless_match import parse_seeds
+
+# 可扫描的参数（GamePage 上的同名属性，默认值取自 config）
+SWEEP_PARAMS = (
+    "MAX_ENEMIES", "BASE_SPAWN_INTERVAL", "MIN_SPAWN_INTERVAL", "SPAWN_SPEEDUP_RATE",
+    "MIN_SPAWN_DISTANCE", "MAX_SPAWN_DISTANCE", "RELOAD_TIME",
+    "ENEMY_BASE_HEALTH", "ENEMY_ELITE_HEALTH", "ENEMY_BASE_DAMAGE", "ENEMY_ELITE_DAMAGE",
+    "ENEMY_ELITE_SPEED_MULTIPLIER", "ENEMY_ELITE_CHANCE", "ENEMY_BURST_CHANCE",
+    "ENEMY_STRENGTH_INCREMENT", "ENEMY_STRENGTH_INTERVAL", "ENEMY_CONTACT_RADIUS",
+)
+SEEDS_PER_TASK = 5  # 每个进程池任务跑的种子数
+
+# 子进程中的运行器（进程池初始化时创建）
+_runner = None
+_defaults = {}
+
+
+def _param_type(name: str):
+    return int if isinstance(getattr(config, name), int) else float
+
+
+def parse_grid(specs: list) -> list:
+    """解析 NAME=v1,v2,... 列表，返回各参数取值的笛卡尔积"""
+    axes = []
+    for spec in specs:
+        name, values = _split_spec(spec)
+        cast = _param_type(name)
+        axes.append([(name, cast(value)) for value in values.split(",") if value.strip()])
+    return [dict(combo) for combo in itertools.product(*axes)]
+
+
+def parse_random(specs: list, count: int, seed: int) -> list:
+    """解析 NAME=lo:hi 列表，在各自区间内均匀随机抽取 count 组参数（整数参数取整数）"""
+    rng = random.Random(seed)
+    ranges = []
+    for spec in specs:
+        name, bounds = _split_spec(spec)
+        low, high = (float(value) for value in bounds.split(":", 1))
+        ranges.append((name, low, high, _param_type(name)))
+    return [{name: rng.randint(int(low), int(high)) if cast is int else rng.uniform(low, high)
+             for name, low, high, cast in ranges} for _ in range(count)]
+
+
+def _split_spec(spec: str):
+    if "=" not in spec:
+        raise ValueError(f"参数格式应为 NAME=...：{spec}")
+    name, value = spec.split("=", 1)
+    name = name.strip().upper()
+    if name not in SWEEP_PARAMS:
+        raise ValueError(f"不支持扫描的参数：{name}（可选：{', '.join(SWEEP_PARAMS)}）")
+    return name, value
+
+
+# -------------------------- 子进程 --------------------------
+def _init_worker(weapon_name: str):
+    global _runner
+    from utils.headless import HeadlessRunner
+    _runner = HeadlessRunner(weapon_name, audio=False)
+    _defaults.update({name: getattr(_runner.page, name) for name in SWEEP_PARAMS})
+
+
+def _run_task(overrides: dict, seeds: list, max_seconds: float, jitter: float) -> list:
+    """按参数组覆盖 GamePage 属性（未覆盖的恢复默认）后逐个种子跑一局"""
+    from utils.headless import AimBot
+    page = _runner.page
+    for name in SWEEP_PARAMS:
+        setattr(page, name, overrides.get(name, _defaults[name]))
+    page.configure_spawns()
+    bot = AimBot(jitter=jitter)
+    return [_runner.run_match(seed, max_seconds, bot) for seed in seeds]
+
+
+# -------------------------- 汇总 --------------------------
+def summarize(rows: list) -> dict:
+    """一组参数下所有对局的分布统计"""
+    survival = numpy.array([row["sim_seconds"] for row in rows])
+    score = numpy.array([row["score"] for row in rows])
+    kills = numpy.array([row["kills"] for row in rows])
+    p10, p50, p90 = numpy.percentile(survival, [10, 50, 90])
+    s10, s50, s90 = numpy.percentile(score, [10, 50, 90])
+    return {
+        "matches": len(rows),
+        "survived_rate": round(float(numpy.mean([not row["game_over"] for row in rows])), 4),
+        "survival_mean": round(float(survival.mean()), 2),
+        "survival_p10": round(float(p10), 2),
+        "survival_p50": round(float(p50), 2),
+        "survival_p90": round(float(p90), 2),
+        "score_mean": round(float(score.mean()), 1),
+        "score_p10": float(s10),
+        "score_p50": float(s50),
+        "score_p90": float(s90),
+        "kills_mean": round(float(kills.mean()), 2),
+        "wall_seconds": round(sum(row["wall_seconds"] for row in rows), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="难度参数扫描")
+    parser.add_argument("--grid", action="append", default=[], help="网格搜索：NAME=v1,v2,...（可重复）")
+    parser.add_argument("--random", type=int, default=0, help="随机搜索的参数组数（配合 --range）")
+    parser.add_argument("--range", action="append", default=[], help="随机搜索区间：NAME=lo:hi（可重复）")
+    parser.add_argument("--weapon", default="P92", help="机器人使用的武器（与 headless_match 默认一致）")
+    parser.add_argument("--seeds", default="1-10", help="每组参数跑的种子，如 1,2,5-8")
+    parser.add_argument("--max-seconds", type=float, default=60.0,
+                        help="每局模拟时长上限（游戏内秒；默认难度下机器人中位存活约50秒，上限过长时存活率恒为0）")
+    parser.add_argument("--jitter", type=float, default=0.05, help="机器人瞄准角度偏差（弧度）")
+    parser.add_argument("--workers", type=int, default=0, help="进程数，默认等于CPU核数")
+    parser.add_argument("--seed", type=int, default=1, help="随机搜索的种子")
+    parser.add_argument("--out", default="difficulty_sweep.csv", help="输出CSV路径")
+    args = parser.parse_args()
+
+    try:
+        configs = parse_grid(args.grid) if args.grid else [{}]
+        if args.random:
+            configs = [dict(base, **sample) for base in configs
+                       for sample in parse_random(args.range, args.random, args.seed)]
+    except ValueError as e:
+        parser.error(str(e))
+    seeds = parse_seeds(args.seeds)
+    names = [name for name in SWEEP_PARAMS if any(name in overrides for overrides in configs)]
+    print(f"共 {len(configs)} 组参数 × {len(seeds)} 个种子 = {len(configs) * len(seeds)} 局")
+
+    start = time.perf_counter()
+    results = [[] for _ in configs]
+    workers = args.workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(args.weapon,)) as pool:
+        futures = {}
+        for index, overrides in enumerate(configs):
+            for offset in range(0, len(seeds), SEEDS_PER_TASK):
+                future = pool.submit(_run_task, overrides, seeds[offset:offset + SEEDS_PER_TASK],
+                                     args.max_seconds, args.jitter)
+                futures[future] = index
+        for done, future in enumerate(as_completed(futures), 1):
+            results[futures[future]].extend(future.result())
+            if done % max(1, len(futures) // 10) == 0:
+                print(f"  {done}/{len(futures)} 批完成（{time.perf_counter() - start:.1f}s）")
+
+    rows = []
+    for index, (overrides, matches) in enumerate(zip(configs, results)):
+        rows.append(dict({"config": index}, **{name: overrides.get(name, getattr(config, name)) for name in names},
+                         **summarize(matches)))
+    directory = os.path.dirname(args.out)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(args.out, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+    print(f"{'组':>4}  {'参数':<48}{'存活率':>8}{'存活中位s':>10}{'得分中位':>9}{'击杀均值':>9}")
+    for row in rows:
+        params = " ".join(f"{name}={row[name]:.3g}" for name in names)
+        print(f"{row['config']:>4}  {params:<48}{row['survived_rate']:>9.0%}{row['survival_p50']:>12.1f}"
+              f"{row['score_p50']:>11.0f}{row['kills_mean']:>11.2f}")
+    print(f"✅ 已写入 {args.out}（总耗时 {time.perf_counter() - start:.1f}s）")
+
+
+if __name__ == "__main__":
+    main()
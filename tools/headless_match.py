@@ -0,0 +1,72 @@
+"""无界面批量对局
+
+在 SDL dummy 驱动下用模拟时钟驱动 GamePage，按种子跑多局并输出结算表，
+用于批量评估难度/武器，以及在没有显示器的CI中做性能测试。--check 时每个种子跑两遍并比对结果，
+--record-dir 时把每局输入保存为录像（可用 tools.replay 回放）。
+
+用法（在项目根目录执行）：
+    python -m tools.headless_match --weapon M416 --seeds 1-20 --max-seconds 180 --check
+"""
+import argparse
+import os
+
+from utils.headless import HeadlessRunner, AimBot
+
+# 与运行耗时相关、不参与确定性比对的字段
+_TIMING_FIELDS = ("wall_seconds", "speedup")
+
+
+def parse_seeds(text: str) -> list:
+    """解析 "1,2,5-8" 形式的种子列表"""
+    seeds = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            seeds.extend(range(int(start), int(end) + 1))
+        else:
+            seeds.append(int(part))
+    return seeds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="无界面批量对局")
+    parser.add_argument("--weapon", default="P92", help="使用的武器名称（见 core/Weapon.py 的 DEFAULT_WEAPONS）")
+    parser.add_argument("--seeds", default="1-5", help="种子列表，如 1,2,5-8")
+    parser.add_argument("--max-seconds", type=float, default=300.0, help="每局模拟时长上限（游戏内秒）")
+    parser.add_argument("--jitter", type=float, default=0.05, help="机器人瞄准角度偏差（弧度）")
+    parser.add_argument("--no-audio", action="store_true", help="跳过方位音效刷新，只跑游戏逻辑")
+    parser.add_argument("--render", action="store_true", help="每步同时执行绘制（包含渲染开销）")
+    parser.add_argument("--check", action="store_true", help="每个种子跑两遍，校验结果一致")
+    parser.add_argument("--record-dir", default=None, help="把每局输入录像保存到该目录")
+    parser.add_argument("--no-fast-forward", action="store_true", help="场上无敌人时也逐步运行（默认直接跳到下一次生成）")
+    args = parser.parse_args()
+
+    runner = HeadlessRunner(args.weapon, audio=not args.no_audio, render=args.render,
+                            fast_forward=not args.no_fast_forward)
+    bot = AimBot(jitter=args.jitter)
+    mismatches = 0
+    print(f"{'种子':>6}{'模拟秒':>10}{'得分':>8}{'击杀':>6}{'射击':>6}{'血量':>6}{'结束':>6}{'耗时s':>8}{'倍速':>8}")
+    for seed in parse_seeds(args.seeds):
+        record_path = os.path.join(args.record_dir, f"{args.weapon}_seed{seed}.sgr") if args.record_dir else None
+        row = runner.run_match(seed, args.max_seconds, bot, record_path)
+        print(f"{seed:>6}{row['sim_seconds']:>10.1f}{row['score']:>8}{row['kills']:>6}{row['shots']:>6}"
+              f"{row['hp']:>6}{'是' if row['game_over'] else '否':>6}{row['wall_seconds']:>8.2f}{row['speedup']:>8.0f}")
+        if args.check:
+            again = runner.run_match(seed, args.max_seconds, bot)
+            if any(row[key] != again[key] for key in row if key not in _TIMING_FIELDS):
+                mismatches += 1
+                print(f"❌ 种子 {seed} 两次结果不一致：{again}")
+    runner.close()
+
+    if args.check:
+        if mismatches:
+            print(f"❌ {mismatches} 个种子结果不可复现")
+            raise SystemExit(1)
+        print("✅ 所有种子结果可复现")
+
+
+if __name__ == "__main__":
+    main()
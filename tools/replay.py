@@ -0,0 +1,87 @@
+"""录像回放
+
+读取游戏页录制的输入录像（config.REPLAY_RECORD 开启后按ESC离开游戏页时保存，或 headless_match --record-dir 生成），
+按录像中的种子和装备开局，每个模拟步的输入都来自录像，与实时游戏走同一条代码路径。
+窗口模式可直接观看；--headless 时无界面尽快跑完，可作为可复现的性能测试负载；--check 比对结算结果与录制时是否一致。
+
+用法（在项目根目录执行）：
+    python -m tools.replay replays/replay_20250101_120000.sgr
+    python -m tools.replay replays/replay_20250101_120000.sgr --headless --check
+"""
+import argparse
+
+import pygame
+
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, MIXER_FREQUENCY, MIXER_BUFFER
+from core.User import User
+from main import PageManager, run_main_loop
+from pages.base_page import BasePage
+from pages.game_page import GamePage
+from utils.fixed_timestep import FixedTimestep
+from utils.headless import HeadlessRunner
+from utils.input_replay import Replay
+
+# 比对时忽略的字段（与运行环境有关）
+_TIMING_FIELDS = ("wall_seconds", "speedup", "ticks", "sim_seconds", "weapon", "seed")
+
+
+def replay_windowed(replay: Replay) -> dict:
+    pygame.mixer.pre_init(frequency=MIXER_FREQUENCY, size=-16, channels=2, buffer=MIXER_BUFFER)
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("录像回放")
+
+    page_manager = PageManager(screen)
+    page_manager.timestep = FixedTimestep(replay.tick_rate)
+    page = GamePage(screen, page_manager)
+    page.persist_results = False
+    page.set_current_user(User("replay", ""))
+    page_manager.register_page("game", page)
+    # 游戏页按ESC时切换到主页：注册一个空白页作为主页，切走游戏页即结束回放
+    page_manager.register_page("home", BasePage)
+    page_manager.switch_page("game")
+    page.start_replay(replay)
+
+    # 播完或按ESC（切走游戏页）时结束
+    run_main_loop(page_manager, lambda: page.replay_finished or page_manager.current_page is not page)
+    result = page.match_result()
+    pygame.quit()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="录像回放")
+    parser.add_argument("path", help="录像文件路径")
+    parser.add_argument("--headless", action="store_true", help="无界面尽快回放")
+    parser.add_argument("--check", action="store_true", help="比对回放结果与录制时的结算结果")
+    args = parser.parse_args()
+
+    replay = Replay.load(args.path)
+    print(f"录像：种子 {replay.seed}，{len(replay)} 步（{len(replay) / replay.tick_rate:.1f} 秒）")
+    sim_version = replay.meta.get("sim_version", 1)
+    if sim_version != GamePage.SIM_VERSION:
+        print(f"❌ 录像的模拟版本为 {sim_version}，当前为 {GamePage.SIM_VERSION}，回放结果可能与录制时不同")
+    if args.headless:
+        runner = HeadlessRunner(tick_rate=replay.tick_rate)
+        result = runner.run_replay(replay)
+        runner.close()
+        print(f"回放耗时 {result['wall_seconds']:.2f}s（{result['speedup']:.0f} 倍速）")
+    else:
+        result = replay_windowed(replay)
+    print(f"得分 {result['score']}，击杀 {result['kills']}，射击 {result['shots']}，血量 {result['hp']}")
+
+    if args.check:
+        expected = replay.meta.get("result")
+        if not expected:
+            print("❌ 录像中没有结算结果，无法校验")
+            raise SystemExit(1)
+        diff = {key: (value, result.get(key)) for key, value in expected.items()
+                if key not in _TIMING_FIELDS and result.get(key) != value}
+        if diff:
+            print(f"❌ 回放结果与录制时不一致：{diff}")
+            raise SystemExit(1)
+        print("✅ 回放结果与录制时一致")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""启动耗时分析
+
+在子进程中冷启动游戏直到登录页首帧刷新到屏幕，报告首帧耗时；加 -X importtime 统计启动期间每个模块的导入耗时，
+按自身耗时和累计耗时排序，并检查应当延迟导入的模块（numpy、pymysql、游戏页）是否在首帧之前被项目代码导入，
+列出导入链。pygame 2 的包初始化自身会导入 numpy（pygame.surfarray），这一条不算项目代码导入。
+延迟只到首帧为止：首帧之后登录页空闲时 PageManager 会预创建游戏页，游戏页及其导入的 numpy、音效合成等模块随之加载。
+
+用法（在项目根目录执行）：
+    python -m tools.startup_profile
+    python -m tools.startup_profile --top 30 --window
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+# 登录页首帧之前不应被项目代码导入的模块（第一次用到时才导入）
+LAZY_MODULES = ("numpy", "pymysql", "pages.game_page")
+# 这些第三方包自身导入的模块不计入（pygame 包初始化时会导入 numpy）
+THIRD_PARTY_IMPORTERS = ("pygame",)
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# 子进程：启动到登录页首帧后退出，最后一行输出首帧耗时和已导入的延迟模块
+_CHILD = (
+    "import json, sys, main\n"
+    "first_frame_ms = main.main(first_frame_only=True)\n"
+    f"lazy = [name for name in {LAZY_MODULES!r} if name in sys.modules]\n"
+    "print(json.dumps({'first_frame_ms': first_frame_ms, 'lazy_modules_loaded': lazy}))\n"
+)
+
+
+def run_startup(importtime: bool = False, headless: bool = True) -> dict:
+    """冷启动一次，返回 {"first_frame_ms", "lazy_modules_loaded", "imports": [(模块, 自身us, 累计us, 层级), ...]}"""
+    env = dict(os.environ)
+    if headless:
+        env["SDL_VIDEODRIVER"] = "dummy"
+        env["SDL_AUDIODRIVER"] = "dummy"
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", _CHILD]
+    proc = subprocess.run(command, cwd=_ROOT, env=env, capture_output=True, text=True, encoding="utf-8",
+                          errors="replace")
+    if proc.returncode != 0:
+        raise RuntimeError(f"启动子进程失败（退出码 {proc.returncode}）：\n{proc.stderr[-2000:]}")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["imports"] = parse_importtime(proc.stderr) if importtime else []
+    return result
+
+
+def parse_importtime(text: str) -> list:
+    """解析 -X importtime 输出（"import time: 自身 | 累计 | 模块名"，模块名前的缩进表示嵌套层级）"""
+    imports = []
+    for line in text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # 表头
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        imports.append((name.strip(), int(fields[0]), int(fields[1]), depth))
+    return imports
+
+
+def import_chain(imports: list, module: str) -> list:
+    """module 第一次被导入时的导入链 [module, 导入它的模块, ..., 顶层导入]"""
+    # importtime 先输出被导入的模块，再输出导入它的模块，层级逐级变浅
+    for i, (name, _, _, depth) in enumerate(imports):
+        if name == module:
+            chain = [name]
+            for parent, _, _, parent_depth in imports[i + 1:]:
+                if parent_depth < depth:
+                    chain.append(parent)
+                    depth = parent_depth
+            return chain
+    return []
+
+
+def lazy_violations(imports: list) -> dict:
+    """首帧之前被项目代码导入的延迟模块 {模块: 导入链}（经 THIRD_PARTY_IMPORTERS 导入的不算）"""
+    violations = {}
+    for module in LAZY_MODULES:
+        chain = import_chain(imports, module)
+        if chain and not any(name.split(".")[0] in THIRD_PARTY_IMPORTERS for name in chain[1:]):
+            violations[module] = chain
+    return violations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="启动耗时分析")
+    parser.add_argument("--top", type=int, default=20, help="列出导入耗时最高的模块数")
+    parser.add_argument("--window", action="store_true", help="打开真实窗口（默认使用SDL dummy驱动）")
+    args = parser.parse_args()
+
+    result = run_startup(importtime=True, headless=not args.window)
+    imports = result["imports"]
+    total_us = sum(self_us for _, self_us, _, _ in imports)
+    packages = defaultdict(int)
+    for name, self_us, _, _ in imports:
+        packages[name.split(".")[0]] += self_us
+
+    print(f"登录页首帧耗时：{result['first_frame_ms']:.0f}ms（其中模块导入 {total_us / 1000:.0f}ms，共 {len(imports)} 个模块）")
+    print("\n按顶层包汇总（自身耗时）：")
+    for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {self_us / 1000:>8.1f}ms  {package}")
+    print(f"\n自身耗时最高的 {args.top} 个模块：")
+    for name, self_us, cumulative_us, _ in sorted(imports, key=lambda item: -item[1])[:args.top]:
+        print(f"  {self_us / 1000:>8.1f}ms  （累计 {cumulative_us / 1000:>7.1f}ms）  {name}")
+    print(f"\n累计耗时最高的 {args.top} 个顶层导入：")
+    for name, self_us, cumulative_us, _ in sorted((item for item in imports if item[3] == 0),
+                                                  key=lambda item: -item[2])[:args.top]:
+        print(f"  {cumulative_us / 1000:>8.1f}ms  {name}")
+
+    violations = lazy_violations(imports)
+    for module, chain in violations.items():
+        print(f"\n❌ {module} 应延迟导入，但在首帧之前已被导入：{' <- '.join(chain)}")
+    if not violations:
+        print(f"\n✅ 延迟导入的模块（{', '.join(LAZY_MODULES)}）在首帧之前均未被项目代码导入")
+    for module in result["lazy_modules_loaded"]:
+        if module not in violations:
+            print(f"  {module} 由第三方包导入：{' <- '.join(import_chain(imports, module))}")
+
+
+if __name__ == "__main__":
+    main()
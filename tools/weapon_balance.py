@@ -0,0 +1,383 @@
+"""武器平衡蒙特卡洛模拟
+
+不运行游戏，按 GamePage 的规则对 DEFAULT_WEAPONS 中每把武器（使用射速最快的模式）做批量随机试验：
+1. 击杀时间（TTK）：命中率为 --accuracy 时击杀普通/精英敌人所需时间，弹夹余量随机，含换弹停顿；
+2. 持续DPS：连续射击并计入换弹时间（RELOAD_TIME）的平均每秒伤害；
+3. 弹药经济：每次击杀消耗的子弹与 random_reload_ammo 掉落的补给相抵，连续 --kills 次击杀内弹尽的概率；
+4. 生存概率：按难度曲线（core.spawn_scheduler）生成敌人，按到达先后依次射击（近似机器人优先瞄准最近的敌人），
+   敌人进入子弹射程（屏幕外 BulletStore.EXPIRE_MARGIN 以内，更远处的子弹在命中前就会被删除）后才开火，
+   统计撑过 --max-seconds 的比例。
+
+每项试验都是整批NumPy数组运算，按块分给进程池并行，块之间使用独立的随机种子序列，结果可复现。
+生存模型不计同屏敌人上限和子弹顺带命中其他敌人，结果偏保守，适合比较武器之间的相对强弱。
+
+用法（在项目根目录执行）：
+    python -m tools.weapon_balance --trials 1000000 --accuracy 0.6
+    python -m tools.weapon_balance --weapons M416,AKM --survival-trials 100000 --max-seconds 120
+"""
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy
+
+from config import (SCREEN_WIDTH, SCREEN_HEIGHT, SIM_TICK_RATE, RELOAD_TIME, BASE_SPAWN_INTERVAL,
+                    MIN_SPAWN_INTERVAL, SPAWN_SPEEDUP_RATE, MIN_SPAWN_DISTANCE, MAX_SPAWN_DISTANCE,
+                    ENEMY_BASE_HEALTH, ENEMY_ELITE_HEALTH, ENEMY_BASE_DAMAGE, ENEMY_ELITE_DAMAGE,
+                    ENEMY_BASE_SPEED, ENEMY_ELITE_SPEED_MULTIPLIER, ENEMY_ELITE_CHANCE, ENEMY_BURST_CHANCE,
+                    ENEMY_CONTACT_RADIUS, BULLET_MAX_DISTANCE)
+from core.Player import Player
+from core.Weapon import DEFAULT_WEAPONS
+from core.entities import EnemyStore, BulletStore
+from core.spawn_scheduler import SpawnScheduler
+
+# 敌人属性（取自 config 和 EnemyStore，与 GamePage 一致；不模拟随时间的强度提升），下标0为普通、1为精英
+ENEMY_HEALTH = numpy.array([ENEMY_BASE_HEALTH, ENEMY_ELITE_HEALTH])
+ENEMY_DAMAGE = numpy.array([ENEMY_BASE_DAMAGE, ENEMY_ELITE_DAMAGE])
+ENEMY_SPEED = ENEMY_BASE_SPEED  # 基础速度范围（标定帧率下每帧像素数）
+ELITE_SPEED_MULTIPLIER = ENEMY_ELITE_SPEED_MULTIPLIER
+# 进入屏幕（含边缘）后加速，精英在屏幕内再乘以额外倍率
+INSIDE_MARGIN = EnemyStore.INSIDE_MARGIN
+INSIDE_SPEED_MULTIPLIER = numpy.array([EnemyStore.INSIDE_MULTIPLIER,
+                                       EnemyStore.INSIDE_MULTIPLIER * EnemyStore.ELITE_MULTIPLIER])
+# 子弹飞出屏幕超过该边缘或超出射程即删除，更远的敌人打不到
+BULLET_MARGIN = BulletStore.EXPIRE_MARGIN
+ELITE_CHANCE = ENEMY_ELITE_CHANCE
+BURST_CHANCE = ENEMY_BURST_CHANCE
+KILL_SCORE = numpy.array([80, 200])
+REACH_RADIUS = ENEMY_CONTACT_RADIUS  # 敌人到达玩家的判定半径
+PLAYER_HP = Player().max_hp
+FRAME_MS = 1000 / EnemyStore.FRAME_RATE  # 敌人/子弹速度的标定帧长
+# 每个进程池任务的试验数
+CHUNK_TRIALS = 100_000
+SURVIVAL_CHUNK_TRIALS = 5_000
+
+
+def weapon_params(weapon, tick_rate: int = SIM_TICK_RATE) -> dict:
+    """提取模拟需要的武器参数（普通字典，便于传给子进程）
+
+    射击只在模拟步上发生，实际射击间隔为武器射速向上取整到整数步。
+    """
+    mode = "auto" if weapon.auto_rate else "single"
+    tick_ms = 1000 / tick_rate
+    rate = weapon.auto_rate if mode == "auto" else weapon.single_rate
+    return {
+        "name": weapon.name,
+        "mode": mode,
+        "damage": weapon.damage,
+        "interval": math.ceil(rate / tick_ms - 1e-9) * tick_ms,
+        "clip": weapon.clip_capacity,
+        "total_ammo": weapon.total_ammo,
+        "bullet_speed": weapon.bullet_speed,
+        "loot": [math.ceil(weapon.clip_capacity * 0.2), math.ceil(weapon.clip_capacity * 0.5)],
+    }
+
+
+def sustained_dps(params: dict, accuracy: float) -> float:
+    """连续射击的平均每秒伤害：每个弹夹打完后停顿 RELOAD_TIME"""
+    cycle_ms = params["clip"] * params["interval"] + RELOAD_TIME
+    return params["damage"] * accuracy * params["clip"] * 1000 / cycle_ms
+
+
+class ShotSampler:
+    """击杀所需射击次数的抽样器：所需命中次数固定，未命中次数服从负二项分布
+
+    普通/精英两档的分布各自预先算好累积分布表，抽样只需一次均匀随机数和二分查找，
+    比逐个元素调用 negative_binomial 快一个数量级。
+    """
+
+    def __init__(self, damage: float, accuracy: float, tail: float = 1e-12):
+        self.hits = numpy.ceil(ENEMY_HEALTH / damage).astype(numpy.int64)
+        self.cdfs = []
+        for hits in self.hits.tolist():
+            # P(未命中 j 次) 按递推 P(j) = P(j-1) * (hits + j - 1) / j * (1 - p) 计算到尾部概率足够小为止
+            pmf = [accuracy ** hits]
+            total = pmf[0]
+            while total < 1 - tail and accuracy < 1:
+                j = len(pmf)
+                pmf.append(pmf[-1] * (hits + j - 1) / j * (1 - accuracy))
+                total += pmf[-1]
+            self.cdfs.append(numpy.cumsum(pmf) / total)
+
+    def sample(self, rng, elite):
+        """elite 为0/1数组（0普通、1精英），返回同形状的射击次数"""
+        u = rng.random(elite.shape)
+        normal = self.hits[0] + numpy.searchsorted(self.cdfs[0], u)
+        if not elite.any():
+            return normal
+        return numpy.where(elite, self.hits[1] + numpy.searchsorted(self.cdfs[1], u), normal)
+
+
+def fire_duration(shots, clip, params: dict):
+    """从第一发到第 shots 发的耗时（毫秒）：弹夹打空后下一次射击先换弹"""
+    reloads = numpy.ceil(numpy.maximum(shots - clip, 0) / params["clip"])
+    return (shots - 1) * params["interval"] + reloads * RELOAD_TIME
+
+
+def spawn_times(max_ms: float, tick_ms: float) -> numpy.ndarray:
+    """难度曲线下各次生成的时间：事件在时间线到期后的第一个模拟步触发，下一次从触发时刻起算"""
+    scheduler = SpawnScheduler(None, SCREEN_WIDTH, SCREEN_HEIGHT, BASE_SPAWN_INTERVAL, MIN_SPAWN_INTERVAL,
+                               SPAWN_SPEEDUP_RATE, MIN_SPAWN_DISTANCE, MAX_SPAWN_DISTANCE)
+    times = []
+    last = 0.0
+    while True:
+        due = scheduler.next_spawn_after(last)
+        last = (math.floor(due / tick_ms) + 1) * tick_ms
+        if last > max_ms:
+            return numpy.array(times)
+        times.append(last)
+
+
+# -------------------------- 子进程中运行的试验块 --------------------------
+def _ttk_chunk(params: dict, accuracy: float, trials: int, seed) -> dict:
+    """击杀时间：开火时弹夹余量在 1~弹夹容量 之间均匀分布"""
+    rng = numpy.random.default_rng(seed)
+    sampler = ShotSampler(params["damage"], accuracy)
+    result = {}
+    for elite, label in ((0, "normal"), (1, "elite")):
+        shots = sampler.sample(rng, numpy.full(trials, elite))
+        clip = rng.integers(1, params["clip"] + 1, trials)
+        result[label] = fire_duration(shots, clip, params).astype(numpy.float32)
+    return result
+
+
+def _ammo_chunk(params: dict, accuracy: float, trials: int, kills: int, seed) -> dict:
+    """弹药经济：满弹开局连续击杀，每次击杀扣除射击数、加上掉落补给（备弹上限为携弹量的2倍）"""
+    rng = numpy.random.default_rng(seed)
+    sampler = ShotSampler(params["damage"], accuracy)
+    reserve_cap = params["total_ammo"] * 2
+    ammo = numpy.full(trials, params["total_ammo"], dtype=numpy.int64)  # 弹夹 + 备弹
+    kills_done = numpy.zeros(trials, dtype=numpy.int64)
+    net = numpy.zeros(trials, dtype=numpy.int64)
+    alive = numpy.ones(trials, dtype=bool)
+    for _ in range(kills):
+        elite = (rng.random(trials) < ELITE_CHANCE).astype(numpy.int64)
+        shots = sampler.sample(rng, elite)
+        loot = rng.integers(1, numpy.array(params["loot"])[elite] + 1)
+        alive &= ammo >= shots
+        ammo = numpy.where(alive, numpy.minimum(ammo - shots + loot, reserve_cap + params["clip"]), ammo)
+        kills_done += alive
+        net += numpy.where(alive, loot - shots, 0)
+    return {"kills": kills_done, "net": net}
+
+
+def _enemy_waves(rng, trials: int, times) -> dict:
+    """预先生成每局的全部敌人（每次生成事件两个槽位，第二个只在一次生成两个时存在），按到达时间排序
+
+    返回的数组形状均为 (试验, 槽位)，不存在的槽位到达时间为 inf；距离都是离中心的剩余路程。
+    """
+    shape = (trials, len(times) * 2)
+    present = numpy.ones(shape, dtype=bool)
+    present[:, 1::2] = rng.random((trials, len(times))) < BURST_CHANCE
+    spawn = numpy.broadcast_to(numpy.repeat(times, 2), shape)
+    elite = (rng.random(shape) < ELITE_CHANCE).astype(numpy.int64)
+    distance = rng.integers(MIN_SPAWN_DISTANCE, MAX_SPAWN_DISTANCE + 1, shape)
+    vertical = rng.random(shape) < 0.5  # 上下两侧 / 左右两侧
+    half_w, half_h = SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2
+    half_along = numpy.where(vertical, half_h, half_w)
+    along = half_along + distance
+    lateral = rng.random(shape) * numpy.where(vertical, SCREEN_WIDTH, SCREEN_HEIGHT) - numpy.where(vertical, half_w, half_h)
+
+    # 直线追向中心（沿轴向的坐标按比例缩小）：越过屏幕边缘 INSIDE_MARGIN 后加速，到达判定半径即造成伤害
+    path = numpy.hypot(along, lateral)
+    inside = path * (half_along + INSIDE_MARGIN) / along
+    in_range = numpy.minimum(path * numpy.minimum((half_along + BULLET_MARGIN) / along, 1.0), BULLET_MAX_DISTANCE)
+    speed = rng.uniform(*ENEMY_SPEED, shape) * numpy.where(elite, ELITE_SPEED_MULTIPLIER, 1.0) / FRAME_MS
+    inside_speed = speed * INSIDE_SPEED_MULTIPLIER[elite]
+    outside_ms = (path - inside) / speed
+    waves = {"spawn": spawn, "elite": elite, "path": path, "inside": inside, "speed": speed,
+             "inside_speed": inside_speed, "outside_ms": outside_ms}
+    waves["engage"] = spawn + _time_at(waves, in_range)
+    waves["arrive"] = numpy.where(present, spawn + _time_at(waves, REACH_RADIUS), numpy.inf)
+    order = numpy.argsort(waves["arrive"], axis=1, kind="stable")
+    return {key: numpy.take_along_axis(value, order, axis=1) for key, value in waves.items()}
+
+
+def _time_at(enemy: dict, remaining):
+    """生成后多久剩余路程降到 remaining"""
+    return numpy.where(remaining >= enemy["inside"], (enemy["path"] - remaining) / enemy["speed"],
+                       enemy["outside_ms"] + (enemy["inside"] - remaining) / enemy["inside_speed"])
+
+
+def _remaining_at(enemy: dict, elapsed):
+    """生成 elapsed 毫秒后离中心的剩余路程"""
+    return numpy.where(elapsed < enemy["outside_ms"], enemy["path"] - elapsed * enemy["speed"],
+                       enemy["inside"] - (elapsed - enemy["outside_ms"]) * enemy["inside_speed"])
+
+
+def _survival_chunk(params: dict, accuracy: float, trials: int, max_seconds: float, tick_rate: int, seed) -> dict:
+    """生存概率：按到达先后依次处理每局的敌人（近似机器人优先射击最近的敌人），敌人进入射程后才开火，
+    来不及击杀的敌人到达后造成伤害；每个敌人对全部试验向量化推进"""
+    rng = numpy.random.default_rng(seed)
+    sampler = ShotSampler(params["damage"], accuracy)
+    max_ms = max_seconds * 1000
+    clip_capacity = params["clip"]
+    reserve_cap = params["total_ammo"] * 2
+    loot_max = numpy.array(params["loot"])
+    bullet_speed = params["bullet_speed"] / FRAME_MS  # 像素/毫秒
+    waves = _enemy_waves(rng, trials, spawn_times(max_ms, 1000 / tick_rate))
+
+    hp = numpy.full(trials, PLAYER_HP, dtype=numpy.int64)
+    busy = numpy.zeros(trials)  # 玩家忙于射击上一个目标，直到该时刻
+    clip = numpy.full(trials, clip_capacity, dtype=numpy.int64)
+    reserve = numpy.full(trials, params["total_ammo"] - clip_capacity, dtype=numpy.int64)
+    kills = numpy.zeros(trials, dtype=numpy.int64)
+    score = numpy.zeros(trials, dtype=numpy.int64)
+    death = numpy.full(trials, numpy.inf)
+    # 仍存活的试验在结果数组中的下标；存活比例过半减少时压缩工作数组，已阵亡的试验写回结果后不再参与计算
+    index = numpy.arange(trials)
+    result = {"death": death.copy(), "kills": kills.copy(), "score": score.copy(),
+              "out_of_ammo": numpy.zeros(trials, dtype=bool)}
+
+    def flush(rows):
+        result["death"][index[rows]] = death[rows]
+        result["kills"][index[rows]] = kills[rows]
+        result["score"][index[rows]] = score[rows]
+        result["out_of_ammo"][index[rows]] = (clip[rows] + reserve[rows]) == 0
+
+    for slot in range(waves["arrive"].shape[1]):
+        alive = hp > 0
+        if alive.sum() * 2 < len(hp):
+            flush(~alive)
+            hp, busy, clip, reserve, kills, score, death, index = (
+                array[alive] for array in (hp, busy, clip, reserve, kills, score, death, index))
+            waves = {key: value[alive] for key, value in waves.items()}
+            if len(hp) == 0:
+                return result
+        enemy = {key: value[:, slot] for key, value in waves.items()}
+        arrive = enemy["arrive"]
+        if not (arrive < numpy.inf).any():
+            break  # 之后的槽位都不存在
+        elite = enemy["elite"]
+        active = (hp > 0) & (arrive < numpy.inf)
+
+        # 轮到该敌人且它进入射程后开火；最后一发飞向目标期间机器人仍在对它射击，这些子弹白白消耗
+        start = numpy.maximum(busy, enemy["engage"])
+        shots = sampler.sample(rng, elite)
+        ammo = clip + reserve
+        last_shot = start + fire_duration(shots, clip, params)
+        remaining = _remaining_at(enemy, last_shot - enemy["spawn"])
+        kill_time = last_shot + numpy.maximum(remaining, REACH_RADIUS) / bullet_speed
+        killed = active & (ammo >= shots) & (kill_time < arrive) & (kill_time <= max_ms)
+        engaged = active & ~killed & (start < arrive)
+
+        # 只在对应掩码上计算（不存在的槽位到达时间为 inf，整体计算会产生 inf - inf）
+        fired = numpy.zeros(len(hp), dtype=numpy.int64)
+        fired[killed] = shots[killed] + (kill_time[killed] - last_shot[killed]) // params["interval"]
+        fired[engaged] = (arrive[engaged] - start[engaged]) // params["interval"] + 1
+        fired = numpy.minimum(fired, numpy.where(killed, ammo, numpy.minimum(ammo, shots)))
+        new_clip = numpy.where(fired <= clip, clip - fired, (clip - fired) % clip_capacity)
+        new_clip = numpy.minimum(new_clip, ammo - fired)
+        reserve = ammo - fired - new_clip
+        clip = new_clip
+        reserve = numpy.where(killed, numpy.minimum(reserve + rng.integers(1, loot_max[elite] + 1), reserve_cap),
+                              reserve)
+        busy = numpy.where(killed, kill_time, numpy.where(engaged, arrive, busy))
+        kills += killed
+        score += numpy.where(killed, KILL_SCORE[elite], 0)
+
+        hit = active & ~killed & (arrive <= max_ms)
+        hp -= numpy.where(hit, ENEMY_DAMAGE[elite], 0)
+        death = numpy.where(hit & (hp <= 0), numpy.minimum(death, arrive), death)
+    flush(slice(None))
+    return result
+
+
+# -------------------------- 汇总 --------------------------
+def _split(trials: int, chunk_size: int) -> list:
+    """按固定块大小切分（与进程数无关，换机器运行结果也相同）"""
+    return [min(chunk_size, trials - offset) for offset in range(0, trials, chunk_size)]
+
+
+def _concat(parts: list) -> dict:
+    return {key: numpy.concatenate([part[key] for part in parts]) for key in parts[0]}
+
+
+def run(weapons: list, args) -> list:
+    """把每把武器的三类试验按块提交到进程池，返回每把武器的汇总行"""
+    workers = args.workers or os.cpu_count() or 1
+    names = list(DEFAULT_WEAPONS)
+
+    def chunk_seeds(weapon, kind: int, sizes: list):
+        # 种子只由 (总种子, 武器, 试验类别) 决定，单独模拟某几把武器时结果不变
+        return numpy.random.SeedSequence([args.seed, names.index(weapon.name), kind]).spawn(len(sizes))
+
+    pending = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for weapon in weapons:
+            params = weapon_params(weapon)
+            sizes = _split(args.trials, CHUNK_TRIALS)
+            ttk = [pool.submit(_ttk_chunk, params, args.accuracy, n, seed)
+                   for n, seed in zip(sizes, chunk_seeds(weapon, 0, sizes))]
+            sizes = _split(args.ammo_trials, CHUNK_TRIALS)
+            ammo = [pool.submit(_ammo_chunk, params, args.accuracy, n, args.kills, seed)
+                    for n, seed in zip(sizes, chunk_seeds(weapon, 1, sizes))]
+            sizes = _split(args.survival_trials, SURVIVAL_CHUNK_TRIALS)
+            survival = [pool.submit(_survival_chunk, params, args.accuracy, n, args.max_seconds, SIM_TICK_RATE, seed)
+                        for n, seed in zip(sizes, chunk_seeds(weapon, 2, sizes))]
+            pending.append((params, ttk, ammo, survival))
+
+        rows = []
+        for params, ttk, ammo, survival in pending:
+            ttk = _concat([future.result() for future in ttk])
+            ammo = _concat([future.result() for future in ammo])
+            survival = _concat([future.result() for future in survival])
+            death = survival["death"]
+            rows.append({
+                "name": params["name"],
+                "mode": params["mode"],
+                "dps": sustained_dps(params, args.accuracy),
+                "ttk_normal": (ttk["normal"].mean(), numpy.percentile(ttk["normal"], 95)),
+                "ttk_elite": (ttk["elite"].mean(), numpy.percentile(ttk["elite"], 95)),
+                "net_ammo": ammo["net"].sum() / max(1, ammo["kills"].sum()),
+                "dry": (ammo["kills"] < args.kills).mean(),
+                "survival": numpy.isinf(death).mean(),
+                "median_life": numpy.median(numpy.minimum(death, args.max_seconds * 1000)) / 1000,
+                "kills": survival["kills"].mean(),
+                "score": survival["score"].mean(),
+                "out_of_ammo": survival["out_of_ammo"].mean(),
+            })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="武器平衡蒙特卡洛模拟")
+    parser.add_argument("--weapons", default=None, help="逗号分隔的武器名称，默认全部 DEFAULT_WEAPONS")
+    parser.add_argument("--accuracy", type=float, default=0.6, help="每发子弹的命中率")
+    parser.add_argument("--trials", type=int, default=1_000_000, help="击杀时间的试验次数（每把武器、每种敌人）")
+    parser.add_argument("--ammo-trials", type=int, default=200_000, help="弹药经济的试验次数（每把武器）")
+    parser.add_argument("--survival-trials", type=int, default=20_000, help="生存概率的试验次数（每把武器）")
+    parser.add_argument("--kills", type=int, default=50, help="弹药经济试验中的连续击杀数")
+    parser.add_argument("--max-seconds", type=float, default=60.0,
+                        help="生存试验的对局时长（游戏内秒；无界面对局中瞄准机器人通常撑不过一分钟）")
+    parser.add_argument("--workers", type=int, default=0, help="进程数，默认等于CPU核数")
+    parser.add_argument("--seed", type=int, default=1, help="随机种子")
+    args = parser.parse_args()
+    if not 0 < args.accuracy <= 1:
+        parser.error("--accuracy 必须在 (0, 1] 之间")
+
+    names = args.weapons.split(",") if args.weapons else list(DEFAULT_WEAPONS)
+    unknown = [name for name in names if name not in DEFAULT_WEAPONS]
+    if unknown:
+        parser.error(f"未知武器：{', '.join(unknown)}")
+
+    start = time.perf_counter()
+    rows = run([DEFAULT_WEAPONS[name] for name in names], args)
+    elapsed = time.perf_counter() - start
+
+    print(f"命中率 {args.accuracy:.0%}，敌人血量 {ENEMY_HEALTH[0]}/{ENEMY_HEALTH[1]}，换弹 {RELOAD_TIME}ms，"
+          f"每把武器 {args.trials} 次击杀、{args.ammo_trials} 组连续击杀、{args.survival_trials} 局生存试验")
+    print(f"{'武器':<7}{'模式':<7}{'持续DPS':>8}{'TTK普通ms':>14}{'TTK精英ms':>14}{'每杀净弹药':>10}"
+          f"{f'{args.kills}杀内弹尽':>10}{f'{args.max_seconds:.0f}秒存活':>10}{'中位存活s':>10}{'击杀':>7}{'得分':>8}{'弹尽':>7}")
+    for row in rows:
+        print(f"{row['name']:<7}{row['mode']:<7}{row['dps']:>10.1f}"
+              f"{row['ttk_normal'][0]:>8.0f}/{row['ttk_normal'][1]:<6.0f}{row['ttk_elite'][0]:>8.0f}/{row['ttk_elite'][1]:<6.0f}"
+              f"{row['net_ammo']:>+12.2f}{row['dry']:>13.1%}{row['survival']:>12.1%}{row['median_life']:>12.1f}"
+              f"{row['kills']:>9.1f}{row['score']:>8.0f}{row['out_of_ammo']:>8.1%}")
+    print(f"（TTK为 均值/p95；总耗时 {elapsed:.1f}s）")
+
+
+if __name__ == "__main__":
+    main()
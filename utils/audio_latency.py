@@ -0,0 +1,95 @@
+import time
+
+import numpy
+
+from config import MIXER_FREQUENCY, MIXER_BUFFER, AUDIO_LATENCY_PROBE
+
+
+class AudioLatencyProbe:
+    """记录每次播放请求的时间戳，并实测播放延迟
+
+    延迟有两列：
+    - 估算值：由混音器缓冲区和排队深度换算，只反映配置；
+    - 实测值：传入播放通道和音效时长的请求，poll() 发现通道播完后记下
+      （播完时刻 - 请求时刻 - 音效时长），即请求到数据交给声卡的时间，声卡上真正听到还要再加一个设备缓冲周期。
+    实测精度取决于 poll() 的调用频率（游戏中每个模拟步一次）；中途被打断或换了音效的请求不计入实测。
+    """
+
+    def __init__(self, frequency: int = MIXER_FREQUENCY, buffer_size: int = MIXER_BUFFER,
+                 enabled: bool = AUDIO_LATENCY_PROBE):
+        self.frequency = frequency
+        self.buffer_size = buffer_size
+        self.enabled = enabled
+        self.records = []  # [[事件名, 请求时刻(perf_counter秒), 估算延迟ms, 是否播放成功, 实测延迟ms或None]]
+        self._pending = []  # [(记录下标, 通道, 音效, 音效时长ms)]
+
+    def estimate_latency_ms(self, queued_frames: int = 0) -> float:
+        """设备缓冲区一个周期 + 前面尚未播放完的排队帧"""
+        return (self.buffer_size + queued_frames) * 1000.0 / self.frequency
+
+    def record(self, event: str, played: bool, queued_frames: int = 0, channel=None, sound=None):
+        """记录一次播放请求；给出 channel 和 sound（非循环播放）时等通道播完后实测延迟"""
+        if not self.enabled:
+            return
+        self.records.append([event, time.perf_counter(), self.estimate_latency_ms(queued_frames), played, None])
+        if played and channel is not None and sound is not None:
+            self._pending.append((len(self.records) - 1, channel, sound, sound.get_length() * 1000.0))
+
+    def poll(self, now: float | None = None) -> list:
+        """检查等待实测的请求，返回本次测得的延迟（毫秒）列表"""
+        if not self._pending:
+            return []
+        now = time.perf_counter() if now is None else now
+        measured = []
+        pending = []
+        for index, channel, sound, length_ms in self._pending:
+            if channel.get_busy():
+                if channel.get_sound() is sound:
+                    pending.append((index, channel, sound, length_ms))
+                continue  # 通道已换成别的音效：被打断，不计入
+            latency = (now - self.records[index][1]) * 1000.0 - length_ms
+            if latency < -length_ms / 2:
+                continue  # 远早于音效时长就停了：被提前停止，不计入
+            self.records[index][4] = latency
+            measured.append(latency)
+        self._pending = pending
+        return measured
+
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def summary(self) -> dict:
+        """按事件汇总：请求次数、丢弃次数、估算延迟均值，实测次数及实测延迟的均值/p50/p95/最大值"""
+        grouped = {}
+        for event, _, estimated, played, measured in self.records:
+            grouped.setdefault(event, []).append((estimated, played, measured))
+
+        result = {}
+        for event, rows in grouped.items():
+            estimated = [estimate for estimate, played, _ in rows if played]
+            latencies = numpy.array([measured for _, _, measured in rows if measured is not None], dtype=numpy.float64)
+            result[event] = {
+                "count": len(rows),
+                "dropped": sum(1 for _, played, _ in rows if not played),
+                "estimated_ms": float(numpy.mean(estimated)) if estimated else 0.0,
+                "measured": int(latencies.size),
+                "mean_ms": float(latencies.mean()) if latencies.size else 0.0,
+                "p50_ms": float(numpy.percentile(latencies, 50)) if latencies.size else 0.0,
+                "p95_ms": float(numpy.percentile(latencies, 95)) if latencies.size else 0.0,
+                "max_ms": float(latencies.max()) if latencies.size else 0.0
+            }
+        return result
+
+    def report(self):
+        if not self.records:
+            return
+        print(f"🔊 音频延迟报告（采样率 {self.frequency}Hz，缓冲区 {self.buffer_size} 帧）")
+        print(f"{'事件':<16}{'次数':>6}{'丢弃':>6}{'估算ms':>10}{'实测次数':>10}"
+              f"{'均值ms':>10}{'p50ms':>10}{'p95ms':>10}{'最大ms':>10}")
+        for event, row in sorted(self.summary().items()):
+            print(f"{event:<16}{row['count']:>6}{row['dropped']:>6}{row['estimated_ms']:>10.1f}{row['measured']:>10}"
+                  f"{row['mean_ms']:>10.1f}{row['p50_ms']:>10.1f}{row['p95_ms']:>10.1f}{row['max_ms']:>10.1f}")
+
+    def clear(self):
+        self.records.clear()
+        self._pending.clear()
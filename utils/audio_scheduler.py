@@ -0,0 +1,105 @@
+import pygame
+
+from config import AUDIO_CHANNEL_CATEGORIES
+
+
+class _Voice:
+    """一个混音通道及其当前播放信息"""
+    __slots__ = ("channel", "category", "priority", "started")
+
+    def __init__(self, channel: pygame.mixer.Channel, category: str):
+        self.channel = channel
+        self.category = category
+        self.priority = -1
+        self.started = 0
+
+
+class AudioScheduler:
+    """按类别预留通道的音频调度器：优先级抢占 + 同帧去重 + 丢弃/抢占计数"""
+
+    def __init__(self, categories: dict = AUDIO_CHANNEL_CATEGORIES):
+        self.priorities = {name: priority for name, (_, priority) in categories.items()}
+        total = sum(count for count, _ in categories.values())
+        pygame.mixer.set_num_channels(total)
+        # 全部预留，避免其他 Sound.play() 自动占用调度器管理的通道
+        pygame.mixer.set_reserved(total)
+
+        self.pools = {}
+        channel_id = 0
+        for name, (count, _) in categories.items():
+            self.pools[name] = [_Voice(pygame.mixer.Channel(channel_id + i), name) for i in range(count)]
+            channel_id += count
+        self.voices = [voice for pool in self.pools.values() for voice in pool]
+
+        self.frame = 0
+        self._sequence = 0  # 单调递增的播放序号，用于判断最老的声音
+        self._frame_keys = set()
+        self.stats = {"played": 0, "coalesced": 0, "stolen": 0, "dropped": 0}
+
+    def reserve_channel(self, category: str) -> pygame.mixer.Channel:
+        """从类别通道池中取出一个通道独占使用（如软件混音的输出流），不再参与调度"""
+        pool = self.pools[category]
+        voice = pool.pop()
+        self.voices.remove(voice)
+        voice.channel.stop()
+        return voice.channel
+
+    def begin_frame(self):
+        """每帧开始时调用，清空同帧去重记录"""
+        self.frame += 1
+        self._frame_keys.clear()
+
+    def play(self, sound: pygame.mixer.Sound, category: str, key=None, loops: int = 0):
+        """播放音效；传入key时同一帧内相同key只播放一次。返回占用的通道，失败返回None"""
+        if key is not None:
+            if key in self._frame_keys:
+                self.stats["coalesced"] += 1
+                return None
+            self._frame_keys.add(key)
+
+        priority = self.priorities.get(category, 0)
+        voice = self._acquire(category, priority)
+        if voice is None:
+            self.stats["dropped"] += 1
+            return None
+
+        self._sequence += 1
+        voice.priority = priority
+        voice.started = self._sequence
+        voice.channel.play(sound, loops=loops)
+        self.stats["played"] += 1
+        return voice.channel
+
+    def _acquire(self, category: str, priority: int):
+        pool = self.pools.get(category, [])
+        for voice in pool:
+            if not voice.channel.get_busy():
+                return voice
+
+        # 通道用尽：在本类别及更低优先级类别中，抢占优先级最低、开始最早的声音
+        candidates = [voice for voice in self.voices
+                      if voice.category == category or self.priorities[voice.category] < priority]
+        if not candidates:
+            return None
+        victim = min(candidates, key=self._steal_order)
+        if not victim.channel.get_busy():
+            # 借用更低优先级类别的空闲通道
+            return victim
+        if victim.priority > priority:
+            return None
+        victim.channel.stop()
+        self.stats["stolen"] += 1
+        return victim
+
+    @staticmethod
+    def _steal_order(voice: _Voice):
+        if not voice.channel.get_busy():
+            return (-1, 0)
+        return (voice.priority, voice.started)
+
+    def get_stats(self) -> dict:
+        return dict(self.stats)
+
+    def stop_all(self):
+        for voice in self.voices:
+            voice.channel.stop()
@@ -1,7 +1,5 @@
 import json
 import os
-import pymysql
-from pymysql.err import OperationalError, ProgrammingError
 from config import DB_CONFIG
 
 DB_PATH = "user_db.json"
@@ -21,6 +19,14 @@ class DBUtils:
         if self.cloud_conn and self.cloud_conn.open:
             return self.cloud_conn
         
+        # pymysql 只在第一次连接云端时导入，只用本地存储的会话不加载
+        try:
+            import pymysql
+            from pymysql.err import OperationalError
+        except ImportError as e:
+            print(f"❌ 未安装pymysql，跳过云端同步：{e}")
+            return None
+        
         try:
             self.cloud_conn = pymysql.connect(**self.db_config)
             print("✅ 云端MySQL连接成功")
@@ -202,7 +208,8 @@ class DBUtils:
             return None
 
         try:
-            with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            from pymysql.cursors import DictCursor
+            with conn.cursor(DictCursor) as cursor:
                 sql = """
                 SELECT username, password, total_score, unlocked_weapons, player
                 FROM users WHERE username = %s
@@ -0,0 +1,34 @@
+from config import SIM_TICK_RATE, MAX_SIM_SUBSTEPS
+
+
+class FixedTimestep:
+    """固定步长累加器：把渲染帧的可变时间增量换算成固定长度的模拟步数
+
+    渲染慢时一帧补跑多步，渲染快时部分帧不跑；单帧补跑超过 max_substeps 时丢弃积压时间
+    （游戏短暂变慢，而不是越追越卡）。alpha 为剩余不足一步的比例，供渲染插值。
+    """
+
+    def __init__(self, tick_rate: int = SIM_TICK_RATE, max_substeps: int = MAX_SIM_SUBSTEPS):
+        self.tick_rate = tick_rate
+        self.tick = 1.0 / tick_rate
+        self.tick_ms = 1000.0 / tick_rate
+        self.max_substeps = max_substeps
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.dropped_time = 0.0  # 累计丢弃的积压时间（秒）
+
+    def advance(self, dt: float) -> int:
+        """累加本帧时间增量，返回本帧应执行的模拟步数"""
+        self.accumulator += max(0.0, dt)
+        steps = int(self.accumulator / self.tick)
+        if steps > self.max_substeps:
+            self.dropped_time += (steps - self.max_substeps) * self.tick
+            steps = self.max_substeps
+            self.accumulator = self.tick * steps + self.accumulator % self.tick
+        self.accumulator -= steps * self.tick
+        self.alpha = min(1.0, self.accumulator / self.tick)
+        return steps
+
+    def reset(self):
+        self.accumulator = 0.0
+        self.alpha = 0.0
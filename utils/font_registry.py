@@ -0,0 +1,84 @@
+import json
+import os
+
+import pygame
+
+from config import FONT_FILES, FONT_SYSTEM_NAMES, FONT_CACHE_FILE
+
+_UNRESOLVED = object()
+
+
+class FontRegistry:
+    """进程内共享的中文字体：字体文件只查找一次，同一字号的 Font 对象所有页面共用
+
+    查找顺序：程序目录下的字体文件（只需检查文件是否存在）→ 按名称查找系统字体 → pygame默认字体。
+    按名称查找要扫描所有系统字体目录，结果写入缓存文件，之后启动直接读取（候选列表变化或字体文件被删除时重新查找）。
+    """
+
+    def __init__(self, files=FONT_FILES, system_names=FONT_SYSTEM_NAMES, cache_file: str = FONT_CACHE_FILE):
+        self.files = list(files)
+        self.system_names = list(system_names)
+        self.cache_file = cache_file
+        self._path = _UNRESOLVED
+        self._fonts = {}  # 字号 -> Font
+
+    @property
+    def path(self) -> str | None:
+        """字体文件路径，None 表示使用pygame默认字体"""
+        if self._path is _UNRESOLVED:
+            self._path = self._resolve()
+        return self._path
+
+    def get(self, size: int) -> pygame.font.Font:
+        font = self._fonts.get(size)
+        if font is None:
+            try:
+                font = pygame.font.Font(self.path, size)
+            except (OSError, pygame.error) as e:
+                print(f"❌ 加载字体失败，使用默认字体：{e}")
+                self._path = None
+                font = pygame.font.Font(None, size)
+            self._fonts[size] = font
+        return font
+
+    def _resolve(self) -> str | None:
+        for file in self.files:
+            if os.path.isfile(file):
+                return file
+        cached = self._load_cache()
+        if cached is not _UNRESOLVED:
+            return cached
+        path = None
+        for name in self.system_names:
+            path = pygame.font.match_font(name)
+            if path:
+                break
+        self._save_cache(path)
+        return path
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return _UNRESOLVED
+        if not isinstance(data, dict) or data.get("system_names") != self.system_names:
+            return _UNRESOLVED
+        path = data.get("path")
+        if path is not None and not os.path.isfile(path):
+            return _UNRESOLVED
+        return path
+
+    def _save_cache(self, path: str | None):
+        try:
+            directory = os.path.dirname(self.cache_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump({"system_names": self.system_names, "path": path}, f, ensure_ascii=False)
+        except OSError as e:
+            print(f"❌ 写入字体缓存失败：{e}")
+
+
+# 全局实例：所有页面通过 BasePage 取字体
+fonts = FontRegistry()
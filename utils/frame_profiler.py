@@ -0,0 +1,201 @@
+import functools
+import json
+import os
+from collections import deque
+from datetime import datetime
+from time import perf_counter_ns
+
+import pygame
+
+from config import FPS, PROFILE_DIR, PROFILER_ENABLED, PROFILER_HISTORY_FRAMES, PROFILER_TRACE_EVENTS
+
+
+class _NullSection:
+    """关闭计时时返回的空上下文（共享一个实例，不产生任何分配）"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class _Section:
+    """一个命名阶段的计时上下文（每个名称一个实例，同名阶段不要递归嵌套）"""
+    __slots__ = ("profiler", "index", "start")
+
+    def __init__(self, profiler: "FrameProfiler", index: int):
+        self.profiler = profiler
+        self.index = index
+        self.start = 0
+
+    def __enter__(self):
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler._record(self.index, self.start, perf_counter_ns())
+        return False
+
+
+class FrameProfiler:
+    """逐帧分阶段计时：每帧各阶段耗时（同一帧内多次进入累加）写入环形缓冲区，供叠加层和Chrome trace导出
+
+    关闭时 section() 直接返回共享的空上下文，begin_frame/end_frame 只做一次布尔判断；
+    环形缓冲区第一次开启时才分配（numpy 也在那时才导入，不拖慢启动）。
+    阶段名用 "." 分层（如 "update.step" 下的 "update.step.collisions"），叠加层按名称缩进显示。
+    """
+
+    MAX_PHASES = 48
+
+    def __init__(self, history: int = PROFILER_HISTORY_FRAMES, trace_events: int = PROFILER_TRACE_EVENTS,
+                 enabled: bool = PROFILER_ENABLED):
+        self.enabled = False
+        self.history = history
+        self.names = []  # 阶段名，按首次出现顺序
+        self._sections = {}
+        self._frame_phase = [0] * self.MAX_PHASES  # 当前帧各阶段累计纳秒
+        self.phase_ms = None
+        self.frame_ms = None
+        self.cursor = 0
+        self.filled = 0
+        self._frame_start = 0
+        # Chrome trace 的完整事件（阶段下标, 开始ns, 结束ns），只保留最近的一段
+        self.trace = deque(maxlen=trace_events)
+        self._font = None
+        self.set_enabled(enabled)
+
+    def set_enabled(self, enabled: bool):
+        if enabled and self.frame_ms is None:
+            import numpy
+            self.phase_ms = numpy.zeros((self.history, self.MAX_PHASES), dtype=numpy.float32)
+            self.frame_ms = numpy.zeros(self.history, dtype=numpy.float32)
+        self.enabled = enabled
+        self._frame_start = 0
+        for i in range(len(self.names)):
+            self._frame_phase[i] = 0
+
+    # -------------------------- 计时 --------------------------
+    def section(self, name: str):
+        if not self.enabled:
+            return _NULL_SECTION
+        section = self._sections.get(name)
+        if section is None:
+            if len(self.names) >= self.MAX_PHASES:
+                return _NULL_SECTION
+            section = self._sections[name] = _Section(self, len(self.names))
+            self.names.append(name)
+        return section
+
+    def _record(self, index: int, start: int, end: int):
+        self._frame_phase[index] += end - start
+        self.trace.append((index, start, end))
+
+    def begin_frame(self):
+        if self.enabled:
+            self._frame_start = perf_counter_ns()
+
+    def end_frame(self):
+        if not self.enabled or not self._frame_start:
+            return
+        end = perf_counter_ns()
+        row = self.cursor
+        self.frame_ms[row] = (end - self._frame_start) / 1e6
+        phases = self._frame_phase
+        self.phase_ms[row] = phases
+        self.phase_ms[row] /= 1e6
+        for i in range(len(self.names)):
+            phases[i] = 0
+        self.trace.append((-1, self._frame_start, end))
+        self.cursor = (row + 1) % self.history
+        self.filled = min(self.filled + 1, self.history)
+
+    # -------------------------- 统计 --------------------------
+    def frame_percentiles(self, percentiles=(50, 99)):
+        if not self.filled:
+            return [0.0 for _ in percentiles]
+        import numpy
+        return numpy.percentile(self.frame_ms[:self.filled], percentiles).tolist()
+
+    def phase_means(self) -> list:
+        """[(阶段名, 平均毫秒/帧), ...]，按层级排列"""
+        if not self.filled:
+            return []
+        means = self.phase_ms[:self.filled, :len(self.names)].mean(axis=0)
+        return sorted(zip(self.names, means.tolist()), key=lambda item: self._tree_key(item[0]))
+
+    def _tree_key(self, name: str) -> tuple:
+        """按层级排序的键：子阶段紧跟在父阶段之后，同级按首次出现顺序"""
+        parts = name.split(".")
+        order = {phase: i for i, phase in enumerate(self.names)}
+        return tuple(order.get(".".join(parts[:depth + 1]), len(order)) for depth in range(len(parts)))
+
+    # -------------------------- 叠加层 --------------------------
+    def draw_overlay(self, surface: pygame.Surface, notes=()):
+        """左上角半透明面板：帧时间 p50/p99、附加说明行（notes）和各阶段平均耗时条（满格为一帧的预算）"""
+        if self._font is None:
+            self._font = pygame.font.Font(None, 18)
+        font = self._font
+        phases = self.phase_means()
+        p50, p99 = self.frame_percentiles()
+        budget = 1000 / FPS
+        line_height = 15
+        top = 24 + line_height * len(notes)
+        width, height = 300, top + 2 + line_height * len(phases)
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        header = f"frame p50 {p50:.2f}ms  p99 {p99:.2f}ms  ({self.filled}f)"
+        panel.blit(font.render(header, True, (255, 255, 0) if p99 > budget else (255, 255, 255)), (6, 5))
+        for row, note in enumerate(notes):
+            panel.blit(font.render(note, True, (160, 200, 255)), (6, 24 + row * line_height))
+        for row, (name, ms) in enumerate(phases):
+            y = top + row * line_height
+            indent = 10 * name.count(".")
+            panel.blit(font.render(name, True, (200, 200, 200)), (6 + indent, y))
+            bar = int(min(1.0, ms / budget) * 90)
+            pygame.draw.rect(panel, (255, 80, 80) if ms > budget / 2 else (80, 200, 120), (150, y + 3, bar, 8))
+            panel.blit(font.render(f"{ms:.2f}", True, (255, 255, 255)), (246, y))
+        surface.blit(panel, (4, 4))
+
+    # -------------------------- 导出 --------------------------
+    def export_chrome_trace(self, path: str | None = None) -> str | None:
+        """把最近的计时事件写成 Chrome trace JSON（chrome://tracing 或 Perfetto 打开）"""
+        if not self.trace:
+            print("❌ 没有可导出的计时数据（先按F3开启计时）")
+            return None
+        if path is None:
+            path = os.path.join(PROFILE_DIR, f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        events = [{"name": self.names[index] if index >= 0 else "frame", "ph": "X", "pid": 1, "tid": 1,
+                   "ts": start / 1000, "dur": (end - start) / 1000} for index, start, end in self.trace]
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        except OSError as e:
+            print(f"❌ 计时数据导出失败：{e}")
+            return None
+        print(f"✅ 计时数据已导出：{path}（{len(events)} 个事件）")
+        return path
+
+
+# 全局实例：PageManager 负责开关、逐帧统计和叠加层，各页面用 profiled/section 标注子阶段
+profiler = FrameProfiler()
+
+
+def profiled(name: str):
+    """方法计时装饰器：计时关闭时只多一次函数调用和布尔判断"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            with profiler.section(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
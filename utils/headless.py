@@ -0,0 +1,146 @@
+import os
+import time
+
+import numpy
+import pygame
+
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, SIM_TICK_RATE, MIXER_FREQUENCY, MIXER_BUFFER
+from core.User import User
+from core.Weapon import DEFAULT_WEAPONS
+from main import PageManager
+from pages.game_page import GamePage
+from utils.input_replay import TickInput, HOLD_LEFT, EVENT_LEFT_DOWN
+
+
+def init_headless_display() -> pygame.Surface:
+    """使用 SDL dummy 视频/音频驱动初始化pygame，无需显示器和声卡"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.mixer.pre_init(frequency=MIXER_FREQUENCY, size=-16, channels=2, buffer=MIXER_BUFFER)
+    pygame.init()
+    return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+class AimBot:
+    """简单瞄准机器人（作为 GamePage 的输入源）：每步瞄准射程内离玩家最近的敌人，按住并点击左键
+
+    射程 = 屏幕外 BulletStore.EXPIRE_MARGIN 以内且不超过子弹最大射程，更远处的子弹在命中前就会被删除；
+    射程内没有敌人时只预先瞄准最近的敌人，不开火。射速仍由武器射击间隔限制。jitter 为瞄准角度的随机偏差（弧度），取自对局的 "bot" 随机数流，保证可复现。
+    """
+
+    AIM_RADIUS = 300  # 鼠标落点距中心的距离（坐标取整后角度误差很小）
+
+    def __init__(self, jitter: float = 0.0):
+        self.jitter = jitter
+        self._tick_input = TickInput()
+
+    def push_event(self, event: pygame.event.Event):
+        pass
+
+    def poll(self, page) -> TickInput:
+        cx, cy = page.CENTER_POS
+        enemies = page.enemies
+        n = enemies.count
+        if n == 0:
+            return self._tick_input.set(cx, cy, 0, 0)
+        x = enemies.x[:n]
+        y = enemies.y[:n]
+        dx = x - cx
+        dy = y - cy
+        dist2 = dx * dx + dy * dy
+        bullets = page.bullets
+        margin = bullets.EXPIRE_MARGIN
+        in_range = ((x > -margin) & (x < bullets.screen_width + margin) & (y > -margin)
+                    & (y < bullets.screen_height + margin) & (dist2 <= bullets.max_distance ** 2))
+        fire = bool(in_range.any())
+        nearest = int(numpy.argmin(numpy.where(in_range, dist2, numpy.inf) if fire else dist2))
+        angle = numpy.arctan2(dy[nearest], dx[nearest])
+        if self.jitter and fire:
+            angle += page.rng.stream("bot").uniform(-self.jitter, self.jitter)
+        return self._tick_input.set(int(round(cx + numpy.cos(angle) * self.AIM_RADIUS)),
+                                    int(round(cy + numpy.sin(angle) * self.AIM_RADIUS)),
+                                    HOLD_LEFT if fire else 0, EVENT_LEFT_DOWN if fire else 0)
+
+
+class HeadlessRunner:
+    """无界面对局运行器：用注入的模拟时钟驱动 GamePage.step()，不等待真实时间，尽可能快地跑完对局
+
+    同一个 GamePage 复用于多局（音效只合成一次），每局开始时按种子重置随机数流，
+    相同种子 + 相同武器 + 相同机器人参数的结果完全一致。
+    """
+
+    def __init__(self, weapon_name: str = "P92", tick_rate: int = SIM_TICK_RATE,
+                 audio: bool = True, render: bool = False, fast_forward: bool = True):
+        self.screen = init_headless_display()
+        self.page_manager = PageManager(self.screen)
+        self.page = GamePage(self.screen, self.page_manager)
+        self.page.persist_results = False  # 批量模拟不写数据库
+        self.page_manager.register_page("game", self.page)
+        self.page_manager.switch_page("game")
+
+        self.user = User("headless", "")
+        self.user.player.equip_weapon(0, DEFAULT_WEAPONS[weapon_name])
+        self.page.set_current_user(self.user)
+        self.weapon_name = weapon_name
+        self.tick_rate = tick_rate
+        self.tick_ms = 1000.0 / tick_rate
+        self.audio = audio  # 关闭后跳过每帧的方位音效刷新，只跑游戏逻辑
+        self.render = render  # 开启后每步也执行一次绘制，用于包含渲染开销的性能测试
+        self.fast_forward = fast_forward  # 场上无事可做时直接跳到下一次敌人生成（不影响结算结果）
+
+    def run_match(self, seed: int, max_seconds: float = 300, bot: AimBot | None = None,
+                  record_path: str | None = None) -> dict:
+        """以指定种子跑一局，直到游戏结束或达到模拟时长上限，返回结算数据；可同时录制输入"""
+        page = self.page
+        page.input_source = bot or AimBot()
+        if record_path:
+            page.start_recording(seed, self.tick_rate)
+        else:
+            page.set_seed(seed)
+            page.reset_game()
+        max_ticks = int(max_seconds * 1000 / self.tick_ms)
+        # 录制时每一步的输入都要写进录像，不能跳步
+        fast_forward = self.fast_forward and not record_path
+        result = self._run(lambda ticks: page.game_over or ticks >= max_ticks,
+                           max_ticks if fast_forward else 0)
+        if record_path:
+            page.stop_recording(record_path)
+        return dict(result, seed=seed)
+
+    def run_replay(self, replay) -> dict:
+        """按录像逐步回放到结束，返回结算数据（与录像中记录的结果比对即可校验可复现）"""
+        page = self.page
+        page.start_replay(replay)
+        return dict(self._run(lambda ticks: page.replay_finished), seed=replay.seed)
+
+    def _run(self, finished, max_ticks: int = 0) -> dict:
+        """逐步运行直到 finished(已运行步数) 为真；max_ticks 大于0时允许快进（跳过的步也计入步数）"""
+        page = self.page
+        ticks = 0
+        start = time.perf_counter()
+        while not finished(ticks):
+            if max_ticks:
+                ticks += page.fast_forward(self.tick_ms, max_ticks - ticks)
+                if finished(ticks):
+                    break
+            page.step(self.tick_ms)
+            if self.audio:
+                page.update(self.tick_ms / 1000)
+            if self.render:
+                page.draw()
+            ticks += 1
+        wall_seconds = time.perf_counter() - start
+
+        sim_seconds = page.sim_time / 1000
+        return dict(
+            page.match_result(),
+            weapon=page.get_current_weapon().name,
+            ticks=ticks,
+            sim_seconds=sim_seconds,
+            wall_seconds=wall_seconds,
+            speedup=sim_seconds / wall_seconds if wall_seconds > 0 else 0.0
+        )
+
+    def close(self):
+        self.page.positional_audio.clear()
+        pygame.quit()
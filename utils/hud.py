@@ -0,0 +1,41 @@
+import pygame
+
+
+class RetainedHud:
+    """保留模式的HUD：每个控件绑定一个取值函数，只有取值变化时才重新渲染该控件
+
+    控件渲染结果是若干 (Surface, 位置)，所有控件的结果拼成一个列表，每帧用一次 blits 画出；
+    没有控件变化时每帧只有取值比较和这一次 blits。取值为 None 表示控件隐藏。
+    """
+
+    def __init__(self):
+        self._widgets = []  # [名称, 取值函数, 渲染函数, 上次取值, 渲染结果]，按添加顺序绘制
+        self._blits = []
+        self._dirty = True
+        self.redraws = 0  # 控件重新渲染的次数
+
+    def add(self, name: str, value, render):
+        """value() 返回控件绑定的值（须可比较相等）；render(值) 返回 [(Surface, (x, y)), ...]"""
+        self._widgets.append([name, value, render, None, []])
+        self._dirty = True
+
+    def invalidate(self):
+        """强制所有控件在下次绘制时重新渲染（字体、颜色等非绑定值变化时调用）"""
+        for widget in self._widgets:
+            widget[3] = None
+            widget[4] = []
+        self._dirty = True
+
+    def draw(self, surface: pygame.Surface):
+        dirty = self._dirty
+        for widget in self._widgets:
+            key = widget[1]()
+            if key != widget[3]:
+                widget[3] = key
+                widget[4] = [] if key is None else widget[2](key)
+                self.redraws += 1
+                dirty = True
+        if dirty:
+            self._blits = [item for widget in self._widgets for item in widget[4]]
+            self._dirty = False
+        surface.blits(self._blits, doreturn=False)
@@ -0,0 +1,177 @@
+import json
+import os
+import struct
+import zlib
+
+import numpy
+import pygame
+
+# 每步的持续状态位：鼠标左键按住 + Q/E/R 按住（check_real_time_keys 读取）
+HOLD_LEFT = 1
+HOLD_Q = 2
+HOLD_E = 4
+HOLD_R = 8
+# 每步的边沿事件位：两步之间发生的按下/松开（同一步内同类事件只记一次）
+EVENT_LEFT_DOWN = 1
+EVENT_LEFT_UP = 2
+EVENT_PAUSE = 4
+EVENT_RESTART = 8
+
+_MAGIC = b"SGRP"
+_FORMAT_VERSION = 1
+# 文件头：魔数、格式版本、种子、模拟频率、步数、元数据JSON长度
+_HEADER = struct.Struct("<4sHQHII")
+
+
+class TickInput:
+    """一个模拟步看到的全部输入：鼠标位置、按住状态位、边沿事件位"""
+    __slots__ = ("mouse_x", "mouse_y", "held", "events")
+
+    def __init__(self, mouse_x: int = 0, mouse_y: int = 0, held: int = 0, events: int = 0):
+        self.set(mouse_x, mouse_y, held, events)
+
+    def set(self, mouse_x: int, mouse_y: int, held: int, events: int) -> "TickInput":
+        """原地更新（输入源每步复用同一个实例，只在当步内有效）"""
+        self.mouse_x = mouse_x
+        self.mouse_y = mouse_y
+        self.held = held
+        self.events = events
+        return self
+
+    @property
+    def mouse_pos(self):
+        return self.mouse_x, self.mouse_y
+
+
+class LiveInput:
+    """实时输入：handle_event 中累积边沿事件，每步开始时连同当前鼠标/按键状态打包成 TickInput"""
+
+    def __init__(self):
+        self.left_held = False
+        self.pending_events = 0
+        self._tick_input = TickInput()
+
+    def push_event(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_p:
+                self.pending_events |= EVENT_PAUSE
+            elif event.key == pygame.K_SPACE:
+                self.pending_events |= EVENT_RESTART
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.left_held = True
+            self.pending_events |= EVENT_LEFT_DOWN
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            self.left_held = False
+            self.pending_events |= EVENT_LEFT_UP
+
+    def poll(self, page) -> TickInput:
+        keys = pygame.key.get_pressed()
+        held = ((HOLD_LEFT if self.left_held else 0) | (HOLD_Q if keys[pygame.K_q] else 0) |
+                (HOLD_E if keys[pygame.K_e] else 0) | (HOLD_R if keys[pygame.K_r] else 0))
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        tick_input = self._tick_input.set(mouse_x, mouse_y, held, self.pending_events)
+        self.pending_events = 0
+        return tick_input
+
+
+class Replay:
+    """一段录像：种子、模拟频率、元数据（装备、结算结果）和逐步输入列"""
+
+    def __init__(self, seed: int, tick_rate: int, meta: dict, mouse_x, mouse_y, held, events):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.meta = meta
+        # 逐步输入列统一为NumPy数组（录制时传入的是列表，读取文件时是数组）
+        self.mouse_x = numpy.asarray(mouse_x, dtype=numpy.int16)
+        self.mouse_y = numpy.asarray(mouse_y, dtype=numpy.int16)
+        self.held = numpy.asarray(held, dtype=numpy.uint8)
+        self.events = numpy.asarray(events, dtype=numpy.uint8)
+
+    def __len__(self) -> int:
+        return len(self.held)
+
+    def save(self, path: str):
+        """按列存储（鼠标坐标做差分）后整体zlib压缩，静止和匀速移动几乎不占空间"""
+        mouse_x = numpy.asarray(self.mouse_x, dtype=numpy.int16)
+        mouse_y = numpy.asarray(self.mouse_y, dtype=numpy.int16)
+        body = b"".join((
+            numpy.diff(mouse_x, prepend=numpy.int16(0)).astype("<i2").tobytes(),
+            numpy.diff(mouse_y, prepend=numpy.int16(0)).astype("<i2").tobytes(),
+            numpy.asarray(self.held, dtype=numpy.uint8).tobytes(),
+            numpy.asarray(self.events, dtype=numpy.uint8).tobytes()
+        ))
+        meta = json.dumps(self.meta, ensure_ascii=False).encode("utf-8")
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, self.seed, self.tick_rate, len(self), len(meta)))
+            f.write(meta)
+            f.write(zlib.compress(body, 9))
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, seed, tick_rate, ticks, meta_len = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError(f"不支持的录像文件：{path}")
+        offset = _HEADER.size
+        meta = json.loads(data[offset:offset + meta_len].decode("utf-8"))
+        body = zlib.decompress(data[offset + meta_len:])
+        mouse_x = numpy.cumsum(numpy.frombuffer(body, "<i2", ticks, 0), dtype=numpy.int16)
+        mouse_y = numpy.cumsum(numpy.frombuffer(body, "<i2", ticks, ticks * 2), dtype=numpy.int16)
+        held = numpy.frombuffer(body, numpy.uint8, ticks, ticks * 4)
+        events = numpy.frombuffer(body, numpy.uint8, ticks, ticks * 5)
+        return cls(seed, tick_rate, meta, mouse_x, mouse_y, held, events)
+
+
+class InputRecorder:
+    """逐步记录 GamePage 实际消费的 TickInput"""
+
+    def __init__(self, seed: int, tick_rate: int, meta: dict):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.meta = meta
+        self.mouse_x = []
+        self.mouse_y = []
+        self.held = []
+        self.events = []
+
+    def record(self, tick_input: TickInput):
+        self.mouse_x.append(tick_input.mouse_x)
+        self.mouse_y.append(tick_input.mouse_y)
+        self.held.append(tick_input.held)
+        self.events.append(tick_input.events)
+
+    def to_replay(self, result: dict | None = None) -> Replay:
+        meta = dict(self.meta)
+        if result is not None:
+            meta["result"] = result
+        return Replay(self.seed, self.tick_rate, meta, self.mouse_x, self.mouse_y, self.held, self.events)
+
+
+class ReplayInput:
+    """回放输入：按步依次返回录像中的 TickInput，播完后返回 None"""
+
+    def __init__(self, replay: Replay):
+        self.replay = replay
+        self.cursor = 0
+        self._rows = list(zip(replay.mouse_x.tolist(), replay.mouse_y.tolist(),
+                              replay.held.tolist(), replay.events.tolist()))
+        self._tick_input = TickInput()
+
+    @property
+    def finished(self) -> bool:
+        return self.cursor >= len(self._rows)
+
+    def push_event(self, event: pygame.event.Event):
+        """回放期间忽略实时输入"""
+        pass
+
+    def poll(self, page) -> TickInput | None:
+        if self.finished:
+            return None
+        row = self._rows[self.cursor]
+        self.cursor += 1
+        return self._tick_input.set(*row)
@@ -0,0 +1,90 @@
+import numpy
+import pygame
+
+from config import (POSITIONAL_NEAR_DISTANCE, POSITIONAL_FAR_DISTANCE,
+                    POSITIONAL_MIN_GAIN, POSITIONAL_PAN_DEPTH)
+
+
+def compute_stereo_gains(xs, ys, center, half_width,
+                         near=POSITIONAL_NEAR_DISTANCE, far=POSITIONAL_FAR_DISTANCE,
+                         min_gain=POSITIONAL_MIN_GAIN, pan_depth=POSITIONAL_PAN_DEPTH):
+    """一次向量化计算所有声源相对中心的左右声道音量（声像 + 距离衰减）"""
+    dx = numpy.asarray(xs, dtype=numpy.float64) - center[0]
+    dy = numpy.asarray(ys, dtype=numpy.float64) - center[1]
+    dist = numpy.hypot(dx, dy)
+
+    # 越近越响：near以内满音量，far处降到min_gain
+    closeness = numpy.clip((far - dist) / (far - near), 0.0, 1.0)
+    gain = min_gain + (1.0 - min_gain) * closeness
+
+    # 声像：敌人在左侧时右声道变弱，反之亦然
+    pan = numpy.clip(dx / half_width, -1.0, 1.0)
+    left = gain * (1.0 - pan_depth * numpy.maximum(pan, 0.0))
+    right = gain * (1.0 - pan_depth * numpy.maximum(-pan, 0.0))
+    return left, right
+
+
+class PositionalAudio:
+    """每个存活敌人占用一个循环播放的声部，每帧批量刷新声像和音量
+
+    voices 可以是 AudioScheduler（每个声部一个pygame通道）或 SoftMixer（软件混音声源），
+    两者的 play() 都返回带 set_volume/stop/pause/unpause 的声部对象。
+    """
+
+    def __init__(self, voices, center, screen_width: int, category: str = "enemy"):
+        self.backend = voices
+        self.center = center
+        self.half_width = screen_width / 2
+        self.category = category
+        self.voices = {}    # {声源key: 通道}
+        self._owners = {}   # {通道: 声源key}，通道被其他声源抢占时用于解除旧绑定
+        self.is_paused = False
+
+    def attach(self, key, sound: pygame.mixer.Sound, x: float, y: float):
+        """为声源分配通道并按当前位置设置初始音量，失败返回None"""
+        channel = self.backend.play(sound, self.category, loops=-1)
+        if not channel:
+            return None
+        previous = self._owners.get(channel)
+        if previous is not None:
+            self.voices.pop(previous, None)
+        self.voices[key] = channel
+        self._owners[channel] = key
+        left, right = compute_stereo_gains((x,), (y,), self.center, self.half_width)
+        channel.set_volume(float(left[0]), float(right[0]))
+        if self.is_paused:
+            channel.pause()
+        return channel
+
+    def detach(self, key):
+        channel = self.voices.pop(key, None)
+        if channel is None:
+            return
+        if self._owners.get(channel) == key:
+            del self._owners[channel]
+            channel.stop()
+
+    def update(self, keys, xs, ys):
+        """按所有声源的当前位置一次性计算增益，再写回各自通道"""
+        if not self.voices or not keys:
+            return
+        left, right = compute_stereo_gains(xs, ys, self.center, self.half_width)
+        voices = self.voices
+        for key, l_gain, r_gain in zip(keys, left.tolist(), right.tolist()):
+            channel = voices.get(key)
+            if channel is not None:
+                channel.set_volume(l_gain, r_gain)
+
+    def set_paused(self, paused: bool):
+        self.is_paused = paused
+        for channel in self.voices.values():
+            if paused:
+                channel.pause()
+            else:
+                channel.unpause()
+
+    def clear(self):
+        for channel in self.voices.values():
+            channel.stop()
+        self.voices.clear()
+        self._owners.clear()
@@ -0,0 +1,24 @@
+import hashlib
+import random
+
+
+class RngStreams:
+    """按子系统拆分的确定性随机数流
+
+    每个子系统（敌人生成、掉落、机器人等）从总种子派生出独立的 random.Random，
+    某个子系统多抽或少抽一次随机数不会打乱其他子系统的序列；相同种子的对局结果完全一致。
+    """
+
+    def __init__(self, seed: int | None = None):
+        # 未指定种子时随机取一个并记录下来，便于复现
+        self.seed = seed if seed is not None else random.SystemRandom().randrange(2 ** 32)
+        self._streams = {}
+
+    def stream(self, name: str) -> random.Random:
+        rng = self._streams.get(name)
+        if rng is None:
+            # 用哈希派生子种子（内置 hash() 对字符串每次启动都不同，不能用）
+            digest = hashlib.sha256(f"{self.seed}:{name}".encode("utf-8")).digest()
+            rng = random.Random(int.from_bytes(digest[:8], "big"))
+            self._streams[name] = rng
+        return rng
@@ -0,0 +1,116 @@
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+from config import PROFILE_DIR, PROFILER_SAMPLE_SECONDS, PROFILER_SAMPLE_INTERVAL
+
+
+class SamplingProfiler:
+    """按需采样分析器：后台线程定时读取目标线程的调用栈，结束后写成 collapsed stacks 文件
+
+    输出每行为 "根帧;...;叶帧 次数"，可直接交给 flamegraph.pl / speedscope 生成火焰图。
+    采样只在后台线程里读取 sys._current_frames()，不修改目标线程，游戏照常运行。
+    采样期间临时调小解释器的线程切换间隔：否则采样线程要等主线程主动释放GIL（多在 clock.tick 等待时）
+    才能运行，样本会集中在空闲处，看不到真正耗时的Python代码。
+    """
+
+    SWITCH_INTERVAL = 0.0001  # 采样期间的线程切换间隔（秒）
+
+    def __init__(self, duration: float = PROFILER_SAMPLE_SECONDS, interval: float = PROFILER_SAMPLE_INTERVAL):
+        self.duration = duration
+        self.interval = interval
+        self._thread = None
+        self._labels = {}  # 代码对象 -> 帧标签，避免每次采样重复拼字符串
+        self._root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, thread_id: int | None = None, path: str | None = None) -> bool:
+        """开始采样（默认采样调用方所在线程），duration 秒后自动保存；正在采样时忽略"""
+        if self.running:
+            print("❌ 采样进行中，请等待本次采样结束")
+            return False
+        if thread_id is None:
+            thread_id = threading.get_ident()
+        if path is None:
+            path = os.path.join(PROFILE_DIR, f"samples_{datetime.now().strftime('%Y%m%d_%H%M%S')}.folded")
+        self._thread = threading.Thread(target=self._run, args=(thread_id, path), name="sampling-profiler",
+                                        daemon=True)
+        self._thread.start()
+        print(f"✅ 开始采样 {self.duration:.0f} 秒（间隔 {self.interval * 1000:.0f}ms）")
+        return True
+
+    def join(self, timeout: float | None = None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = code.co_filename
+            if filename.startswith(self._root):
+                filename = os.path.relpath(filename, self._root)
+            label = self._labels[code] = f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+        return label
+
+    def _sample(self, thread_id: int, stacks: Counter) -> bool:
+        frame = sys._current_frames().get(thread_id)
+        if frame is None:
+            return False
+        labels = []
+        while frame is not None:
+            labels.append(self._label(frame.f_code))
+            frame = frame.f_back
+        labels.reverse()
+        stacks[";".join(labels)] += 1
+        return True
+
+    def _run(self, thread_id: int, path: str):
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(switch_interval, self.SWITCH_INTERVAL))
+        try:
+            stacks, samples = self._collect(thread_id)
+        finally:
+            sys.setswitchinterval(switch_interval)
+        self._save(path, stacks, samples)
+
+    def _collect(self, thread_id: int):
+        stacks = Counter()
+        samples = 0
+        rng = random.Random()
+        deadline = time.perf_counter() + self.duration
+        next_sample = time.perf_counter()
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            if now < next_sample:
+                time.sleep(next_sample - now)
+            if not self._sample(thread_id, stacks):
+                break  # 目标线程已退出
+            samples += 1
+            # 间隔加随机抖动，避免与固定周期的主循环同相位（总采到同一阶段）；落后太多时不补采
+            next_sample = max(next_sample + self.interval * rng.uniform(0.5, 1.5), time.perf_counter())
+        return stacks, samples
+
+    def _save(self, path: str, stacks: Counter, samples: int):
+        if not samples:
+            print("❌ 没有采到样本")
+            return
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                for stack, count in stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+        except OSError as e:
+            print(f"❌ 采样结果保存失败：{e}")
+            return
+        print(f"✅ 采样结果已保存：{path}（{samples} 个样本，{len(stacks)} 种调用栈）")
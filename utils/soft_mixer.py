@@ -0,0 +1,159 @@
+import numpy
+import pygame
+
+from config import SOFT_MIXER_BLOCK_SIZE
+
+
+class MixerVoice:
+    """软件混音器中的一个声源句柄，接口与 pygame.mixer.Channel 的常用方法一致"""
+    __slots__ = ("mixer", "slot", "generation")
+
+    def __init__(self, mixer, slot: int, generation: int):
+        self.mixer = mixer
+        self.slot = slot
+        self.generation = generation
+
+    def _alive(self) -> bool:
+        return self.mixer.generations[self.slot] == self.generation and self.mixer.active[self.slot]
+
+    def set_volume(self, left: float, right: float = None):
+        if self._alive():
+            self.mixer.gains[self.slot, 0] = left
+            self.mixer.gains[self.slot, 1] = left if right is None else right
+
+    def stop(self):
+        if self._alive():
+            self.mixer.release(self.slot)
+
+    def pause(self):
+        if self._alive():
+            self.mixer.paused[self.slot] = True
+
+    def unpause(self):
+        if self._alive():
+            self.mixer.paused[self.slot] = False
+
+    def get_busy(self) -> bool:
+        return self._alive()
+
+
+class SoftMixer:
+    """把所有声源（含各自的声像/增益）混成一个立体声数据块，排队到单个通道上流式播放
+
+    block_size 越小延迟越低，但每秒需要混音和排队的次数越多。
+    """
+
+    def __init__(self, channel: pygame.mixer.Channel, block_size: int = SOFT_MIXER_BLOCK_SIZE, capacity: int = 16):
+        self.channel = channel
+        self.block_size = block_size
+        self._block_offsets = numpy.arange(block_size, dtype=numpy.int64)
+
+        # 采样库：所有用到的音效拼成一个 (总帧数, 2) 的float32数组
+        self._bank = numpy.zeros((0, 2), dtype=numpy.float32)
+        self._clips = {}  # {id(Sound): (起始帧, 帧数, Sound)}
+
+        self.capacity = 0
+        self.active = numpy.zeros(0, dtype=bool)
+        self.paused = numpy.zeros(0, dtype=bool)
+        self.looping = numpy.zeros(0, dtype=bool)
+        self.offsets = numpy.zeros(0, dtype=numpy.int64)
+        self.lengths = numpy.ones(0, dtype=numpy.int64)
+        self.cursors = numpy.zeros(0, dtype=numpy.int64)
+        self.gains = numpy.zeros((0, 2), dtype=numpy.float32)
+        self.generations = numpy.zeros(0, dtype=numpy.int64)
+        self._free_slots = []
+        self._grow(capacity)
+
+        self.blocks_rendered = 0
+
+    # -------------------------- 声源管理 --------------------------
+    def _grow(self, capacity: int):
+        extra = capacity - self.capacity
+        self.active = numpy.concatenate([self.active, numpy.zeros(extra, dtype=bool)])
+        self.paused = numpy.concatenate([self.paused, numpy.zeros(extra, dtype=bool)])
+        self.looping = numpy.concatenate([self.looping, numpy.zeros(extra, dtype=bool)])
+        self.offsets = numpy.concatenate([self.offsets, numpy.zeros(extra, dtype=numpy.int64)])
+        self.lengths = numpy.concatenate([self.lengths, numpy.ones(extra, dtype=numpy.int64)])
+        self.cursors = numpy.concatenate([self.cursors, numpy.zeros(extra, dtype=numpy.int64)])
+        self.gains = numpy.concatenate([self.gains, numpy.zeros((extra, 2), dtype=numpy.float32)])
+        self.generations = numpy.concatenate([self.generations, numpy.zeros(extra, dtype=numpy.int64)])
+        # 倒序压栈，优先复用低位槽
+        self._free_slots.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    def _clip_for(self, sound: pygame.mixer.Sound):
+        clip = self._clips.get(id(sound))
+        if clip is None:
+            samples = pygame.sndarray.array(sound).astype(numpy.float32)
+            if samples.ndim == 1:
+                samples = numpy.repeat(samples[:, None], 2, axis=1)
+            clip = (len(self._bank), max(1, len(samples)), sound)
+            self._bank = numpy.concatenate([self._bank, samples[:, :2]])
+            self._clips[id(sound)] = clip
+        return clip
+
+    def play(self, sound: pygame.mixer.Sound, category=None, key=None, loops: int = 0) -> MixerVoice:
+        """添加声源，loops=-1 为循环播放（与 Channel.play 参数一致）"""
+        offset, length, _ = self._clip_for(sound)
+        if not self._free_slots:
+            self._grow(self.capacity * 2)
+        slot = self._free_slots.pop()
+        self.active[slot] = True
+        self.paused[slot] = False
+        self.looping[slot] = loops != 0
+        self.offsets[slot] = offset
+        self.lengths[slot] = length
+        self.cursors[slot] = 0
+        self.gains[slot] = (1.0, 1.0)
+        self.generations[slot] += 1
+        return MixerVoice(self, slot, int(self.generations[slot]))
+
+    def release(self, slot: int):
+        if self.active[slot]:
+            self.active[slot] = False
+            self._free_slots.append(slot)
+
+    # -------------------------- 混音 --------------------------
+    def render_block(self) -> numpy.ndarray:
+        """一次向量化混合所有活动声源，返回 (block_size, 2) 的int16数据块"""
+        playing = numpy.flatnonzero(self.active & ~self.paused)
+        if playing.size == 0:
+            return numpy.zeros((self.block_size, 2), dtype=numpy.int16)
+
+        lengths = self.lengths[playing]
+        positions = self.cursors[playing, None] + self._block_offsets[None, :]
+        looping = self.looping[playing]
+        valid = looping[:, None] | (positions < lengths[:, None])
+        positions = numpy.where(looping[:, None], positions % lengths[:, None],
+                                numpy.minimum(positions, lengths[:, None] - 1))
+
+        samples = self._bank[self.offsets[playing, None] + positions]  # (声源数, 块长, 2)
+        weights = self.gains[playing][:, None, :] * valid[:, :, None]
+        mixed = (samples * weights).sum(axis=0)
+
+        # 推进播放位置，单次声源播完后释放
+        cursors = self.cursors[playing] + self.block_size
+        self.cursors[playing] = numpy.where(looping, cursors % lengths, cursors)
+        for slot in playing[~looping & (cursors >= lengths)].tolist():
+            self.release(slot)
+
+        self.blocks_rendered += 1
+        return numpy.clip(mixed, -32768, 32767).astype(numpy.int16)
+
+    def queued_blocks(self) -> int:
+        """当前已交给通道但尚未播完的数据块数量（播放中 + 排队中）"""
+        return int(self.channel.get_busy()) + int(self.channel.get_queue() is not None)
+
+    def pump(self):
+        """每帧调用：保持通道上有一个播放中的块和一个排队块"""
+        if not self.active.any():
+            return
+        if not self.channel.get_busy():
+            self.channel.play(pygame.mixer.Sound(buffer=self.render_block()))
+        if self.channel.get_queue() is None:
+            self.channel.queue(pygame.mixer.Sound(buffer=self.render_block()))
+
+    def stop_all(self):
+        for slot in numpy.flatnonzero(self.active).tolist():
+            self.release(slot)
+        self.channel.stop()
@@ -0,0 +1,130 @@
+import hashlib
+import json
+import os
+
+import numpy
+
+from config import SOUND_CACHE_DIR, SOUND_CACHE_MAX_BYTES
+from utils.sound_synth import SYNTH_VERSION
+
+CACHE_SUFFIX = ".pcm"
+
+
+class SoundCache:
+    """按合成参数寻址的音效磁盘缓存（原始int16 PCM文件 + 内存映射读取 + LRU淘汰）"""
+
+    def __init__(self, cache_dir: str = SOUND_CACHE_DIR, max_bytes: int = SOUND_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.enabled = self._init_cache_dir()
+
+    def _init_cache_dir(self) -> bool:
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            return True
+        except OSError as e:
+            print(f"❌ 创建音效缓存目录失败，将直接合成：{e}")
+            return False
+
+    @staticmethod
+    def make_key(kind: str, params: dict) -> str:
+        """参数（含合成算法版本）任意变化都会得到新的键，旧条目随LRU自然淘汰"""
+        payload = json.dumps({"kind": kind, "version": SYNTH_VERSION, "params": params},
+                             sort_keys=True, ensure_ascii=True)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + CACHE_SUFFIX)
+
+    def load(self, key: str):
+        """命中时返回只读内存映射的int16数组，未命中返回None"""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            size = os.path.getsize(path)
+            # 刷新修改时间作为最近使用时间（LRU依据）
+            os.utime(path)
+        except OSError:
+            return None
+        if size == 0:
+            return numpy.zeros(0, dtype=numpy.int16)
+        try:
+            return numpy.memmap(path, dtype="<i2", mode="r")
+        except (OSError, ValueError) as e:
+            print(f"❌ 读取音效缓存失败：{e}")
+            return None
+
+    def store(self, key: str, samples: numpy.ndarray):
+        """先写临时文件再原子替换，避免中断时留下残缺缓存"""
+        if not self.enabled:
+            return
+        path = self._path(key)
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(numpy.ascontiguousarray(samples, dtype="<i2").tobytes())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"❌ 写入音效缓存失败：{e}")
+            return
+        self.evict()
+
+    def get_or_synth(self, kind: str, params: dict, synth) -> numpy.ndarray:
+        """命中则直接映射读取，否则调用 synth(**params) 合成并写入缓存"""
+        key = self.make_key(kind, params)
+        samples = self.load(key)
+        if samples is not None:
+            self.hits += 1
+            return samples
+        self.misses += 1
+        samples = synth(**params)
+        self.store(key, samples)
+        return samples
+
+    def invalidate(self, kind: str, params: dict):
+        """删除指定参数对应的缓存条目"""
+        try:
+            os.remove(self._path(self.make_key(kind, params)))
+        except OSError:
+            pass
+
+    def _entries(self):
+        entries = []
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return entries
+        for name in names:
+            if not name.endswith(CACHE_SUFFIX):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self):
+        """总大小超过上限时，从最久未使用的条目开始删除"""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                # 文件仍被映射占用（Windows）时跳过，下次再淘汰
+                continue
+
+    def clear(self):
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                continue
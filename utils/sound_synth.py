@@ -0,0 +1,55 @@
+import numpy
+import pygame
+
+from config import MIXER_FREQUENCY
+
+SAMPLE_RATE = MIXER_FREQUENCY  # 原始采样按混音器频率解释，两者必须一致
+SYNTH_VERSION = 1  # 合成算法变更时递增，使旧的音效缓存失效
+WAVE_TYPES = ("square", "sawtooth", "sine")
+
+
+def _time_axis(duration: float, sample_rate: int = SAMPLE_RATE) -> numpy.ndarray:
+    """生成采样时间轴（与逐采样循环的 i / sample_rate 完全一致）"""
+    num_samples = int(sample_rate * duration)
+    return numpy.arange(num_samples, dtype=numpy.float64) / sample_rate
+
+
+def synth_wave(freq_start, freq_end, duration, volume=0.5, wave_type="square",
+               sample_rate: int = SAMPLE_RATE) -> numpy.ndarray:
+    """整段合成扫频波形+线性衰减包络，返回int16数组（无逐采样Python循环）"""
+    t = _time_axis(duration, sample_rate)
+    freq = freq_start + (freq_end - freq_start) * (t / duration)
+    phase = freq * t
+
+    if wave_type == "square":
+        wave = numpy.where(numpy.sin(2 * numpy.pi * phase) > 0, 32767.0, -32768.0)
+    elif wave_type == "sawtooth":
+        wave = numpy.trunc(32767 * (2 * (phase - numpy.floor(phase + 0.5))))
+    elif wave_type == "sine":
+        wave = numpy.trunc(32767 * numpy.sin(2 * numpy.pi * phase))
+    else:
+        wave = numpy.zeros_like(t)
+
+    decay = 1.0 - (t / duration)
+    return numpy.trunc(wave * volume * decay).astype(numpy.int16)
+
+
+def synth_mixed_sines(freqs, duration, gain=0.2, sample_rate: int = SAMPLE_RATE) -> numpy.ndarray:
+    """多个正弦波叠加+线性衰减（玩家受击音效）"""
+    t = _time_axis(duration, sample_rate)
+    mixed = numpy.zeros_like(t)
+    for freq in freqs:
+        mixed += numpy.sin(2 * numpy.pi * freq * t)
+    value = numpy.trunc(32767 * mixed * gain)
+    decay = 1.0 - (t / duration)
+    return numpy.trunc(value * decay).astype(numpy.int16)
+
+
+def concat_waves(*waves: numpy.ndarray) -> numpy.ndarray:
+    """首尾拼接多段采样（替代 sndarray 往返转换）"""
+    return numpy.concatenate(waves).astype(numpy.int16, copy=False)
+
+
+def to_sound(samples: numpy.ndarray) -> pygame.mixer.Sound:
+    """将int16采样直接交给混音器"""
+    return pygame.mixer.Sound(buffer=numpy.ascontiguousarray(samples, dtype=numpy.int16))
@@ -0,0 +1,48 @@
+import pygame
+
+
+class SpriteAtlas:
+    """预渲染的实体精灵：圆形（敌人本体/子弹）和血量条，按外观参数缓存，绘制时只需 blit
+
+    每种外观第一次用到时渲染一次（转换成与屏幕一致的像素格式），之后每帧直接复用；
+    圆形精灵与 pygame.draw.circle 在同一位置画出的像素完全一致，左上角 = 圆心 - 半径。
+    """
+
+    def __init__(self, bar_width: int = 100, bar_height: int = 4, bar_background=(0, 0, 0)):
+        self.bar_width = bar_width
+        self.bar_height = bar_height
+        self.bar_background = bar_background
+        self._discs = {}  # (颜色, 半径) -> Surface
+        self._bars = {}  # (填充宽度, 颜色) -> Surface
+
+    @staticmethod
+    def _convert(surface: pygame.Surface, alpha: bool) -> pygame.Surface:
+        # 无显示窗口（如无界面对局）时不能转换像素格式，直接使用原Surface
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    def disc(self, color, radius: int) -> pygame.Surface:
+        key = (tuple(color), radius)
+        surface = self._discs.get(key)
+        if surface is None:
+            surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surface, color, (radius, radius), radius)
+            surface = self._discs[key] = self._convert(surface, alpha=True)
+        return surface
+
+    def health_bar(self, fill_width: int, color) -> pygame.Surface:
+        """背景条 + 左侧 fill_width 像素的彩色血量"""
+        key = (fill_width, tuple(color))
+        surface = self._bars.get(key)
+        if surface is None:
+            surface = pygame.Surface((self.bar_width, self.bar_height))
+            surface.fill(self.bar_background)
+            if fill_width > 0:
+                surface.fill(color, (0, 0, fill_width, self.bar_height))
+            surface = self._bars[key] = self._convert(surface, alpha=False)
+        return surface
+
+    def clear(self):
+        self._discs.clear()
+        self._bars.clear()
@@ -0,0 +1,48 @@
+from collections import OrderedDict
+
+import pygame
+
+from config import TEXT_CACHE_MAX_ENTRIES
+
+
+class TextCache:
+    """文字渲染结果的LRU缓存：按 (字体, 文本, 颜色, 抗锯齿) 复用 font.render 生成的Surface
+
+    中文字形光栅化开销大，静态标签只渲染一次，动态数字只在数值变化时重新渲染。
+    返回的Surface由缓存共享，调用方只能 blit，不要在上面绘制或修改透明度。
+    """
+
+    def __init__(self, max_entries: int = TEXT_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool, color) -> pygame.Surface:
+        """参数顺序与 font.render 一致"""
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = self._surfaces[key] = font.render(text, antialias, color)
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0
+        }